@@ -0,0 +1,6 @@
+"""Benchmarks of the framework overhead of crews, flows, memory and events.
+
+The benchmarks run against fake LLMs and embedders, so they measure the time
+spent in crewAI itself rather than in providers. Run them with
+``python -m benchmarks``; see ``benchmarks/README.md``.
+"""
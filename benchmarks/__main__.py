@@ -0,0 +1,90 @@
+"""Run the benchmarks: ``python -m benchmarks --help``."""
+
+import argparse
+import os
+import sys
+import tempfile
+
+# Set before crewAI is imported: keep storage out of the user's data directory
+# and keep telemetry and live console trees out of the measurements
+os.environ.setdefault("CREWAI_STORAGE_DIR", tempfile.mkdtemp(prefix="crewai-bench-"))
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("CREWAI_HEADLESS", "true")
+
+from benchmarks.harness import (  # noqa: E402
+    compare,
+    format_header,
+    format_result,
+    load_benchmarks,
+    load_run,
+    registered_benchmarks,
+    run_benchmarks,
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure the framework overhead of crewAI with fake LLMs.",
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        action="append",
+        default=[],
+        help="Only run cases whose name contains this text; can be repeated",
+    )
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument(
+        "--quick", action="store_true", help="Run small cases, as a smoke test"
+    )
+    parser.add_argument("-o", "--output", help="Write the results as JSON to this file")
+    parser.add_argument(
+        "--compare", metavar="BASELINE", help="JSON results of an earlier run"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.1,
+        help="Slowdown of the median allowed by --compare, 0.1 for 10%%",
+    )
+    parser.add_argument("--list", action="store_true", help="List the cases and exit")
+    args = parser.parse_args(argv)
+    load_benchmarks()
+
+    if args.list:
+        for registered in registered_benchmarks():
+            for case in registered.cases(quick=args.quick):
+                print(case.name)
+        return 0
+
+    run = run_benchmarks(
+        selected=args.filter,
+        iterations=args.iterations,
+        warmup=args.warmup,
+        quick=args.quick,
+        on_result=lambda result: print(f"done: {result.name}", file=sys.stderr),
+    )
+    # Printed at the end, flows write their own panels to the console as they run
+    print(format_header())
+    for result in run.results:
+        print(format_result(result))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(run.model_dump_json(indent=2))
+
+    if args.compare:
+        regressions = compare(load_run(args.compare), run, args.max_regression)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.max_regression:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nNo regression above {args.max_regression:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Crew kickoff, kickoff_for_each and tool-heavy agent loops."""
+
+import asyncio
+import json
+
+from crewai import Agent, Crew, Task
+from crewai.tools import BaseTool
+
+from benchmarks.fakes import FINAL_ANSWER, TOOL_CALL, FakeLLM
+from benchmarks.harness import Workload, benchmark
+
+
+class AddTool(BaseTool):
+    name: str = "add"
+    description: str = "Add two integers a and b."
+
+    def _run(self, a: int, b: int) -> int:
+        return a + b
+
+
+def make_crew(llm: FakeLLM, tasks: int = 1, **agent_kwargs) -> Crew:
+    agent = Agent(
+        role="Researcher",
+        goal="Answer {topic} questions",
+        backstory="You research {topic}.",
+        llm=llm,
+        **agent_kwargs,
+    )
+    return Crew(
+        agents=[agent],
+        tasks=[
+            Task(
+                description=f"Research question {i} about {{topic}}",
+                expected_output="A short answer",
+                agent=agent,
+            )
+            for i in range(tasks)
+        ],
+    )
+
+
+@benchmark("crew.kickoff", params={"tasks": [1, 4, 16]}, quick={"tasks": [1]})
+def kickoff(tasks: int) -> Workload:
+    crew = make_crew(FakeLLM(), tasks=tasks)
+    return Workload(lambda: crew.kickoff(inputs={"topic": "AI"}), ops=tasks)
+
+
+@benchmark(
+    "crew.kickoff_for_each",
+    params={"inputs": [1, 8, 32], "mode": ["sync", "async"], "latency": [0.0, 0.01]},
+    quick={"inputs": [2], "mode": ["sync", "async"], "latency": [0.0]},
+)
+def kickoff_for_each(inputs: int, mode: str, latency: float) -> Workload:
+    crew = make_crew(FakeLLM(latency=latency))
+    topics = [{"topic": f"topic {i}"} for i in range(inputs)]
+
+    if mode == "async":
+        return Workload(
+            lambda: asyncio.run(crew.kickoff_for_each_async(inputs=topics)),
+            ops=inputs,
+        )
+    return Workload(lambda: crew.kickoff_for_each(inputs=topics), ops=inputs)
+
+
+@benchmark(
+    "agent.tool_loop", params={"tool_calls": [1, 10, 25]}, quick={"tool_calls": [2]}
+)
+def tool_loop(tool_calls: int) -> Workload:
+    # Distinct inputs keep the tool cache from answering the calls
+    script = [
+        TOOL_CALL.format(tool="add", input=json.dumps({"a": i, "b": 1}))
+        for i in range(tool_calls)
+    ] + [FINAL_ANSWER.format(answer="done")]
+    crew = make_crew(
+        FakeLLM(script=script), tools=[AddTool()], max_iter=tool_calls + 5
+    )
+    return Workload(lambda: crew.kickoff(inputs={"topic": "AI"}), ops=tool_calls)
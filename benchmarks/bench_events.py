@@ -0,0 +1,37 @@
+"""Throughput of the event bus."""
+
+from contextlib import ExitStack
+
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+from crewai.utilities.events.llm_events import LLMStreamChunkEvent
+
+from benchmarks.harness import Workload, benchmark
+
+EVENTS = 10_000
+
+
+@benchmark(
+    "events.emit",
+    params={"handlers": [0, 1, 10], "scope": ["global", "run"]},
+    quick={"handlers": [1], "scope": ["global", "run"]},
+)
+def emit(handlers: int, scope: str) -> Workload:
+    stack = ExitStack()
+    # Only the benchmark's handlers run, not the console listener's
+    stack.enter_context(crewai_event_bus.scoped_handlers())
+    bus = (
+        stack.enter_context(crewai_event_bus.run_scope())
+        if scope == "run"
+        else crewai_event_bus
+    )
+    received = []
+    for _ in range(handlers):
+        bus.on(LLMStreamChunkEvent)(lambda source, event: received.append(event))
+
+    def run() -> None:
+        # Events are created as they are by streaming LLMs, one per chunk
+        for _ in range(EVENTS):
+            crewai_event_bus.emit(None, LLMStreamChunkEvent(chunk="token"))
+        received.clear()
+
+    return Workload(run, ops=EVENTS, cleanup=stack.close)
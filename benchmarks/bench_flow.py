@@ -0,0 +1,45 @@
+"""Flows whose start method fans out to many listeners."""
+
+from typing import Callable, Type
+
+from crewai.flow.flow import Flow, and_, listen, start
+
+from benchmarks.harness import Workload, benchmark
+
+
+def _branch() -> Callable[[Flow], int]:
+    # Each listener needs its own function, the decorators mark it in place
+    def branch(self) -> int:
+        return 1
+
+    return branch
+
+
+def make_fan_out_flow(listeners: int, executor: str) -> Type[Flow]:
+    """Build a flow whose listeners all follow `begin` and feed into `join`."""
+
+    def begin(self) -> int:
+        return 0
+
+    def join(self) -> str:
+        return "done"
+
+    names = [f"branch_{i}" for i in range(listeners)]
+    namespace = {
+        "method_executor": executor,
+        "begin": start()(begin),
+        "join": listen(and_(*names))(join),
+    }
+    for name in names:
+        namespace[name] = listen("begin")(_branch())
+    return type(f"FanOut{listeners}", (Flow,), namespace)
+
+
+@benchmark(
+    "flow.fan_out",
+    params={"listeners": [1, 10, 50], "executor": ["thread", "inline"]},
+    quick={"listeners": [2], "executor": ["thread", "inline"]},
+)
+def fan_out(listeners: int, executor: str) -> Workload:
+    flow_class = make_fan_out_flow(listeners, executor)
+    return Workload(lambda: flow_class().kickoff(), ops=listeners)
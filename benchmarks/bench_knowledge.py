@@ -0,0 +1,51 @@
+"""Ingesting and querying knowledge at different corpus sizes."""
+
+import itertools
+
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+
+from benchmarks.corpus import document, sentences
+from benchmarks.fakes import fake_embedder_config
+from benchmarks.harness import Workload, benchmark
+
+DOCUMENT_SIZE = 2000
+
+
+def make_knowledge(name: str, documents: int) -> Knowledge:
+    return Knowledge(
+        collection_name=name,
+        sources=[
+            StringKnowledgeSource(content=document(i, DOCUMENT_SIZE))
+            for i in range(documents)
+        ],
+        embedder=fake_embedder_config(),
+    )
+
+
+@benchmark(
+    "knowledge.ingest", params={"documents": [10, 100, 1000]}, quick={"documents": [5]}
+)
+def ingest(documents: int) -> Workload:
+    counter = itertools.count()
+
+    def run() -> None:
+        # A new collection per iteration, so every iteration ingests from scratch
+        make_knowledge(f"ingest_{documents}_{next(counter)}", documents).add_sources()
+
+    return Workload(run, ops=documents)
+
+
+@benchmark(
+    "knowledge.query", params={"documents": [100, 1000]}, quick={"documents": [5]}
+)
+def query(documents: int) -> Workload:
+    knowledge = make_knowledge(f"query_{documents}", documents)
+    knowledge.add_sources()
+    queries = sentences(10, offset=documents * 1000)
+
+    def run() -> None:
+        for text in queries:
+            knowledge.query([text], results_limit=3, score_threshold=0.0)
+
+    return Workload(run, ops=len(queries))
@@ -0,0 +1,42 @@
+"""Saving to and searching the short-term memory."""
+
+import itertools
+import tempfile
+
+from crewai.memory.short_term.short_term_memory import ShortTermMemory
+
+from benchmarks.corpus import sentences
+from benchmarks.fakes import fake_embedder_config
+from benchmarks.harness import Workload, benchmark
+
+
+def make_memory() -> ShortTermMemory:
+    return ShortTermMemory(
+        embedder_config=fake_embedder_config(), path=tempfile.mkdtemp()
+    )
+
+
+@benchmark("memory.save", params={"items": [10, 100]}, quick={"items": [5]})
+def save(items: int) -> Workload:
+    memory = make_memory()
+    counter = itertools.count()
+
+    def run() -> None:
+        for text in sentences(items, offset=next(counter) * items):
+            memory.save(text, metadata={"source": "benchmark"}, agent="Researcher")
+
+    return Workload(run, ops=items)
+
+
+@benchmark("memory.search", params={"stored": [100, 1000]}, quick={"stored": [20]})
+def search(stored: int) -> Workload:
+    memory = make_memory()
+    for text in sentences(stored):
+        memory.save(text, agent="Researcher")
+    queries = sentences(10, offset=stored)
+
+    def run() -> None:
+        for query in queries:
+            memory.search(query, limit=3, score_threshold=0.0)
+
+    return Workload(run, ops=len(queries))
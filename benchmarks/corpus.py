@@ -0,0 +1,33 @@
+"""Deterministic text used as memories, knowledge and queries."""
+
+import random
+from typing import List
+
+_WORDS = (
+    "agent crew task tool memory knowledge flow event model prompt answer "
+    "research analysis report market product customer revenue growth risk "
+    "strategy data source summary insight trend forecast budget plan review"
+).split()
+
+
+def sentences(count: int, offset: int = 0, words: int = 16) -> List[str]:
+    """Return ``count`` distinct sentences; equal arguments give equal text."""
+    result = []
+    for index in range(offset, offset + count):
+        rng = random.Random(index)
+        body = " ".join(rng.choice(_WORDS) for _ in range(words))
+        result.append(f"Note {index}: {body}.")
+    return result
+
+
+def document(index: int, size: int) -> str:
+    """Return a document of about ``size`` characters."""
+    text = []
+    length = 0
+    offset = index * 1000
+    while length < size:
+        sentence = sentences(1, offset=offset)[0]
+        text.append(sentence)
+        length += len(sentence) + 1
+        offset += 1
+    return " ".join(text)[:size]
@@ -0,0 +1,142 @@
+"""Fake LLMs and embedders that stand in for providers in benchmarks."""
+
+import hashlib
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from chromadb import Documents, EmbeddingFunction, Embeddings
+from litellm.types.utils import Usage
+
+from crewai.llms.base_llm import BaseLLM
+
+FINAL_ANSWER = "Thought: I now know the final answer\nFinal Answer: {answer}"
+TOOL_CALL = "Thought: I should use a tool\nAction: {tool}\nAction Input: {input}"
+
+
+class FakeLLM(BaseLLM):
+    """A scripted LLM that injects latency and reports token usage.
+
+    The response to a request is picked by how many assistant messages the
+    conversation already holds, so the n-th turn of every agent loop gets the
+    n-th scripted response. The script is stateless across conversations,
+    which keeps it deterministic when crews are copied or run concurrently.
+
+    Args:
+        script: Responses for each turn of a conversation. A response can be
+            a string or a callable receiving the messages. The last response
+            is repeated once the script runs out.
+        latency: Seconds to sleep before answering, to stand in for the
+            provider's response time.
+        tokens_per_char: Tokens reported per character of the prompt and of
+            the response.
+        model: Model name reported to crewAI.
+    """
+
+    def __init__(
+        self,
+        script: Optional[Sequence[Union[str, Callable[[Any], str]]]] = None,
+        latency: float = 0.0,
+        tokens_per_char: float = 0.25,
+        model: str = "fake-model",
+    ) -> None:
+        super().__init__(model=model)
+        self.script = list(script or [FINAL_ANSWER.format(answer="done")])
+        self.latency = latency
+        self.tokens_per_char = tokens_per_char
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> str:
+        started_at = time.time()
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        if self.latency:
+            time.sleep(self.latency)
+
+        turn = sum(1 for message in messages if message.get("role") == "assistant")
+        response = self.script[min(turn, len(self.script) - 1)]
+        if callable(response):
+            response = response(messages)
+
+        with self._lock:
+            self.calls += 1
+        self._report_usage(messages, response, callbacks, started_at)
+        return response
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def _report_usage(
+        self,
+        messages: List[Dict[str, str]],
+        response: str,
+        callbacks: Optional[List[Any]],
+        started_at: float,
+    ) -> None:
+        prompt_chars = sum(len(str(message.get("content", ""))) for message in messages)
+        prompt_tokens = math.ceil(prompt_chars * self.tokens_per_char)
+        completion_tokens = math.ceil(len(response) * self.tokens_per_char)
+        usage = Usage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
+        # Agents count tokens with litellm callbacks, as with real providers
+        for callback in callbacks or []:
+            if hasattr(callback, "log_success_event"):
+                callback.log_success_event(
+                    kwargs={"model": self.model},
+                    response_obj={"usage": usage},
+                    start_time=started_at,
+                    end_time=time.time(),
+                )
+
+
+class FakeEmbeddingFunction(EmbeddingFunction):
+    """Deterministic embeddings derived from a hash of each document.
+
+    Args:
+        dimensions: Size of the embedding vectors.
+        latency: Seconds to sleep per batch of documents.
+    """
+
+    def __init__(self, dimensions: int = 384, latency: float = 0.0) -> None:
+        self.dimensions = dimensions
+        self.latency = latency
+
+    def __call__(self, input: Documents) -> Embeddings:
+        if self.latency:
+            time.sleep(self.latency)
+        return [self._embed(document) for document in input]
+
+    def _embed(self, document: str) -> List[float]:
+        vector: List[float] = []
+        seed = document.encode("utf-8")
+        counter = 0
+        while len(vector) < self.dimensions:
+            digest = hashlib.sha256(seed + counter.to_bytes(4, "little")).digest()
+            vector.extend((byte - 127.5) / 127.5 for byte in digest)
+            counter += 1
+        vector = vector[: self.dimensions]
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+
+
+def fake_embedder_config(dimensions: int = 384, latency: float = 0.0) -> Dict[str, Any]:
+    """Embedder configuration for crews, memories and knowledge."""
+    return {
+        "provider": "custom",
+        "config": {
+            "embedder": FakeEmbeddingFunction(dimensions=dimensions, latency=latency)
+        },
+    }
@@ -0,0 +1,252 @@
+"""Registration, timing and reporting of benchmarks."""
+
+import gc
+import importlib
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from pydantic import BaseModel, Field
+
+SCHEMA_VERSION = 1
+
+
+@dataclass
+class Workload:
+    """The timed part of a benchmark, returned by its setup function.
+
+    Args:
+        run: Runs one measured iteration.
+        ops: Operations done by one iteration, such as events emitted or
+            inputs kicked off, used to report throughput.
+        cleanup: Called once after the last iteration.
+    """
+
+    run: Callable[[], Any]
+    ops: int = 1
+    cleanup: Optional[Callable[[], None]] = None
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[..., Workload]
+    params: Dict[str, Sequence[Any]] = field(default_factory=dict)
+    quick_params: Optional[Dict[str, Sequence[Any]]] = None
+
+    def cases(self, quick: bool = False) -> Iterator["Case"]:
+        params = self.quick_params if quick and self.quick_params else self.params
+        names = list(params)
+        for values in itertools.product(*(params[name] for name in names)):
+            yield Case(self, dict(zip(names, values)))
+
+
+@dataclass
+class Case:
+    benchmark: Benchmark
+    params: Dict[str, Any]
+
+    @property
+    def name(self) -> str:
+        if not self.params:
+            return self.benchmark.name
+        args = ",".join(f"{key}={value}" for key, value in self.params.items())
+        return f"{self.benchmark.name}[{args}]"
+
+
+class BenchmarkResult(BaseModel):
+    """Timings of one benchmark case, in seconds per iteration."""
+
+    name: str = Field(description="Benchmark name with its parameters")
+    benchmark: str = Field(description="Benchmark name")
+    params: Dict[str, Any] = Field(default_factory=dict)
+    iterations: int = Field(description="Number of measured iterations")
+    ops: int = Field(description="Operations per iteration")
+    min: float
+    median: float
+    mean: float
+    stdev: float
+    max: float
+    ops_per_second: float = Field(description="Throughput at the median time")
+
+
+class BenchmarkRun(BaseModel):
+    """Results of a benchmark run, as written to the output file."""
+
+    schema_version: int = SCHEMA_VERSION
+    created_at: str
+    environment: Dict[str, Any]
+    results: List[BenchmarkResult]
+
+
+_registry: Dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str,
+    params: Optional[Dict[str, Sequence[Any]]] = None,
+    quick: Optional[Dict[str, Sequence[Any]]] = None,
+) -> Callable[[Callable[..., Workload]], Callable[..., Workload]]:
+    """Register a benchmark.
+
+    The decorated function receives one combination of ``params`` as keyword
+    arguments, does the untimed setup and returns the `Workload` to time.
+
+    Args:
+        name: Dotted name of the benchmark, such as ``crew.kickoff``.
+        params: Values of each parameter; every combination is a case.
+        quick: Smaller parameter values used by quick runs.
+    """
+
+    def decorator(setup: Callable[..., Workload]) -> Callable[..., Workload]:
+        if name in _registry:
+            raise ValueError(f"Benchmark {name!r} is already registered")
+        _registry[name] = Benchmark(name, setup, params or {}, quick)
+        return setup
+
+    return decorator
+
+
+def load_benchmarks() -> None:
+    """Import the ``bench_*`` modules of this package, registering their benchmarks."""
+    package = os.path.dirname(os.path.abspath(__file__))
+    for module in pkgutil.iter_modules([package]):
+        if module.name.startswith("bench_"):
+            importlib.import_module(f"{__package__}.{module.name}")
+
+
+def registered_benchmarks() -> List[Benchmark]:
+    return list(_registry.values())
+
+
+def run_case(case: Case, iterations: int, warmup: int = 1) -> BenchmarkResult:
+    """Time the iterations of one case after the warmup iterations."""
+    workload = case.benchmark.setup(**case.params)
+    durations: List[float] = []
+    try:
+        for _ in range(warmup):
+            workload.run()
+        for _ in range(iterations):
+            # Collections triggered by earlier iterations would add noise
+            gc.collect()
+            started_at = time.perf_counter()
+            workload.run()
+            durations.append(time.perf_counter() - started_at)
+    finally:
+        if workload.cleanup is not None:
+            workload.cleanup()
+
+    median = statistics.median(durations)
+    return BenchmarkResult(
+        name=case.name,
+        benchmark=case.benchmark.name,
+        params=case.params,
+        iterations=iterations,
+        ops=workload.ops,
+        min=min(durations),
+        median=median,
+        mean=statistics.fmean(durations),
+        stdev=statistics.stdev(durations) if len(durations) > 1 else 0.0,
+        max=max(durations),
+        ops_per_second=workload.ops / median if median else 0.0,
+    )
+
+
+def run_benchmarks(
+    selected: Optional[Sequence[str]] = None,
+    iterations: int = 5,
+    warmup: int = 1,
+    quick: bool = False,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> BenchmarkRun:
+    """Run the registered benchmarks whose name contains one of ``selected``."""
+    results = []
+    for registered in registered_benchmarks():
+        for case in registered.cases(quick=quick):
+            if selected and not any(pattern in case.name for pattern in selected):
+                continue
+            result = run_case(case, iterations=iterations, warmup=warmup)
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return BenchmarkRun(
+        created_at=datetime.now(timezone.utc).isoformat(),
+        environment=environment(),
+        results=results,
+    )
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the machine and revision the benchmarks ran on."""
+    from crewai import __version__
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "crewai_version": __version__,
+        "git_commit": commit,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def format_result(result: BenchmarkResult) -> str:
+    return (
+        f"{result.name:<56}{result.median * 1e3:>12.3f}{result.stdev * 1e3:>12.3f}"
+        f"{result.ops_per_second:>14.1f}"
+    )
+
+
+def format_header() -> str:
+    return f"{'benchmark':<56}{'median ms':>12}{'stdev ms':>12}{'ops/s':>14}"
+
+
+def compare(
+    baseline: BenchmarkRun, current: BenchmarkRun, max_regression: float
+) -> List[str]:
+    """List the cases whose median time grew by more than ``max_regression``.
+
+    Args:
+        baseline: Results of an earlier run.
+        current: Results to check against the baseline.
+        max_regression: Allowed slowdown as a fraction, 0.1 for 10%.
+    """
+    previous = {result.name: result for result in baseline.results}
+    regressions = []
+    for result in current.results:
+        before = previous.get(result.name)
+        if before is None or not before.median:
+            continue
+        change = result.median / before.median - 1
+        if change > max_regression:
+            regressions.append(
+                f"{result.name}: {before.median * 1e3:.3f} ms -> "
+                f"{result.median * 1e3:.3f} ms (+{change:.1%})"
+            )
+    return regressions
+
+
+def load_run(path: str) -> BenchmarkRun:
+    with open(path, encoding="utf-8") as f:
+        return BenchmarkRun.model_validate(json.load(f))
@@ -1,19 +1,21 @@
-import warnings
+import importlib
 import threading
 import urllib.request
+import warnings
+from typing import TYPE_CHECKING, Any, List
 
-from crewai.agent import Agent
-from crewai.crew import Crew
-from crewai.crews.crew_output import CrewOutput
-from crewai.flow.flow import Flow
-from crewai.knowledge.knowledge import Knowledge
-from crewai.llm import LLM
-from crewai.llms.base_llm import BaseLLM
-from crewai.process import Process
-from crewai.task import Task
-from crewai.tasks.llm_guardrail import LLMGuardrail
-from crewai.tasks.task_output import TaskOutput
-from crewai.telemetry.telemetry import Telemetry
+if TYPE_CHECKING:
+    from crewai.agent import Agent
+    from crewai.crew import Crew
+    from crewai.crews.crew_output import CrewOutput
+    from crewai.flow.flow import Flow
+    from crewai.knowledge.knowledge import Knowledge
+    from crewai.llm import LLM
+    from crewai.llms.base_llm import BaseLLM
+    from crewai.process import Process
+    from crewai.task import Task
+    from crewai.tasks.llm_guardrail import LLMGuardrail
+    from crewai.tasks.task_output import TaskOutput
 
 warnings.filterwarnings(
     "ignore",
@@ -22,12 +24,31 @@ warnings.filterwarnings(
     module="pydantic.main",
 )
 
+# The public classes are imported on first access (PEP 562), so that
+# `import crewai` does not load litellm, chromadb or the telemetry exporters
+# for code paths that never use them.
+_LAZY_IMPORTS = {
+    "Agent": "crewai.agent",
+    "Crew": "crewai.crew",
+    "CrewOutput": "crewai.crews.crew_output",
+    "Process": "crewai.process",
+    "Task": "crewai.task",
+    "LLM": "crewai.llm",
+    "BaseLLM": "crewai.llms.base_llm",
+    "Flow": "crewai.flow.flow",
+    "Knowledge": "crewai.knowledge.knowledge",
+    "TaskOutput": "crewai.tasks.task_output",
+    "LLMGuardrail": "crewai.tasks.llm_guardrail",
+}
+
 _telemetry_submitted = False
+_tracking_started = False
 
 
 def _track_install():
     """Track package installation/first-use via Scarf analytics."""
     global _telemetry_submitted
+    from crewai.telemetry.telemetry import Telemetry
 
     if _telemetry_submitted or Telemetry._is_telemetry_disabled():
         return
@@ -46,13 +67,32 @@ def _track_install():
 
 
 def _track_install_async():
-    """Track installation in background thread to avoid blocking imports."""
-    if not Telemetry._is_telemetry_disabled():
-        thread = threading.Thread(target=_track_install, daemon=True)
-        thread.start()
+    """Track first use in a background thread to avoid blocking imports."""
+    global _tracking_started
+    from crewai.telemetry.telemetry import Telemetry
+
+    if _tracking_started or Telemetry._is_telemetry_disabled():
+        return
+    _tracking_started = True
+    thread = threading.Thread(target=_track_install, daemon=True)
+    thread.start()
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache it so later lookups bypass this function
+    globals()[name] = value
+    _track_install_async()
+    return value
+
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-_track_install_async()
 
 __version__ = "0.152.0"
 __all__ = [
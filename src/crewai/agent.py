@@ -1,6 +1,11 @@
+import concurrent.futures
+import contextvars
+import hashlib
 import shutil
 import subprocess
+import threading
 import time
+from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Type, Union
 
 from pydantic import Field, InstanceOf, PrivateAttr, model_validator
@@ -8,7 +13,7 @@ from pydantic import Field, InstanceOf, PrivateAttr, model_validator
 from crewai.agents import CacheHandler
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.crew_agent_executor import CrewAgentExecutor
-from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.knowledge import Knowledge, query_knowledge_batch
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.knowledge.utils.knowledge_utils import extract_knowledge_context
 from crewai.lite_agent import LiteAgent, LiteAgentOutput
@@ -16,6 +21,7 @@ from crewai.llm import BaseLLM
 from crewai.memory.contextual.contextual_memory import ContextualMemory
 from crewai.security import Fingerprint
 from crewai.task import Task
+from crewai.telemetry.tracing import traced
 from crewai.tools import BaseTool
 from crewai.tools.agent_tools.agent_tools import AgentTools
 from crewai.utilities import Converter, Prompts
@@ -46,9 +52,14 @@ from crewai.utilities.events.knowledge_events import (
     KnowledgeSearchQueryFailedEvent,
 )
 from crewai.utilities.llm_utils import create_llm
+from crewai.utilities.profiling import profiled
 from crewai.utilities.token_counter_callback import TokenCalcHandler
 from crewai.utilities.training_handler import CrewTrainingHandler
 
+KNOWLEDGE_QUERY_CACHE_SIZE = 256
+_knowledge_query_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+_knowledge_query_cache_lock = threading.Lock()
+
 
 class Agent(BaseAgent):
     """Represents an agent in a system.
@@ -305,103 +316,12 @@ class Agent(BaseAgent):
                 task=task_prompt, context=context
             )
 
-        if self._is_any_available_memory():
-            crewai_event_bus.emit(
-                self,
-                event=MemoryRetrievalStartedEvent(
-                    task_id=str(task.id) if task else None,
-                    source_type="agent",
-                ),
-            )
-
-            start_time = time.time()
-            contextual_memory = ContextualMemory(
-                self.crew.memory_config,
-                self.crew._short_term_memory,
-                self.crew._long_term_memory,
-                self.crew._entity_memory,
-                self.crew._user_memory,
-                self.crew._external_memory,
-            )
-            memory = contextual_memory.build_context_for_task(task, context)
-            if memory.strip() != "":
-                task_prompt += self.i18n.slice("memory").format(memory=memory)
-
-            crewai_event_bus.emit(
-                self,
-                event=MemoryRetrievalCompletedEvent(
-                    task_id=str(task.id) if task else None,
-                    memory_content=memory,
-                    retrieval_time_ms=(time.time() - start_time) * 1000,
-                    source_type="agent",
-                ),
-            )
-        knowledge_config = (
-            self.knowledge_config.model_dump() if self.knowledge_config else {}
+        memory, knowledge_context = self._prefetch_task_context(
+            task, task_prompt, context
         )
-
-
-        if self.knowledge or (self.crew and self.crew.knowledge):
-            crewai_event_bus.emit(
-                self,
-                event=KnowledgeRetrievalStartedEvent(
-                    agent=self,
-                ),
-            )
-            try:
-                self.knowledge_search_query = self._get_knowledge_search_query(
-                    task_prompt
-                )
-                if self.knowledge_search_query:
-                    # Quering agent specific knowledge
-                    if self.knowledge:
-                        agent_knowledge_snippets = self.knowledge.query(
-                            [self.knowledge_search_query], **knowledge_config
-                        )
-                        if agent_knowledge_snippets:
-                            self.agent_knowledge_context = extract_knowledge_context(
-                                agent_knowledge_snippets
-                            )
-                            if self.agent_knowledge_context:
-                                task_prompt += self.agent_knowledge_context
-
-                    # Quering crew specific knowledge
-                    knowledge_snippets = self.crew.query_knowledge(
-                        [self.knowledge_search_query], **knowledge_config
-                    )
-                    if knowledge_snippets:
-                        self.crew_knowledge_context = extract_knowledge_context(
-                            knowledge_snippets
-                        )
-                        if self.crew_knowledge_context:
-                            task_prompt += self.crew_knowledge_context
-
-                    crewai_event_bus.emit(
-                        self,
-                        event=KnowledgeRetrievalCompletedEvent(
-                            query=self.knowledge_search_query,
-                            agent=self,
-                            retrieved_knowledge=(
-                                (self.agent_knowledge_context or "")
-                                + (
-                                    "\n"
-                                    if self.agent_knowledge_context
-                                    and self.crew_knowledge_context
-                                    else ""
-                                )
-                                + (self.crew_knowledge_context or "")
-                            ),
-                        ),
-                    )
-            except Exception as e:
-                crewai_event_bus.emit(
-                    self,
-                    event=KnowledgeSearchQueryFailedEvent(
-                        query=self.knowledge_search_query or "",
-                        agent=self,
-                        error=str(e),
-                    ),
-                )
+        if memory.strip() != "":
+            task_prompt += self.i18n.slice("memory").format(memory=memory)
+        task_prompt += knowledge_context
 
         tools = tools or self.tools or []
         self.create_agent_executor(tools=tools, task=task)
@@ -503,8 +423,6 @@ class Agent(BaseAgent):
             TimeoutError: If execution exceeds the timeout.
             RuntimeError: If execution fails for other reasons.
         """
-        import concurrent.futures
-
         with concurrent.futures.ThreadPoolExecutor() as executor:
             future = executor.submit(
                 self._execute_without_timeout, task_prompt=task_prompt, task=task
@@ -591,7 +509,9 @@ class Agent(BaseAgent):
         )
 
     def get_delegation_tools(self, agents: List[BaseAgent]):
-        agent_tools = AgentTools(agents=agents)
+        agent_tools = AgentTools(
+            agents=agents, parallel_delegation=self.allow_parallel_delegation
+        )
         tools = agent_tools.tools()
         return tools
 
@@ -726,6 +646,198 @@ class Agent(BaseAgent):
     def set_fingerprint(self, fingerprint: Fingerprint):
         self.security_config.fingerprint = fingerprint
 
+    def _prefetch_task_context(
+        self, task: Task, task_prompt: str, context: Optional[str]
+    ) -> Tuple[str, str]:
+        """Retrieve memory and knowledge context for a task.
+
+        Memory retrieval and the knowledge pipeline (query rewrite followed by
+        the knowledge searches) do not depend on each other, so when both are
+        enabled they run concurrently instead of back to back.
+
+        Args:
+            task: Task being executed.
+            task_prompt: Task prompt used to build the knowledge search query.
+            context: Context to execute the task in.
+
+        Returns:
+            A tuple with the memory context and the knowledge context to
+            append to the task prompt.
+        """
+        use_memory = self._is_any_available_memory()
+        use_knowledge = bool(self.knowledge or (self.crew and self.crew.knowledge))
+
+        if use_memory and use_knowledge:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                memory_future = executor.submit(
+                    contextvars.copy_context().run,
+                    self._retrieve_memory_context,
+                    task,
+                    context,
+                )
+                knowledge_future = executor.submit(
+                    contextvars.copy_context().run,
+                    self._retrieve_knowledge_context,
+                    task_prompt,
+                )
+                return memory_future.result(), knowledge_future.result()
+
+        memory = self._retrieve_memory_context(task, context) if use_memory else ""
+        knowledge_context = (
+            self._retrieve_knowledge_context(task_prompt) if use_knowledge else ""
+        )
+        return memory, knowledge_context
+
+    @traced("crewai.memory.retrieve")
+    @profiled("memory_retrieval")
+    def _retrieve_memory_context(self, task: Task, context: Optional[str]) -> str:
+        """Build the contextual memory for a task."""
+        crewai_event_bus.emit(
+            self,
+            event=MemoryRetrievalStartedEvent(
+                task_id=str(task.id) if task else None,
+                source_type="agent",
+            ),
+        )
+
+        start_time = time.time()
+        contextual_memory = ContextualMemory(
+            self.crew.memory_config,
+            self.crew._short_term_memory,
+            self.crew._long_term_memory,
+            self.crew._entity_memory,
+            self.crew._user_memory,
+            self.crew._external_memory,
+        )
+        memory = contextual_memory.build_context_for_task(task, context)
+
+        crewai_event_bus.emit(
+            self,
+            event=MemoryRetrievalCompletedEvent(
+                task_id=str(task.id) if task else None,
+                memory_content=memory,
+                retrieval_time_ms=(time.time() - start_time) * 1000,
+                source_type="agent",
+            ),
+        )
+        return memory
+
+    @traced("crewai.knowledge.retrieve")
+    @profiled("knowledge_retrieval")
+    def _retrieve_knowledge_context(self, task_prompt: str) -> str:
+        """Query the agent and crew knowledge for a task.
+
+        Returns:
+            The knowledge context to append to the task prompt.
+        """
+        knowledge_config = (
+            self.knowledge_config.model_dump() if self.knowledge_config else {}
+        )
+        knowledge_context = ""
+
+        crewai_event_bus.emit(
+            self,
+            event=KnowledgeRetrievalStartedEvent(
+                agent=self,
+            ),
+        )
+        try:
+            self.knowledge_search_query = self._get_cached_knowledge_search_query(
+                task_prompt
+            )
+            if self.knowledge_search_query:
+                crew_knowledge = self.crew.knowledge if self.crew else None
+                if self.knowledge and crew_knowledge:
+                    # Query agent and crew knowledge in one pass, sharing the
+                    # query embeddings and dropping chunks found in both
+                    snippets = query_knowledge_batch(
+                        [self.knowledge, crew_knowledge],
+                        [self.knowledge_search_query],
+                        **knowledge_config,
+                    )[0]
+                    agent_knowledge_snippets = [
+                        snippet for snippet in snippets if snippet["knowledge_index"] == 0
+                    ]
+                    knowledge_snippets = [
+                        snippet for snippet in snippets if snippet["knowledge_index"] == 1
+                    ]
+                elif self.knowledge:
+                    agent_knowledge_snippets = self.knowledge.query(
+                        [self.knowledge_search_query], **knowledge_config
+                    )
+                    knowledge_snippets = []
+                else:
+                    agent_knowledge_snippets = []
+                    knowledge_snippets = self.crew.query_knowledge(
+                        [self.knowledge_search_query], **knowledge_config
+                    )
+
+                if agent_knowledge_snippets:
+                    self.agent_knowledge_context = extract_knowledge_context(
+                        agent_knowledge_snippets
+                    )
+                    if self.agent_knowledge_context:
+                        knowledge_context += self.agent_knowledge_context
+
+                if knowledge_snippets:
+                    self.crew_knowledge_context = extract_knowledge_context(
+                        knowledge_snippets
+                    )
+                    if self.crew_knowledge_context:
+                        knowledge_context += self.crew_knowledge_context
+
+                crewai_event_bus.emit(
+                    self,
+                    event=KnowledgeRetrievalCompletedEvent(
+                        query=self.knowledge_search_query,
+                        agent=self,
+                        retrieved_knowledge=(
+                            (self.agent_knowledge_context or "")
+                            + (
+                                "\n"
+                                if self.agent_knowledge_context
+                                and self.crew_knowledge_context
+                                else ""
+                            )
+                            + (self.crew_knowledge_context or "")
+                        ),
+                    ),
+                )
+        except Exception as e:
+            crewai_event_bus.emit(
+                self,
+                event=KnowledgeSearchQueryFailedEvent(
+                    query=self.knowledge_search_query or "",
+                    agent=self,
+                    error=str(e),
+                ),
+            )
+        return knowledge_context
+
+    def _get_cached_knowledge_search_query(self, task_prompt: str) -> str | None:
+        """Return the rewritten knowledge search query for a task prompt.
+
+        Rewrites are cached process-wide by model and prompt hash, so retries
+        and `kickoff_for_each` items that run an identical task do not pay for
+        another LLM call.
+        """
+        key = (
+            str(getattr(self.llm, "model", self.llm)),
+            hashlib.sha256(task_prompt.encode("utf-8")).hexdigest(),
+        )
+        with _knowledge_query_cache_lock:
+            if key in _knowledge_query_cache:
+                _knowledge_query_cache.move_to_end(key)
+                return _knowledge_query_cache[key]
+
+        query = self._get_knowledge_search_query(task_prompt)
+        if query:
+            with _knowledge_query_cache_lock:
+                _knowledge_query_cache[key] = query
+                if len(_knowledge_query_cache) > KNOWLEDGE_QUERY_CACHE_SIZE:
+                    _knowledge_query_cache.popitem(last=False)
+        return query
+
     def _get_knowledge_search_query(self, task_prompt: str) -> str | None:
         """Generate a search query for the knowledge base based on the task description."""
         crewai_event_bus.emit(
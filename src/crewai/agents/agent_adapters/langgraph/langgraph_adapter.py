@@ -212,7 +212,9 @@ class LangGraphAgentAdapter(BaseAgentAdapter):
 
     def get_delegation_tools(self, agents: List[BaseAgent]) -> List[BaseTool]:
         """Implement delegation tools support for LangGraph."""
-        agent_tools = AgentTools(agents=agents)
+        agent_tools = AgentTools(
+            agents=agents, parallel_delegation=self.allow_parallel_delegation
+        )
         return agent_tools.tools()
 
     def get_output_converter(
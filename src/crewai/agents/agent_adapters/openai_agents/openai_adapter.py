@@ -165,7 +165,9 @@ class OpenAIAgentAdapter(BaseAgentAdapter):
 
     def get_delegation_tools(self, agents: List[BaseAgent]) -> List[BaseTool]:
         """Implement delegation tools support"""
-        agent_tools = AgentTools(agents=agents)
+        agent_tools = AgentTools(
+            agents=agents, parallel_delegation=self.allow_parallel_delegation
+        )
         tools = agent_tools.tools()
         return tools
 
@@ -44,6 +44,7 @@ class BaseAgent(ABC, BaseModel):
         verbose (bool): Verbose mode for the Agent Execution.
         max_rpm (Optional[int]): Maximum number of requests per minute for the agent execution.
         allow_delegation (bool): Allow delegation of tasks to agents.
+        allow_parallel_delegation (bool): Allow delegating several tasks to coworkers at once.
         tools (Optional[List[Any]]): Tools at the agent's disposal.
         max_iter (int): Maximum iterations for an agent to execute a task.
         agent_executor (InstanceOf): An instance of the CrewAgentExecutor class.
@@ -108,6 +109,10 @@ class BaseAgent(ABC, BaseModel):
         default=False,
         description="Enable agent to delegate and ask questions among each other.",
     )
+    allow_parallel_delegation: bool = Field(
+        default=False,
+        description="Enable agent to delegate several tasks to different coworkers at once, running them concurrently.",
+    )
     tools: Optional[List[BaseTool]] = Field(
         default_factory=list, description="Tools at agents' disposal"
     )
@@ -6,6 +6,7 @@ class TokenProcess:
         self.total_tokens: int = 0
         self.prompt_tokens: int = 0
         self.cached_prompt_tokens: int = 0
+        self.cache_creation_prompt_tokens: int = 0
         self.completion_tokens: int = 0
         self.successful_requests: int = 0
 
@@ -20,6 +21,9 @@ class TokenProcess:
     def sum_cached_prompt_tokens(self, tokens: int) -> None:
         self.cached_prompt_tokens += tokens
 
+    def sum_cache_creation_prompt_tokens(self, tokens: int) -> None:
+        self.cache_creation_prompt_tokens += tokens
+
     def sum_successful_requests(self, requests: int) -> None:
         self.successful_requests += requests
 
@@ -28,6 +32,7 @@ class TokenProcess:
             total_tokens=self.total_tokens,
             prompt_tokens=self.prompt_tokens,
             cached_prompt_tokens=self.cached_prompt_tokens,
+            cache_creation_prompt_tokens=self.cache_creation_prompt_tokens,
             completion_tokens=self.completion_tokens,
             successful_requests=self.successful_requests,
         )
@@ -1,3 +1,4 @@
+import time
 from typing import Any, Callable, Dict, List, Optional, Union
 
 from crewai.agents.agent_builder.base_agent import BaseAgent
@@ -9,6 +10,7 @@ from crewai.agents.parser import (
 )
 from crewai.agents.tools_handler import ToolsHandler
 from crewai.llm import BaseLLM
+from crewai.telemetry.tracing import set_span_attributes, trace_span
 from crewai.tools.base_tool import BaseTool
 from crewai.tools.structured_tool import CrewStructuredTool
 from crewai.tools.tool_types import ToolResult
@@ -28,6 +30,7 @@ from crewai.utilities.agent_utils import (
 )
 from crewai.utilities.constants import MAX_LLM_RETRY, TRAINING_DATA_FILE
 from crewai.utilities.logger import Logger
+from crewai.utilities.profiling import profile_phase, profiled
 from crewai.utilities.tool_utils import execute_tool_and_check_finality
 from crewai.utilities.training_handler import CrewTrainingHandler
 from crewai.utilities.events.agent_events import (
@@ -96,15 +99,21 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             )
         )
 
+    @profiled("agent_execution")
     def invoke(self, inputs: Dict[str, str]) -> Dict[str, Any]:
-        if "system" in self.prompt:
-            system_prompt = self._format_prompt(self.prompt.get("system", ""), inputs)
-            user_prompt = self._format_prompt(self.prompt.get("user", ""), inputs)
-            self.messages.append(format_message_for_llm(system_prompt, role="system"))
-            self.messages.append(format_message_for_llm(user_prompt))
-        else:
-            user_prompt = self._format_prompt(self.prompt.get("prompt", ""), inputs)
-            self.messages.append(format_message_for_llm(user_prompt))
+        with profile_phase("prompt_formatting"):
+            if "system" in self.prompt:
+                system_prompt = self._format_prompt(
+                    self.prompt.get("system", ""), inputs
+                )
+                user_prompt = self._format_prompt(self.prompt.get("user", ""), inputs)
+                self.messages.append(
+                    format_message_for_llm(system_prompt, role="system")
+                )
+                self.messages.append(format_message_for_llm(user_prompt))
+            else:
+                user_prompt = self._format_prompt(self.prompt.get("prompt", ""), inputs)
+                self.messages.append(format_message_for_llm(user_prompt))
 
         self._show_start_logs()
 
@@ -126,9 +135,10 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         if self.ask_for_human_input:
             formatted_answer = self._handle_human_feedback(formatted_answer)
 
-        self._create_short_term_memory(formatted_answer)
-        self._create_long_term_memory(formatted_answer)
-        self._create_external_memory(formatted_answer)
+        with profile_phase("memory_save"):
+            self._create_short_term_memory(formatted_answer)
+            self._create_long_term_memory(formatted_answer)
+            self._create_external_memory(formatted_answer)
         return {"output": formatted_answer.output}
 
     def _invoke_loop(self) -> AgentFinish:
@@ -138,89 +148,107 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         """
         formatted_answer = None
         while not isinstance(formatted_answer, AgentFinish):
-            try:
-                if has_reached_max_iterations(self.iterations, self.max_iter):
-                    formatted_answer = handle_max_iterations_exceeded(
-                        formatted_answer,
-                        printer=self._printer,
-                        i18n=self._i18n,
-                        messages=self.messages,
-                        llm=self.llm,
-                        callbacks=self.callbacks,
+            with trace_span(
+                "crewai.agent.iteration",
+                {
+                    "crewai.agent.role": self.agent.role if self.agent else "",
+                    "crewai.agent.iteration": self.iterations,
+                },
+            ):
+                try:
+                    if has_reached_max_iterations(self.iterations, self.max_iter):
+                        formatted_answer = handle_max_iterations_exceeded(
+                            formatted_answer,
+                            printer=self._printer,
+                            i18n=self._i18n,
+                            messages=self.messages,
+                            llm=self.llm,
+                            callbacks=self.callbacks,
+                        )
+
+                    rpm_wait_started = time.perf_counter()
+                    with profile_phase("rpm_wait"):
+                        enforce_rpm_limit(self.request_within_rpm_limit)
+                    set_span_attributes(
+                        {"crewai.queue_wait": time.perf_counter() - rpm_wait_started}
                     )
 
-                enforce_rpm_limit(self.request_within_rpm_limit)
-
-                answer = get_llm_response(
-                    llm=self.llm,
-                    messages=self.messages,
-                    callbacks=self.callbacks,
-                    printer=self._printer,
-                    from_task=self.task
-                )
-                formatted_answer = process_llm_response(answer, self.use_stop_words)
-
-                if isinstance(formatted_answer, AgentAction):
-                    # Extract agent fingerprint if available
-                    fingerprint_context = {}
-                    if (
-                        self.agent
-                        and hasattr(self.agent, "security_config")
-                        and hasattr(self.agent.security_config, "fingerprint")
-                    ):
-                        fingerprint_context = {
-                            "agent_fingerprint": str(
-                                self.agent.security_config.fingerprint
+                    with profile_phase("llm_call"):
+                        answer = get_llm_response(
+                            llm=self.llm,
+                            messages=self.messages,
+                            callbacks=self.callbacks,
+                            printer=self._printer,
+                            from_task=self.task
+                        )
+                    with profile_phase("output_parsing"):
+                        formatted_answer = process_llm_response(
+                            answer, self.use_stop_words
+                        )
+
+                    if isinstance(formatted_answer, AgentAction):
+                        # Extract agent fingerprint if available
+                        fingerprint_context = {}
+                        if (
+                            self.agent
+                            and hasattr(self.agent, "security_config")
+                            and hasattr(self.agent.security_config, "fingerprint")
+                        ):
+                            fingerprint_context = {
+                                "agent_fingerprint": str(
+                                    self.agent.security_config.fingerprint
+                                )
+                            }
+
+                        with profile_phase("tool_execution"):
+                            tool_result = execute_tool_and_check_finality(
+                                agent_action=formatted_answer,
+                                fingerprint_context=fingerprint_context,
+                                tools=self.tools,
+                                i18n=self._i18n,
+                                agent_key=self.agent.key if self.agent else None,
+                                agent_role=self.agent.role if self.agent else None,
+                                tools_handler=self.tools_handler,
+                                task=self.task,
+                                agent=self.agent,
+                                function_calling_llm=self.function_calling_llm,
                             )
-                        }
-
-                    tool_result = execute_tool_and_check_finality(
-                        agent_action=formatted_answer,
-                        fingerprint_context=fingerprint_context,
-                        tools=self.tools,
-                        i18n=self._i18n,
-                        agent_key=self.agent.key if self.agent else None,
-                        agent_role=self.agent.role if self.agent else None,
-                        tools_handler=self.tools_handler,
-                        task=self.task,
-                        agent=self.agent,
-                        function_calling_llm=self.function_calling_llm,
-                    )
-                    formatted_answer = self._handle_agent_action(
-                        formatted_answer, tool_result
-                    )
+                        formatted_answer = self._handle_agent_action(
+                            formatted_answer, tool_result
+                        )
 
-                self._invoke_step_callback(formatted_answer)
-                self._append_message(formatted_answer.text, role="assistant")
-
-            except OutputParserException as e:
-                formatted_answer = handle_output_parser_exception(
-                    e=e,
-                    messages=self.messages,
-                    iterations=self.iterations,
-                    log_error_after=self.log_error_after,
-                    printer=self._printer,
-                )
+                    self._invoke_step_callback(formatted_answer)
+                    self._append_message(formatted_answer.text, role="assistant")
 
-            except Exception as e:
-                if e.__class__.__module__.startswith("litellm"):
-                    # Do not retry on litellm errors
-                    raise e
-                if is_context_length_exceeded(e):
-                    handle_context_length(
-                        respect_context_window=self.respect_context_window,
-                        printer=self._printer,
+                except OutputParserException as e:
+                    set_span_attributes({"crewai.agent.output_parser_error": True})
+                    formatted_answer = handle_output_parser_exception(
+                        e=e,
                         messages=self.messages,
-                        llm=self.llm,
-                        callbacks=self.callbacks,
-                        i18n=self._i18n,
+                        iterations=self.iterations,
+                        log_error_after=self.log_error_after,
+                        printer=self._printer,
                     )
-                    continue
-                else:
-                    handle_unknown_error(self._printer, e)
-                    raise e
-            finally:
-                self.iterations += 1
+
+                except Exception as e:
+                    if e.__class__.__module__.startswith("litellm"):
+                        # Do not retry on litellm errors
+                        raise e
+                    if is_context_length_exceeded(e):
+                        handle_context_length(
+                            respect_context_window=self.respect_context_window,
+                            printer=self._printer,
+                            messages=self.messages,
+                            llm=self.llm,
+                            callbacks=self.callbacks,
+                            i18n=self._i18n,
+                        )
+                        continue
+                    else:
+                        handle_unknown_error(self._printer, e)
+                        raise e
+                finally:
+                    self.iterations += 1
 
         # During the invoke loop, formatted_answer alternates between AgentAction
         # (when the agent is using tools) and eventually becomes AgentFinish
@@ -252,6 +280,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             show_logs=self._show_logs,
         )
 
+    @profiled("step_callback")
     def _invoke_step_callback(self, formatted_answer) -> None:
         """Invoke the step callback if it exists."""
         if self.step_callback:
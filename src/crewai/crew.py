@@ -1,5 +1,7 @@
 import asyncio
+import functools
 import json
+import os
 import re
 import uuid
 import warnings
@@ -8,6 +10,7 @@ from copy import copy as shallow_copy
 from hashlib import md5
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
     Dict,
     List,
@@ -21,6 +24,7 @@ from typing import (
 from opentelemetry import baggage
 from opentelemetry.context import attach, detach
 
+from crewai.utilities.crew.crew_context import get_usage_ledger
 from crewai.utilities.crew.models import CrewContext
 
 from pydantic import (
@@ -53,9 +57,10 @@ from crewai.security import Fingerprint, SecurityConfig
 from crewai.task import Task
 from crewai.tasks.conditional_task import ConditionalTask
 from crewai.tasks.task_output import TaskOutput
+from crewai.telemetry.tracing import traced
 from crewai.tools.agent_tools.agent_tools import AgentTools
 from crewai.tools.base_tool import BaseTool, Tool
-from crewai.types.usage_metrics import UsageMetrics
+from crewai.types.usage_metrics import UsageMetrics, UsageReport
 from crewai.utilities import I18N, FileHandler, Logger, RPMController
 from crewai.utilities.constants import NOT_SPECIFIED, TRAINING_DATA_FILE
 from crewai.utilities.evaluators.crew_evaluator_handler import CrewEvaluator
@@ -73,14 +78,18 @@ from crewai.utilities.events.crew_events import (
 )
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.event_listener import EventListener
+from crewai.utilities.execution_log import ExecutionLogWriter
 from crewai.utilities.formatter import (
     aggregate_raw_outputs_from_task_outputs,
     aggregate_raw_outputs_from_tasks,
 )
 from crewai.utilities.llm_utils import create_llm
 from crewai.utilities.planning_handler import CrewPlanner
+from crewai.utilities.profiling import ProfileReport, RunProfiler, current_profiler
+from crewai.utilities.streaming import StreamItem, stream_run
 from crewai.utilities.task_output_storage_handler import TaskOutputStorageHandler
 from crewai.utilities.training_handler import CrewTrainingHandler
+from crewai.utilities.usage_ledger import UsageLedger
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
@@ -94,6 +103,7 @@ class Crew(FlowTrackable, BaseModel):
         agents: List of agents part of this crew.
         manager_llm: The language model that will run manager agent.
         manager_agent: Custom agent that will be used as manager.
+        parallel_delegation: Whether the manager agent can delegate several tasks to coworkers at once in hierarchical crews.
         memory: Whether the crew should use memory to store memories of it's execution.
         memory_config: Configuration for the memory to be used for the crew.
         cache: Whether the crew should use a cache to store the results of the tools execution.
@@ -132,6 +142,9 @@ class Crew(FlowTrackable, BaseModel):
     _task_output_handler: TaskOutputStorageHandler = PrivateAttr(
         default_factory=TaskOutputStorageHandler
     )
+    _usage_ledger: Optional[UsageLedger] = PrivateAttr(default=None)
+    _parent_usage_ledger: Optional[UsageLedger] = PrivateAttr(default=None)
+    _profiler: Optional[RunProfiler] = PrivateAttr(default=None)
 
     name: Optional[str] = Field(default=None)
     cache: bool = Field(default=True)
@@ -181,6 +194,10 @@ class Crew(FlowTrackable, BaseModel):
     manager_agent: Optional[BaseAgent] = Field(
         description="Custom agent that will be used as manager.", default=None
     )
+    parallel_delegation: bool = Field(
+        default=False,
+        description="Whether the manager agent can delegate several tasks to coworkers at once, running them concurrently.",
+    )
     function_calling_llm: Optional[Union[str, InstanceOf[LLM], Any]] = Field(
         description="Language model that will run the agent.", default=None
     )
@@ -213,14 +230,20 @@ class Crew(FlowTrackable, BaseModel):
         default=None,
         description="Path to the prompt json file to be used for the crew.",
     )
-    output_log_file: Optional[Union[bool, str]] = Field(
+    output_log_file: Optional[
+        Union[bool, str, InstanceOf[ExecutionLogWriter]]
+    ] = Field(
         default=None,
-        description="Path to the log file to be saved",
+        description="Path to the log file to be saved, or a JSON Lines log writer",
     )
     planning: Optional[bool] = Field(
         default=False,
         description="Plan the crew execution and add the plan to the crew.",
     )
+    profile: Union[bool, InstanceOf[RunProfiler]] = Field(
+        default=False,
+        description="Time the phases of the agent loops, or a profiler to record them with.",
+    )
     planning_llm: Optional[Union[str, InstanceOf[BaseLLM], Any]] = Field(
         default=None,
         description="Language model that will run the AgentPlanner if planning is True.",
@@ -617,14 +640,34 @@ class Crew(FlowTrackable, BaseModel):
             CrewTrainingHandler(filename).clear()
             raise
 
+    @traced(
+        "crewai.crew",
+        lambda self, *args, **kwargs: {
+            "crewai.crew.name": self.name or "crew",
+            "crewai.crew.id": str(self.id),
+            "crewai.crew.process": str(self.process),
+        },
+    )
     def kickoff(
         self,
         inputs: Optional[Dict[str, Any]] = None,
     ) -> CrewOutput:
+        # Copies made by kickoff_for_each and crews started from inside another
+        # crew's run report into the ledger of the outer run
+        parent_ledger = self._parent_usage_ledger or get_usage_ledger()
+        name = self.name or "crew"
+        self._usage_ledger = (
+            parent_ledger.child(name) if parent_ledger else UsageLedger(name)
+        )
         ctx = baggage.set_baggage(
-            "crew_context", CrewContext(id=str(self.id), key=self.key)
+            "crew_context",
+            CrewContext(
+                id=str(self.id), key=self.key, usage_ledger=self._usage_ledger
+            ),
         )
         token = attach(ctx)
+        profiler = self._start_profiler()
+        profiler_token = profiler.activate() if profiler else None
 
         try:
             for before_callback in self.before_kickoff_callbacks:
@@ -687,6 +730,10 @@ class Crew(FlowTrackable, BaseModel):
             )
             raise
         finally:
+            if self.output_log_file:
+                self._file_handler.flush()
+            if profiler is not None and profiler_token is not None:
+                profiler.deactivate(profiler_token)
             detach(token)
 
     def kickoff_for_each(self, inputs: List[Dict[str, Any]]) -> List[CrewOutput]:
@@ -695,18 +742,28 @@ class Crew(FlowTrackable, BaseModel):
 
         # Initialize the parent crew's usage metrics
         total_usage_metrics = UsageMetrics()
+        usage_ledger = UsageLedger(self.name or "crew")
+        # The copies record into the profiler active around the loop
+        profiler = self._start_profiler()
+        profiler_token = profiler.activate() if profiler else None
 
-        for input_data in inputs:
-            crew = self.copy()
+        try:
+            for input_data in inputs:
+                crew = self.copy()
+                crew._parent_usage_ledger = usage_ledger
 
-            output = crew.kickoff(inputs=input_data)
+                output = crew.kickoff(inputs=input_data)
 
-            if crew.usage_metrics:
-                total_usage_metrics.add_usage_metrics(crew.usage_metrics)
+                if crew.usage_metrics:
+                    total_usage_metrics.add_usage_metrics(crew.usage_metrics)
 
-            results.append(output)
+                results.append(output)
+        finally:
+            if profiler is not None and profiler_token is not None:
+                profiler.deactivate(profiler_token)
 
         self.usage_metrics = total_usage_metrics
+        self._usage_ledger = usage_ledger
         self._task_output_handler.reset()
         return results
 
@@ -714,18 +771,40 @@ class Crew(FlowTrackable, BaseModel):
         """Asynchronous kickoff method to start the crew execution."""
         return await asyncio.to_thread(self.kickoff, inputs)
 
+    def kickoff_stream(
+        self, inputs: Optional[Dict[str, Any]] = None, max_buffered: int = 1024
+    ) -> AsyncIterator[StreamItem]:
+        """Start the crew and stream its progress as it happens.
+
+        The crew runs on a background thread while the returned async iterator
+        yields task, tool and LLM token items, ending with a `FinalOutputItem`
+        holding the `CrewOutput`. Exceptions raised by the crew are raised from
+        the iterator. At most `max_buffered` unread items are held before the
+        crew waits for the consumer.
+        """
+        return stream_run(functools.partial(self.kickoff, inputs), max_buffered)
+
     async def kickoff_for_each_async(self, inputs: List[Dict]) -> List[CrewOutput]:
         crew_copies = [self.copy() for _ in inputs]
+        usage_ledger = UsageLedger(self.name or "crew")
+        for crew in crew_copies:
+            crew._parent_usage_ledger = usage_ledger
 
         async def run_crew(crew, input_data):
             return await crew.kickoff_async(inputs=input_data)
 
-        tasks = [
-            asyncio.create_task(run_crew(crew_copies[i], inputs[i]))
-            for i in range(len(inputs))
-        ]
+        profiler = self._start_profiler()
+        profiler_token = profiler.activate() if profiler else None
+        try:
+            tasks = [
+                asyncio.create_task(run_crew(crew_copies[i], inputs[i]))
+                for i in range(len(inputs))
+            ]
 
-        results = await asyncio.gather(*tasks)
+            results = await asyncio.gather(*tasks)
+        finally:
+            if profiler is not None and profiler_token is not None:
+                profiler.deactivate(profiler_token)
 
         total_usage_metrics = UsageMetrics()
         for crew in crew_copies:
@@ -733,6 +812,7 @@ class Crew(FlowTrackable, BaseModel):
                 total_usage_metrics.add_usage_metrics(crew.usage_metrics)
 
         self.usage_metrics = total_usage_metrics
+        self._usage_ledger = usage_ledger
         self._task_output_handler.reset()
         return results
 
@@ -788,6 +868,8 @@ class Crew(FlowTrackable, BaseModel):
         i18n = I18N(prompt_file=self.prompt_file)
         if self.manager_agent is not None:
             self.manager_agent.allow_delegation = True
+            if self.parallel_delegation:
+                self.manager_agent.allow_parallel_delegation = True
             manager = self.manager_agent
             if manager.tools is not None and len(manager.tools) > 0:
                 self._logger.log(
@@ -801,8 +883,11 @@ class Crew(FlowTrackable, BaseModel):
                 role=i18n.retrieve("hierarchical_manager_agent", "role"),
                 goal=i18n.retrieve("hierarchical_manager_agent", "goal"),
                 backstory=i18n.retrieve("hierarchical_manager_agent", "backstory"),
-                tools=AgentTools(agents=self.agents).tools(),
+                tools=AgentTools(
+                    agents=self.agents, parallel_delegation=self.parallel_delegation
+                ).tools(),
                 allow_delegation=True,
+                allow_parallel_delegation=self.parallel_delegation,
                 llm=self.manager_llm,
                 verbose=self.verbose,
             )
@@ -1157,11 +1242,22 @@ class Crew(FlowTrackable, BaseModel):
         return result
 
     def query_knowledge(
-        self, query: List[str], results_limit: int = 3, score_threshold: float = 0.35
+        self,
+        query: List[str],
+        results_limit: int = 3,
+        score_threshold: float = 0.35,
+        hybrid_search: bool = False,
+        candidates_limit: int = 20,
+        reranker_model: Optional[str] = None,
     ) -> Union[List[Dict[str, Any]], None]:
         if self.knowledge:
             return self.knowledge.query(
-                query, results_limit=results_limit, score_threshold=score_threshold
+                query,
+                results_limit=results_limit,
+                score_threshold=score_threshold,
+                hybrid_search=hybrid_search,
+                candidates_limit=candidates_limit,
+                reranker_model=reranker_model,
             )
         return None
 
@@ -1296,6 +1392,39 @@ class Crew(FlowTrackable, BaseModel):
         if self.max_rpm:
             self._rpm_controller.stop_rpm_counter()
 
+    def _start_profiler(self) -> Optional[RunProfiler]:
+        # Runs started inside a profiled run, like the copies made by
+        # kickoff_for_each, record into the outer run's profiler
+        profiler = current_profiler()
+        if profiler is None:
+            if isinstance(self.profile, RunProfiler):
+                profiler = self.profile
+            elif (
+                self.profile
+                or os.getenv("CREWAI_PROFILE", "false").lower() == "true"
+            ):
+                profiler = RunProfiler()
+        self._profiler = profiler
+        return profiler
+
+    def profile_report(self) -> Optional[ProfileReport]:
+        """Phase timings of the last run, when it was profiled.
+
+        Returns None if the crew has not been kicked off with profiling on.
+        """
+        if self._profiler is None:
+            return None
+        return self._profiler.report()
+
+    def usage_report(self) -> Optional[UsageReport]:
+        """Usage of the last run broken down by model, task, agent and tool.
+
+        Returns None if the crew has not been kicked off yet.
+        """
+        if self._usage_ledger is None:
+            return None
+        return self._usage_ledger.report()
+
     def calculate_usage_metrics(self) -> UsageMetrics:
         """Calculates and returns the usage metrics."""
         total_usage_metrics = UsageMetrics()
@@ -1,15 +1,23 @@
 import asyncio
+import concurrent.futures
+import contextvars
 import copy
+import functools
 import inspect
 import logging
+import time
+from collections import deque
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
+    Deque,
     Dict,
     Generic,
     List,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -21,7 +29,9 @@ from pydantic import BaseModel, Field, ValidationError
 
 from crewai.flow.flow_visualizer import plot_flow
 from crewai.flow.persistence.base import FlowPersistence
+from crewai.flow.persistence.json_patch import JsonPatch, apply_patch
 from crewai.flow.utils import get_possible_return_constants
+from crewai.flow.work_queue.base import FlowWorkQueue
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.flow_events import (
     FlowCreatedEvent,
@@ -33,6 +43,8 @@ from crewai.utilities.events.flow_events import (
     MethodExecutionStartedEvent,
 )
 from crewai.utilities.printer import Printer
+from crewai.utilities.serialization import to_serializable
+from crewai.utilities.streaming import StreamItem, stream_run
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +58,46 @@ class FlowState(BaseModel):
     )
 
 
+METHOD_EXECUTORS = ("thread", "process", "inline", "queue")
+
+
+def _run_coroutine_sync(coroutine_factory: Callable[[], Any]) -> Any:
+    """Run a coroutine to completion from synchronous code.
+
+    Uses `asyncio.run` directly, or from a helper thread when this thread
+    already runs an event loop, which `asyncio.run` does not allow.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine_factory())
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as runner:
+        return runner.submit(
+            contextvars.copy_context().run,
+            lambda: asyncio.run(coroutine_factory()),
+        ).result()
+
+
+def _timed_call(method: Callable, *args: Any, **kwargs: Any) -> Tuple[Any, float, float]:
+    """Call a synchronous flow method in the current worker.
+
+    Returns the method's result, when it started (seconds since the epoch,
+    comparable across processes) and the CPU time the worker spent on it.
+    """
+    started_at = time.time()
+    cpu_start = time.thread_time()
+    result = method(*args, **kwargs)
+    return result, started_at, time.thread_time() - cpu_start
+
+
+def _validate_executor(executor: Optional[str]) -> None:
+    if executor is not None and executor not in METHOD_EXECUTORS:
+        raise ValueError(
+            f"Invalid executor '{executor}'. Expected one of: {', '.join(METHOD_EXECUTORS)}"
+        )
+
+
 # Type variables with explicit bounds
 T = TypeVar(
     "T", bound=Union[Dict[str, Any], BaseModel]
@@ -95,7 +147,10 @@ def ensure_state_type(state: Any, expected_type: Type[StateT]) -> StateT:
     raise TypeError(f"Invalid expected_type: {expected_type}")
 
 
-def start(condition: Optional[Union[str, dict, Callable]] = None) -> Callable:
+def start(
+    condition: Optional[Union[str, dict, Callable]] = None,
+    executor: Optional[str] = None,
+) -> Callable:
     """
     Marks a method as a flow's starting point.
 
@@ -111,6 +166,10 @@ def start(condition: Optional[Union[str, dict, Callable]] = None) -> Callable:
         - dict: Contains "type" ("AND"/"OR") and "methods" (list of triggers)
         - Callable: A method reference that triggers this start
         Default is None, meaning unconditional start.
+    executor : Optional[str], optional
+        Where a synchronous method runs: "thread", "process" or "inline",
+        or "queue" to run the method on a worker through the flow's
+        `work_queue`. Default is None, meaning the flow's `method_executor`.
 
     Returns
     -------
@@ -136,9 +195,12 @@ def start(condition: Optional[Union[str, dict, Callable]] = None) -> Callable:
     >>> def complex_start(self):
     ...     pass
     """
+    _validate_executor(executor)
 
     def decorator(func):
         func.__is_start_method__ = True
+        if executor is not None:
+            func.__executor__ = executor
         if condition is not None:
             if isinstance(condition, str):
                 func.__trigger_methods__ = [condition]
@@ -162,7 +224,9 @@ def start(condition: Optional[Union[str, dict, Callable]] = None) -> Callable:
     return decorator
 
 
-def listen(condition: Union[str, dict, Callable]) -> Callable:
+def listen(
+    condition: Union[str, dict, Callable], executor: Optional[str] = None
+) -> Callable:
     """
     Creates a listener that executes when specified conditions are met.
 
@@ -177,6 +241,10 @@ def listen(condition: Union[str, dict, Callable]) -> Callable:
         - str: Name of a method that triggers this listener
         - dict: Contains "type" ("AND"/"OR") and "methods" (list of triggers)
         - Callable: A method reference that triggers this listener
+    executor : Optional[str], optional
+        Where a synchronous method runs: "thread", "process" or "inline",
+        or "queue" to run the method on a worker through the flow's
+        `work_queue`. Default is None, meaning the flow's `method_executor`.
 
     Returns
     -------
@@ -197,9 +265,16 @@ def listen(condition: Union[str, dict, Callable]) -> Callable:
     >>> @listen(or_("success", "failure"))  # Listen to multiple methods
     >>> def handle_completion(self):
     ...     pass
+
+    >>> @listen("fetch_data", executor="process")  # CPU-bound work
+    >>> def crunch_numbers(self):
+    ...     pass
     """
+    _validate_executor(executor)
 
     def decorator(func):
+        if executor is not None:
+            func.__executor__ = executor
         if isinstance(condition, str):
             func.__trigger_methods__ = [condition]
             func.__condition_type__ = "OR"
@@ -222,7 +297,9 @@ def listen(condition: Union[str, dict, Callable]) -> Callable:
     return decorator
 
 
-def router(condition: Union[str, dict, Callable]) -> Callable:
+def router(
+    condition: Union[str, dict, Callable], executor: Optional[str] = None
+) -> Callable:
     """
     Creates a routing method that directs flow execution based on conditions.
 
@@ -238,6 +315,10 @@ def router(condition: Union[str, dict, Callable]) -> Callable:
         - str: Name of a method that triggers this router
         - dict: Contains "type" ("AND"/"OR") and "methods" (list of triggers)
         - Callable: A method reference that triggers this router
+    executor : Optional[str], optional
+        Where a synchronous method runs: "thread", "process" or "inline",
+        or "queue" to run the method on a worker through the flow's
+        `work_queue`. Default is None, meaning the flow's `method_executor`.
 
     Returns
     -------
@@ -264,8 +345,12 @@ def router(condition: Union[str, dict, Callable]) -> Callable:
     ...     return STOP
     """
 
+    _validate_executor(executor)
+
     def decorator(func):
         func.__is_router__ = True
+        if executor is not None:
+            func.__executor__ = executor
         if isinstance(condition, str):
             func.__trigger_methods__ = [condition]
             func.__condition_type__ = "OR"
@@ -380,6 +465,36 @@ def and_(*conditions: Union[str, dict, Callable]) -> dict:
     return {"type": "AND", "methods": methods}
 
 
+def _build_trigger_index(
+    listeners: Dict[str, Tuple[str, List[str]]], routers: Set[str]
+) -> Tuple[
+    Dict[str, List[Tuple[str, int]]], Dict[str, List[Tuple[str, int]]], Dict[str, int]
+]:
+    """Build reverse indexes from trigger names to the methods they trigger.
+
+    Returns the router index, the listener index and the completion mask of
+    every AND listener. Each index maps a trigger to (method name, bit) pairs
+    in definition order, where bit is 0 for OR conditions and the trigger's
+    position bit in the method's AND mask otherwise.
+    """
+    router_triggers: Dict[str, List[Tuple[str, int]]] = {}
+    listener_triggers: Dict[str, List[Tuple[str, int]]] = {}
+    and_masks: Dict[str, int] = {}
+
+    for listener_name, (condition_type, methods) in listeners.items():
+        index = router_triggers if listener_name in routers else listener_triggers
+        unique_methods = list(dict.fromkeys(methods))
+        if condition_type == "OR":
+            for method in unique_methods:
+                index.setdefault(method, []).append((listener_name, 0))
+        elif condition_type == "AND":
+            and_masks[listener_name] = (1 << len(unique_methods)) - 1
+            for position, method in enumerate(unique_methods):
+                index.setdefault(method, []).append((listener_name, 1 << position))
+
+    return router_triggers, listener_triggers, and_masks
+
+
 class FlowMeta(type):
     def __new__(mcs, name, bases, dct):
         cls = super().__new__(mcs, name, bases, dct)
@@ -421,13 +536,42 @@ class FlowMeta(type):
         setattr(cls, "_routers", routers)
         setattr(cls, "_router_paths", router_paths)
 
+        router_triggers, listener_triggers, and_masks = _build_trigger_index(
+            listeners, routers
+        )
+        setattr(cls, "_router_triggers", router_triggers)
+        setattr(cls, "_listener_triggers", listener_triggers)
+        setattr(cls, "_and_masks", and_masks)
+
         return cls
 
 
 class Flow(Generic[T], metaclass=FlowMeta):
     """Base class for all flows.
 
-    Type parameter T must be either Dict[str, Any] or a subclass of BaseModel."""
+    Type parameter T must be either Dict[str, Any] or a subclass of BaseModel.
+
+    Synchronous flow methods run in a worker pool so that listeners triggered
+    together run in parallel. `method_executor` selects the default pool
+    ("thread", "process" or "inline" on the event loop) and `max_concurrency`
+    caps how many of the flow's synchronous methods run at the same time.
+    Methods can override the pool with the `executor` argument of their
+    decorator. Methods sent to the "process" pool run against a pickled copy
+    of the flow, so only their return value is sent back. Methods sent to the
+    "queue" executor are enqueued on `work_queue` and run by `FlowWorker`s,
+    possibly in other processes, against the state saved by the flow's
+    persistence backend; their state changes are merged back when they
+    complete.
+
+    Method outputs are all kept in memory unless `max_method_outputs` is set,
+    in which case only the most recent ones are (1 keeps only the final
+    output). With `persist_method_outputs`, every output is also written to
+    the persistence backend as it is produced.
+
+    With `checkpoint`, the state and output of every completed method are
+    persisted together. Resuming the flow with `kickoff(inputs={"id": ...})`
+    then skips methods that already completed, replaying their persisted
+    outputs to their listeners, and runs only the remaining methods."""
 
     _printer = Printer()
 
@@ -435,8 +579,17 @@ class Flow(Generic[T], metaclass=FlowMeta):
     _listeners: Dict[str, tuple[str, List[str]]] = {}
     _routers: Set[str] = set()
     _router_paths: Dict[str, List[str]] = {}
+    _router_triggers: Dict[str, List[Tuple[str, int]]] = {}
+    _listener_triggers: Dict[str, List[Tuple[str, int]]] = {}
+    _and_masks: Dict[str, int] = {}
     initial_state: Union[Type[T], T, None] = None
     name: Optional[str] = None
+    method_executor: str = "thread"
+    max_concurrency: Optional[int] = None
+    max_method_outputs: Optional[int] = None
+    persist_method_outputs: bool = False
+    checkpoint: bool = False
+    work_queue: Optional[FlowWorkQueue] = None
 
     def __class_getitem__(cls: Type["Flow"], item: Type[T]) -> Type["Flow"]:
         class _FlowGeneric(cls):  # type: ignore
@@ -459,9 +612,29 @@ class Flow(Generic[T], metaclass=FlowMeta):
         # Initialize basic instance attributes
         self._methods: Dict[str, Callable] = {}
         self._method_execution_counts: Dict[str, int] = {}
-        self._pending_and_listeners: Dict[str, Set[str]] = {}
-        self._method_outputs: List[Any] = []  # List to store all method outputs
+        self._and_listener_progress: Dict[str, int] = {}
+        if self.max_method_outputs is not None and self.max_method_outputs < 1:
+            raise ValueError(
+                f"max_method_outputs must be None or at least 1, got {self.max_method_outputs}"
+            )
+        # Outputs of executed methods, bounded by max_method_outputs
+        self._method_outputs: Deque[Any] = deque(maxlen=self.max_method_outputs)
         self._persistence: Optional[FlowPersistence] = persistence
+        for option in ("persist_method_outputs", "checkpoint"):
+            if not getattr(self, option):
+                continue
+            if persistence is None:
+                raise ValueError(f"{option} requires a persistence backend")
+            if not persistence.supports_method_outputs():
+                raise ValueError(
+                    f"{option} requires a persistence backend that stores method "
+                    f"outputs, which {type(persistence).__name__} does not"
+                )
+        # Persisted outputs of completed methods, consumed when resuming
+        self._replay_outputs: Dict[str, Deque[Any]] = {}
+        self._executors: Dict[str, concurrent.futures.Executor] = {}
+        self._shared_executor: Optional[concurrent.futures.Executor] = None
+        self._concurrency_limiter: Optional[asyncio.Semaphore] = None
 
         # Initialize state with initial values
         self._state = self._create_initial_state()
@@ -579,14 +752,26 @@ class Flow(Generic[T], metaclass=FlowMeta):
     def _copy_state(self) -> T:
         return copy.deepcopy(self._state)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker pools and the concurrency limiter are bound to this process
+        state = self.__dict__.copy()
+        state["_executors"] = {}
+        state["_shared_executor"] = None
+        state["_concurrency_limiter"] = None
+        return state
+
     @property
     def state(self) -> T:
         return self._state
 
     @property
     def method_outputs(self) -> List[Any]:
-        """Returns the list of all outputs from executed methods."""
-        return self._method_outputs
+        """Returns the outputs of executed methods still held in memory.
+
+        All outputs are kept unless `max_method_outputs` limits them to the
+        most recent ones.
+        """
+        return list(self._method_outputs)
 
     @property
     def flow_id(self) -> str:
@@ -714,13 +899,147 @@ class Flow(Generic[T], metaclass=FlowMeta):
         Start the flow execution in a synchronous context.
 
         This method wraps kickoff_async so that all state initialization and event
-        emission is handled in the asynchronous method.
+        emission is handled in the asynchronous method. When called from a thread
+        that already runs an event loop, the flow runs on a helper thread.
         """
 
         async def run_flow():
             return await self.kickoff_async(inputs)
 
-        return asyncio.run(run_flow())
+        return _run_coroutine_sync(run_flow)
+
+    def kickoff_stream(
+        self, inputs: Optional[Dict[str, Any]] = None, max_buffered: int = 1024
+    ) -> AsyncIterator[StreamItem]:
+        """
+        Start the flow and stream its progress as it happens.
+
+        The flow runs on a background thread while the returned async iterator
+        yields method, task, tool and LLM token items, ending with a
+        `FinalOutputItem` holding the flow's result. Exceptions raised by the
+        flow are raised from the iterator. At most `max_buffered` unread items
+        are held before the flow waits for the consumer.
+        """
+        return stream_run(functools.partial(self.kickoff, inputs), max_buffered)
+
+    @classmethod
+    def kickoff_many(
+        cls,
+        inputs: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+        persistence: Optional[FlowPersistence] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Run one flow instance per input on a single event loop.
+
+        See `kickoff_many_as_completed` for the arguments.
+
+        Returns:
+            The final output of each flow, in the order of `inputs`.
+        """
+
+        async def run_flows():
+            return await cls.kickoff_many_async(
+                inputs,
+                max_concurrency=max_concurrency,
+                executor=executor,
+                persistence=persistence,
+                return_exceptions=return_exceptions,
+            )
+
+        return _run_coroutine_sync(run_flows)
+
+    @classmethod
+    async def kickoff_many_async(
+        cls,
+        inputs: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+        persistence: Optional[FlowPersistence] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Run one flow instance per input concurrently on the running loop.
+
+        See `kickoff_many_as_completed` for the arguments.
+
+        Returns:
+            The final output of each flow, in the order of `inputs`.
+        """
+        results: List[Any] = [None] * len(inputs)
+        async for index, result in cls.kickoff_many_as_completed(
+            inputs,
+            max_concurrency=max_concurrency,
+            executor=executor,
+            persistence=persistence,
+            return_exceptions=return_exceptions,
+        ):
+            results[index] = result
+        return results
+
+    @classmethod
+    async def kickoff_many_as_completed(
+        cls,
+        inputs: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+        persistence: Optional[FlowPersistence] = None,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Run one flow instance per input and yield results as flows finish.
+
+        All flows share the running event loop and one thread pool for their
+        synchronous methods. An input containing an `id` restores that flow's
+        persisted state, as with `kickoff`.
+
+        Args:
+            inputs: The inputs of each flow run.
+            max_concurrency: Maximum number of flows running at the same time.
+            executor: Thread pool shared by the flows' synchronous methods.
+                A pool is created, and shut down afterwards, if not given.
+            persistence: Persistence backend passed to every flow instance.
+            return_exceptions: Yield a failing flow's exception as its result
+                instead of raising it and cancelling the remaining flows.
+
+        Yields:
+            (index, result) pairs, where index is the position in `inputs`.
+        """
+        shared_executor = executor or concurrent.futures.ThreadPoolExecutor(
+            thread_name_prefix="crewai_flow"
+        )
+        limiter = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run_flow(index: int, flow_inputs: Dict[str, Any]) -> Tuple[int, Any]:
+            if limiter is not None:
+                await limiter.acquire()
+            try:
+                flow = cls(persistence=persistence)
+                flow._shared_executor = shared_executor
+                return index, await flow.kickoff_async(flow_inputs)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return index, e
+            finally:
+                if limiter is not None:
+                    limiter.release()
+
+        tasks = [
+            asyncio.create_task(run_flow(index, flow_inputs))
+            for index, flow_inputs in enumerate(inputs)
+        ]
+        try:
+            for next_finished in asyncio.as_completed(tasks):
+                yield await next_finished
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if executor is None:
+                shared_executor.shutdown(wait=False)
 
     async def kickoff_async(self, inputs: Optional[Dict[str, Any]] = None) -> Any:
         """
@@ -759,6 +1078,8 @@ class Flow(Generic[T], metaclass=FlowMeta):
                     self._log_flow_event(
                         f"No flow state found for UUID: {restore_uuid}", color="red"
                     )
+                if self.checkpoint:
+                    self._load_checkpoint(restore_uuid)
 
             # Update state with any additional inputs (ignoring the 'id' key)
             filtered_inputs = {k: v for k, v in inputs.items() if k != "id"}
@@ -781,11 +1102,15 @@ class Flow(Generic[T], metaclass=FlowMeta):
         if inputs is not None and "id" not in inputs:
             self._initialize_state(inputs)
 
-        tasks = [
-            self._execute_start_method(start_method)
-            for start_method in self._start_methods
-        ]
-        await asyncio.gather(*tasks)
+        self._concurrency_limiter = None
+        try:
+            tasks = [
+                self._execute_start_method(start_method)
+                for start_method in self._start_methods
+            ]
+            await asyncio.gather(*tasks)
+        finally:
+            self._shutdown_executors()
 
         final_output = self._method_outputs[-1] if self._method_outputs else None
 
@@ -823,45 +1148,87 @@ class Flow(Generic[T], metaclass=FlowMeta):
         )
         await self._execute_listeners(start_method_name, result)
 
+    def _load_checkpoint(self, flow_uuid: str) -> None:
+        """Queue the persisted outputs of completed methods for replay."""
+        self._replay_outputs = {}
+        if self._persistence is None:
+            return
+        for method_name, output in self._persistence.load_method_outputs(flow_uuid):
+            self._replay_outputs.setdefault(method_name, deque()).append(output)
+        if self._replay_outputs:
+            self._log_flow_event(
+                f"Resuming flow {flow_uuid}, skipping completed methods: "
+                f"{', '.join(self._replay_outputs)}",
+                color="yellow",
+            )
+
     async def _execute_method(
         self, method_name: str, method: Callable, *args: Any, **kwargs: Any
     ) -> Any:
+        replay = self._replay_outputs.get(method_name)
+        if replay:
+            # Completed in a previous run: reuse its output instead of running it
+            result = replay.popleft()
+            self._method_outputs.append(result)
+            self._method_execution_counts[method_name] = (
+                self._method_execution_counts.get(method_name, 0) + 1
+            )
+            return result
+
         try:
             dumped_params = {f"_{i}": arg for i, arg in enumerate(args)} | (
                 kwargs or {}
             )
-            crewai_event_bus.emit(
-                self,
-                MethodExecutionStartedEvent(
-                    type="method_execution_started",
-                    method_name=method_name,
-                    flow_name=self.name or self.__class__.__name__,
-                    params=dumped_params,
-                    state=self._copy_state(),
-                ),
-            )
+            if crewai_event_bus.has_handlers(MethodExecutionStartedEvent):
+                crewai_event_bus.emit(
+                    self,
+                    MethodExecutionStartedEvent(
+                        type="method_execution_started",
+                        method_name=method_name,
+                        flow_name=self.name or self.__class__.__name__,
+                        params=dumped_params,
+                        state=self._copy_state(),
+                    ),
+                )
 
-            result = (
-                await method(*args, **kwargs)
-                if asyncio.iscoroutinefunction(method)
-                else method(*args, **kwargs)
-            )
+            queue_wait: Optional[float] = None
+            cpu_time: Optional[float] = None
+            executor_type = getattr(method, "__executor__", None) or self.method_executor
+            if executor_type == "queue":
+                result = await self._run_queued_method(method_name, *args, **kwargs)
+            elif asyncio.iscoroutinefunction(method):
+                result = await method(*args, **kwargs)
+            else:
+                dispatched_at = time.time()
+                result, started_at, cpu_time = await self._run_sync_method(
+                    method, *args, **kwargs
+                )
+                queue_wait = max(0.0, started_at - dispatched_at)
 
             self._method_outputs.append(result)
+            if self.checkpoint and self._persistence is not None:
+                self._persistence.save_checkpoint(
+                    self.flow_id, method_name, self._state, result
+                )
+            elif self.persist_method_outputs and self._persistence is not None:
+                self._persistence.save_method_output(self.flow_id, method_name, result)
             self._method_execution_counts[method_name] = (
                 self._method_execution_counts.get(method_name, 0) + 1
             )
 
-            crewai_event_bus.emit(
-                self,
-                MethodExecutionFinishedEvent(
-                    type="method_execution_finished",
-                    method_name=method_name,
-                    flow_name=self.name or self.__class__.__name__,
-                    state=self._copy_state(),
-                    result=result,
-                ),
-            )
+            if crewai_event_bus.has_handlers(MethodExecutionFinishedEvent):
+                crewai_event_bus.emit(
+                    self,
+                    MethodExecutionFinishedEvent(
+                        type="method_execution_finished",
+                        method_name=method_name,
+                        flow_name=self.name or self.__class__.__name__,
+                        state=self._copy_state(),
+                        result=result,
+                        queue_wait=queue_wait,
+                        cpu_time=cpu_time,
+                    ),
+                )
 
             return result
         except Exception as e:
@@ -876,6 +1243,128 @@ class Flow(Generic[T], metaclass=FlowMeta):
             )
             raise e
 
+    async def _run_sync_method(
+        self, method: Callable, *args: Any, **kwargs: Any
+    ) -> Tuple[Any, float, float]:
+        """Run a synchronous flow method in the pool selected for it.
+
+        The method's `executor` hint takes precedence over the flow's
+        `method_executor`. Thread workers run in a copy of the current context.
+        Returns the method's result along with the timings of `_timed_call`.
+        """
+        executor_type = getattr(method, "__executor__", None) or self.method_executor
+        _validate_executor(executor_type)
+        if executor_type == "inline":
+            return _timed_call(method, *args, **kwargs)
+
+        if executor_type == "process":
+            call = functools.partial(_timed_call, method, *args, **kwargs)
+        else:
+            call = functools.partial(
+                contextvars.copy_context().run, _timed_call, method, *args, **kwargs
+            )
+
+        limiter = self._get_concurrency_limiter()
+        loop = asyncio.get_running_loop()
+        if limiter is None:
+            return await loop.run_in_executor(self._get_executor(executor_type), call)
+        async with limiter:
+            return await loop.run_in_executor(self._get_executor(executor_type), call)
+
+    async def _run_queued_method(
+        self, method_name: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run a flow method on a worker through the flow's work queue.
+
+        The current state is persisted for the worker to load, and the state
+        patch the worker sends back with the result is applied on completion.
+        Arguments and results travel as JSON.
+        """
+        if self.work_queue is None or self._persistence is None:
+            raise ValueError(
+                "The queue executor requires a work_queue and a persistence backend"
+            )
+        flow_class = type(self)
+        if "<locals>" in flow_class.__qualname__:
+            raise ValueError(
+                f"Flow class {flow_class.__qualname__} must be defined at module "
+                "level to run methods on a work queue"
+            )
+
+        self._persistence.save_state(self.flow_id, method_name, self._state)
+        item_id = await asyncio.to_thread(
+            self.work_queue.enqueue,
+            {
+                "flow_class": f"{flow_class.__module__}:{flow_class.__qualname__}",
+                "flow_id": self.flow_id,
+                "method": method_name,
+                "args": to_serializable(list(args), max_depth=32),
+                "kwargs": to_serializable(kwargs, max_depth=32),
+            },
+        )
+
+        delay = 0.01
+        while True:
+            outcome = await asyncio.to_thread(self.work_queue.pop_result, item_id)
+            if outcome is not None:
+                break
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+        if not outcome.succeeded:
+            raise RuntimeError(
+                f"Method '{method_name}' failed on a flow worker: {outcome.error}"
+            )
+        self._apply_state_patch(outcome.result["state_patch"])
+        return outcome.result["result"]
+
+    def _apply_state_patch(self, patch: JsonPatch) -> None:
+        """Merge state changes made by a worker into the flow's state."""
+        if not patch:
+            return
+        if isinstance(self._state, dict):
+            apply_patch(self._state, patch)
+            return
+
+        model = cast(BaseModel, self._state)
+        patched = type(model).model_validate(
+            apply_patch(model.model_dump(mode="json"), patch)
+        )
+        # Only copy the fields the worker changed, keeping concurrent changes
+        # to the other fields
+        for field_name in {
+            operation["path"].split("/")[1].replace("~1", "/").replace("~0", "~")
+            for operation in patch
+        }:
+            setattr(model, field_name, getattr(patched, field_name))
+
+    def _get_concurrency_limiter(self) -> Optional[asyncio.Semaphore]:
+        if self.max_concurrency is None:
+            return None
+        if self._concurrency_limiter is None:
+            self._concurrency_limiter = asyncio.Semaphore(self.max_concurrency)
+        return self._concurrency_limiter
+
+    def _get_executor(self, executor_type: str) -> concurrent.futures.Executor:
+        if executor_type == "thread" and self._shared_executor is not None:
+            return self._shared_executor
+        if executor_type not in self._executors:
+            if executor_type == "process":
+                self._executors[executor_type] = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_concurrency
+                )
+            else:
+                self._executors[executor_type] = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="crewai_flow",
+                )
+        return self._executors[executor_type]
+
+    def _shutdown_executors(self) -> None:
+        executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=False)
+
     async def _execute_listeners(self, trigger_method: str, result: Any) -> None:
         """
         Executes all listeners and routers triggered by a method completion.
@@ -911,9 +1400,10 @@ class Flow(Generic[T], metaclass=FlowMeta):
                 break
 
             for router_name in routers_triggered:
-                await self._execute_single_listener(router_name, result)
-                # After executing router, the router's result is the path
-                router_result = self._method_outputs[-1]
+                # The router's result is the path
+                router_result = await self._execute_single_listener(
+                    router_name, result
+                )
                 if router_result:  # Only add non-None results
                     router_results.append(router_result)
                 current_trigger = (
@@ -962,37 +1452,29 @@ class Flow(Generic[T], metaclass=FlowMeta):
         - Handles both OR and AND conditions:
           * OR: Triggers if any condition is met
           * AND: Triggers only when all conditions are met
-        - Maintains state for AND conditions using _pending_and_listeners
+        - Only looks at methods indexed under the trigger by FlowMeta
+        - Tracks AND conditions as bitsets in _and_listener_progress
         - Separates router and normal listener evaluation
         """
+        index = self._router_triggers if router_only else self._listener_triggers
         triggered = []
-        for listener_name, (condition_type, methods) in self._listeners.items():
-            is_router = listener_name in self._routers
-
-            if router_only != is_router:
+        for listener_name, bit in index.get(trigger_method, ()):
+            if not bit:
+                # OR condition: any trigger is enough
+                triggered.append(listener_name)
                 continue
 
-            if condition_type == "OR":
-                # If the trigger_method matches any in methods, run this
-                if trigger_method in methods:
-                    triggered.append(listener_name)
-            elif condition_type == "AND":
-                # Initialize pending methods for this listener if not already done
-                if listener_name not in self._pending_and_listeners:
-                    self._pending_and_listeners[listener_name] = set(methods)
-                # Remove the trigger method from pending methods
-                if trigger_method in self._pending_and_listeners[listener_name]:
-                    self._pending_and_listeners[listener_name].discard(trigger_method)
-
-                if not self._pending_and_listeners[listener_name]:
-                    # All required methods have been executed
-                    triggered.append(listener_name)
-                    # Reset pending methods for this listener
-                    self._pending_and_listeners.pop(listener_name, None)
+            received = self._and_listener_progress.get(listener_name, 0) | bit
+            if received == self._and_masks[listener_name]:
+                # All required methods have been executed
+                triggered.append(listener_name)
+                self._and_listener_progress.pop(listener_name, None)
+            else:
+                self._and_listener_progress[listener_name] = received
 
         return triggered
 
-    async def _execute_single_listener(self, listener_name: str, result: Any) -> None:
+    async def _execute_single_listener(self, listener_name: str, result: Any) -> Any:
         """
         Executes a single listener method with proper event handling.
 
@@ -1007,6 +1489,11 @@ class Flow(Generic[T], metaclass=FlowMeta):
             The result from the triggering method, which may be passed
             to the listener if it accepts parameters.
 
+        Returns
+        -------
+        Any
+            The listener's result.
+
         Notes
         -----
         - Inspects method signature to determine if it accepts the trigger result
@@ -1036,6 +1523,7 @@ class Flow(Generic[T], metaclass=FlowMeta):
 
             # Execute listeners (and possibly routers) of this listener
             await self._execute_listeners(listener_name, listener_result)
+            return listener_result
 
         except Exception as e:
             print(
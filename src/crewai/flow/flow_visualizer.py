@@ -116,6 +116,8 @@ class FlowPlot:
             except Exception as e:
                 raise RuntimeError(f"Failed to add edges to network: {str(e)}")
 
+            self._annotate_network(net)
+
             # Generate HTML
             try:
                 network_html = net.generate_html()
@@ -138,6 +140,16 @@ class FlowPlot:
         finally:
             self._cleanup_pyvis_lib()
 
+    def _annotate_network(self, net):
+        """
+        Hook to restyle the nodes and edges before the network is rendered.
+
+        Parameters
+        ----------
+        net : pyvis.network.Network
+            The network holding one node per flow method.
+        """
+
     def _generate_final_html(self, network_html):
         """
         Generate the final HTML content with network visualization and legend.
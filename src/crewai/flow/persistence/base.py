@@ -1,7 +1,7 @@
 """Base class for flow state persistence."""
 
 import abc
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -51,3 +51,58 @@ class FlowPersistence(abc.ABC):
             The most recent state as a dictionary, or None if no state exists
         """
         pass
+
+    def supports_method_outputs(self) -> bool:
+        """Whether this backend stores method outputs.
+
+        Flows only enable `persist_method_outputs` and `checkpoint` with
+        backends returning True here.
+
+        Returns:
+            False by default; backends implementing `save_method_output` and
+            `load_method_outputs` should return True.
+        """
+        return False
+
+    def save_method_output(self, flow_uuid: str, method_name: str, output: Any) -> None:
+        """Persist the output of a completed flow method.
+
+        Does nothing by default, for backends that do not store method outputs.
+
+        Args:
+            flow_uuid: Unique identifier for the flow instance
+            method_name: Name of the method that produced the output
+            output: The method's return value
+        """
+
+    def load_method_outputs(self, flow_uuid: str) -> List[Tuple[str, Any]]:
+        """Load the persisted method outputs of a flow, oldest first.
+
+        Args:
+            flow_uuid: Unique identifier for the flow instance
+
+        Returns:
+            (method name, output) pairs in the order the methods completed,
+            empty for backends that do not store method outputs
+        """
+        return []
+
+    def save_checkpoint(
+        self,
+        flow_uuid: str,
+        method_name: str,
+        state_data: Union[Dict[str, Any], BaseModel],
+        output: Any,
+    ) -> None:
+        """Persist the state and the output of a completed method.
+
+        Backends able to write both atomically should override this.
+
+        Args:
+            flow_uuid: Unique identifier for the flow instance
+            method_name: Name of the method that just completed
+            state_data: Current state data (either dict or Pydantic model)
+            output: The method's return value
+        """
+        self.save_state(flow_uuid, method_name, state_data)
+        self.save_method_output(flow_uuid, method_name, output)
@@ -0,0 +1,85 @@
+"""
+Minimal JSON Patch (RFC 6902) support for flow state deltas.
+
+Only the "add", "remove" and "replace" operations are produced and applied,
+which is all that is needed to describe the difference between two JSON
+documents.
+"""
+
+from typing import Any, Dict, List
+
+JsonPatch = List[Dict[str, Any]]
+
+
+def _escape(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> JsonPatch:
+    """Return the operations turning the JSON document `old` into `new`.
+
+    Dictionaries are diffed key by key. Lists that only grew at the end
+    produce one "add" per appended item; any other list change replaces
+    the whole list.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        patch: JsonPatch = []
+        for key in old:
+            if key not in new:
+                patch.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                patch.append({"op": "add", "path": child, "value": value})
+            else:
+                patch.extend(make_patch(old[key], value, child))
+        return patch
+
+    if isinstance(old, list) and isinstance(new, list):
+        if len(new) >= len(old) and new[: len(old)] == old:
+            return [
+                {"op": "add", "path": f"{path}/{index}", "value": new[index]}
+                for index in range(len(old), len(new))
+            ]
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if type(old) is type(new) and old == new:
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, patch: JsonPatch) -> Any:
+    """Apply `patch` to `document` in place and return the patched document."""
+    for operation in patch:
+        path = operation["path"]
+        if not path:
+            # Only "replace" can target the whole document
+            document = operation["value"]
+            continue
+
+        tokens = [_unescape(token) for token in path.split("/")[1:]]
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+
+        key = tokens[-1]
+        op = operation["op"]
+        if isinstance(parent, list):
+            if op == "add":
+                if key == "-":
+                    parent.append(operation["value"])
+                else:
+                    parent.insert(int(key), operation["value"])
+            elif op == "remove":
+                del parent[int(key)]
+            else:
+                parent[int(key)] = operation["value"]
+        elif op == "remove":
+            del parent[key]
+        else:
+            parent[key] = operation["value"]
+    return document
@@ -2,15 +2,87 @@
 SQLite-based implementation of flow state persistence.
 """
 
+import importlib
 import json
+import os
 import sqlite3
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
 from crewai.flow.persistence.base import FlowPersistence
+from crewai.flow.persistence.json_patch import apply_patch, make_patch
+from crewai.utilities.serialization import to_serializable
+
+SNAPSHOT = "snapshot"
+DELTA = "delta"
+
+
+def _load_model_class(output_type: str) -> Type[BaseModel]:
+    module_name, _, qualname = output_type.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        target = getattr(target, attribute)
+    if not (isinstance(target, type) and issubclass(target, BaseModel)):
+        raise TypeError(f"{output_type} is not a Pydantic model")
+    return target
+
+
+def _decode_output(output_json: str, output_type: Optional[str]) -> Any:
+    data = json.loads(output_json)
+    if output_type is None:
+        return data
+    try:
+        return _load_model_class(output_type).model_validate(data)
+    except Exception:
+        # The model class is gone or changed; keep the stored data
+        return data
+
+
+def _encode_output(
+    method_name: str, output: Any, checkpoint: bool
+) -> Tuple[str, Optional[str]]:
+    """Serialize a method output, recording the class of Pydantic models.
+
+    Checkpointed outputs are passed to listeners again on resume, so they
+    must come back unchanged. Outputs that would not are rejected instead
+    of being silently replaced by their JSON form.
+    """
+    if isinstance(output, BaseModel):
+        model_class = type(output)
+        output_type = f"{model_class.__module__}:{model_class.__qualname__}"
+        error: Optional[Exception] = None
+        try:
+            # Validating the field values applies the coercions a reload
+            # would, such as a dict default becoming a nested model
+            output_json = model_class.model_validate(dict(output)).model_dump_json(
+                serialize_as_any=True
+            )
+            restored = _load_model_class(output_type).model_validate_json(output_json)
+            if restored.model_dump_json(serialize_as_any=True) == output_json:
+                return output_json, output_type
+        except Exception as e:
+            error = e
+        if checkpoint:
+            raise ValueError(
+                f"Cannot checkpoint the output of {method_name}: the "
+                f"{model_class.__qualname__} model cannot be rebuilt from JSON. "
+                "Checkpointed models must be importable, module-level classes "
+                "whose fields round-trip through model_dump_json."
+            ) from error
+    output_json = json.dumps(to_serializable(output, max_depth=32))
+    if checkpoint and json.loads(output_json) != output:
+        raise ValueError(
+            f"Cannot checkpoint the output of {method_name}: "
+            f"{type(output).__name__} values do not round-trip through JSON. "
+            "Return JSON-native values (dicts, lists, strings, numbers, booleans, "
+            "None) or Pydantic models."
+        )
+    return output_json, None
 
 
 class SQLiteFlowPersistence(FlowPersistence):
@@ -19,16 +91,36 @@ class SQLiteFlowPersistence(FlowPersistence):
     This class provides a simple, file-based persistence implementation using SQLite.
     It's suitable for development and testing, or for production use cases with
     moderate performance requirements.
+
+    Each saved state is written either as a full snapshot or as a JSON Patch
+    delta against the previously saved state of the same flow, with a fresh
+    snapshot every `snapshot_interval` saves. A delta is only written when
+    the flow's latest stored row is the one this instance wrote last, so
+    several instances or processes may save the same flow to one database.
+    Saves from concurrent methods
+    are group-committed in a single transaction over one shared WAL-mode
+    connection, and rows made obsolete by a newer snapshot are deleted by a
+    background compaction thread.
     """
 
     db_path: str
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        snapshot_interval: int = 20,
+        compact: bool = True,
+        max_cached_states: int = 128,
+    ):
         """Initialize SQLite persistence.
 
         Args:
             db_path: Path to the SQLite database file. If not provided, uses
                     db_storage_path() from utilities.paths.
+            snapshot_interval: Number of saves per flow between full snapshots.
+            compact: Whether to delete rows superseded by a newer snapshot.
+            max_cached_states: Number of flows whose last saved state is kept
+                    in memory to compute deltas.
 
         Raises:
             ValueError: If db_path is invalid
@@ -42,29 +134,116 @@ class SQLiteFlowPersistence(FlowPersistence):
             raise ValueError("Database path must be provided")
 
         self.db_path = path  # Now mypy knows this is str
+        self.snapshot_interval = max(1, snapshot_interval)
+        self.compact = compact
+        self.max_cached_states = max_cached_states
+        self._setup_runtime()
         self.init_db()
 
+    def _setup_runtime(self) -> None:
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._lock = threading.RLock()
+        self._pending_lock = threading.Lock()
+        # (table, row) pairs waiting for the next group commit
+        self._pending: List[Tuple[str, Tuple[Any, ...]]] = []
+        # flow_uuid -> (last saved state, saves since the last snapshot)
+        self._last_states: "OrderedDict[str, Tuple[Dict[str, Any], int]]" = (
+            OrderedDict()
+        )
+        # flow_uuid -> id of the last state row this instance stored
+        self._stored_ids: "OrderedDict[str, Optional[int]]" = OrderedDict()
+        self._compaction_thread: Optional[threading.Thread] = None
+        self._compaction_requested = False
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Connections, locks and caches stay with the process that owns them
+        return {
+            "db_path": self.db_path,
+            "snapshot_interval": self.snapshot_interval,
+            "compact": self.compact,
+            "max_cached_states": self.max_cached_states,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._setup_runtime()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the shared connection, reopening it after a fork."""
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the shared connection."""
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
     def init_db(self) -> None:
         """Create the necessary tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        with self._lock:
+            conn = self._get_connection()
+            with conn:
+                conn.execute(
+                    """
+                CREATE TABLE IF NOT EXISTS flow_states (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    flow_uuid TEXT NOT NULL,
+                    method_name TEXT NOT NULL,
+                    timestamp DATETIME NOT NULL,
+                    state_json TEXT NOT NULL,
+                    kind TEXT NOT NULL DEFAULT 'snapshot'
+                )
                 """
-            CREATE TABLE IF NOT EXISTS flow_states (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                flow_uuid TEXT NOT NULL,
-                method_name TEXT NOT NULL,
-                timestamp DATETIME NOT NULL,
-                state_json TEXT NOT NULL
-            )
-            """
-            )
-            # Add index for faster UUID lookups
-            conn.execute(
+                )
+                # Databases created before deltas existed only hold snapshots
+                columns = {
+                    row[1] for row in conn.execute("PRAGMA table_info(flow_states)")
+                }
+                if "kind" not in columns:
+                    conn.execute(
+                        "ALTER TABLE flow_states ADD COLUMN kind TEXT NOT NULL DEFAULT 'snapshot'"
+                    )
+                # Add index for faster UUID lookups
+                conn.execute(
+                    """
+                CREATE INDEX IF NOT EXISTS idx_flow_states_uuid
+                ON flow_states(flow_uuid)
                 """
-            CREATE INDEX IF NOT EXISTS idx_flow_states_uuid
-            ON flow_states(flow_uuid)
-            """
-            )
+                )
+                conn.execute(
+                    """
+                CREATE TABLE IF NOT EXISTS flow_method_outputs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    flow_uuid TEXT NOT NULL,
+                    method_name TEXT NOT NULL,
+                    timestamp DATETIME NOT NULL,
+                    output_json TEXT NOT NULL,
+                    output_type TEXT
+                )
+                """
+                )
+                columns = {
+                    row[1]
+                    for row in conn.execute("PRAGMA table_info(flow_method_outputs)")
+                }
+                if "output_type" not in columns:
+                    conn.execute(
+                        "ALTER TABLE flow_method_outputs ADD COLUMN output_type TEXT"
+                    )
+                conn.execute(
+                    """
+                CREATE INDEX IF NOT EXISTS idx_flow_method_outputs_uuid
+                ON flow_method_outputs(flow_uuid)
+                """
+                )
 
     def save_state(
         self,
@@ -79,33 +258,281 @@ class SQLiteFlowPersistence(FlowPersistence):
             method_name: Name of the method that just completed
             state_data: Current state data (either dict or Pydantic model)
         """
-        # Convert state_data to dict, handling both Pydantic and dict cases
-        if isinstance(state_data, BaseModel):
-            state_dict = dict(state_data)  # Use dict() for better type compatibility
-        elif isinstance(state_data, dict):
-            state_dict = state_data
+        self._save(flow_uuid, method_name, state_data=state_data)
+
+    def supports_method_outputs(self) -> bool:
+        return True
+
+    def save_method_output(self, flow_uuid: str, method_name: str, output: Any) -> None:
+        """Save the output of a completed flow method.
+
+        Outputs are stored as JSON. Pydantic models are stored with their
+        class and rebuilt on load; other objects are loaded back in their
+        JSON-compatible form.
+
+        Args:
+            flow_uuid: Unique identifier for the flow instance
+            method_name: Name of the method that produced the output
+            output: The method's return value
+        """
+        self._save(flow_uuid, method_name, output=output, save_output=True)
+
+    def save_checkpoint(
+        self,
+        flow_uuid: str,
+        method_name: str,
+        state_data: Union[Dict[str, Any], BaseModel],
+        output: Any,
+    ) -> None:
+        """Save the state and the output of a completed method in one transaction.
+
+        Raises:
+            ValueError: If the output would not load back unchanged.
+        """
+        self._save(
+            flow_uuid,
+            method_name,
+            state_data=state_data,
+            output=output,
+            save_output=True,
+            checkpoint=True,
+        )
+
+    def _save(
+        self,
+        flow_uuid: str,
+        method_name: str,
+        state_data: Optional[Union[Dict[str, Any], BaseModel]] = None,
+        output: Any = None,
+        save_output: bool = False,
+        checkpoint: bool = False,
+    ) -> None:
+        timestamp = datetime.now(timezone.utc).isoformat()
+        state_json: Optional[str] = None
+        if state_data is not None:
+            # Convert state_data to dict, handling both Pydantic and dict cases
+            if isinstance(state_data, BaseModel):
+                state_dict = state_data.model_dump(mode="json")
+            elif isinstance(state_data, dict):
+                state_dict = state_data
+            else:
+                raise ValueError(
+                    f"state_data must be either a Pydantic BaseModel or dict, got {type(state_data)}"
+                )
+            state_json = json.dumps(state_dict)
+        output_row: Optional[Tuple[str, Optional[str]]] = (
+            _encode_output(method_name, output, checkpoint) if save_output else None
+        )
+
+        with self._pending_lock:
+            if state_json is not None:
+                kind, payload = self._encode_state(flow_uuid, state_json)
+                self._pending.append(
+                    (
+                        "state",
+                        (flow_uuid, method_name, timestamp, payload, kind, state_json),
+                    )
+                )
+            if output_row is not None:
+                self._pending.append(
+                    ("output", (flow_uuid, method_name, timestamp, *output_row))
+                )
+
+        self._commit_pending()
+
+    def _encode_state(
+        self, flow_uuid: str, state_json: str
+    ) -> Tuple[Optional[str], str]:
+        """Choose between a snapshot and a delta for the new state.
+
+        Must be called with the pending lock held. Returns the row kind, or
+        None when the state did not change, and the payload to store. Both
+        are provisional: `_commit_pending` writes a full snapshot instead
+        when another writer stored a row for the flow in the meantime.
+        """
+        # Round-trip so deltas compare exactly what a reload would produce
+        state = json.loads(state_json)
+        previous = self._last_states.pop(flow_uuid, None)
+        kind: Optional[str] = SNAPSHOT
+        if previous is None or previous[1] + 1 >= self.snapshot_interval:
+            payload, saves = state_json, 0
         else:
-            raise ValueError(
-                f"state_data must be either a Pydantic BaseModel or dict, got {type(state_data)}"
+            patch = make_patch(previous[0], state)
+            payload, saves = json.dumps(patch), previous[1] + 1
+            if not patch:
+                # Nothing changed since the last save
+                kind, saves = None, previous[1]
+            elif len(payload) < len(state_json):
+                kind = DELTA
+            else:
+                payload, saves = state_json, 0
+        self._cache_state(flow_uuid, state, saves)
+        return kind, payload
+
+    def load_method_outputs(self, flow_uuid: str) -> List[Tuple[str, Any]]:
+        """Load the saved method outputs of a flow, oldest first.
+
+        Args:
+            flow_uuid: Unique identifier for the flow instance
+
+        Returns:
+            (method name, output) pairs in the order the methods completed
+        """
+        with self._lock:
+            rows = (
+                self._get_connection()
+                .execute(
+                    """
+                SELECT method_name, output_json, output_type
+                FROM flow_method_outputs
+                WHERE flow_uuid = ?
+                ORDER BY id
+                """,
+                    (flow_uuid,),
+                )
+                .fetchall()
             )
+        return [
+            (method_name, _decode_output(output, output_type))
+            for method_name, output, output_type in rows
+        ]
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-            INSERT INTO flow_states (
-                flow_uuid,
-                method_name,
-                timestamp,
-                state_json
-            ) VALUES (?, ?, ?, ?)
-            """,
-                (
-                    flow_uuid,
-                    method_name,
-                    datetime.now(timezone.utc).isoformat(),
-                    json.dumps(state_dict),
-                ),
+    def _cache_state(self, flow_uuid: str, state: Dict[str, Any], saves: int) -> None:
+        self._last_states[flow_uuid] = (state, saves)
+        while len(self._last_states) > self.max_cached_states:
+            self._last_states.popitem(last=False)
+
+    def _commit_pending(self) -> None:
+        """Write every pending row in one transaction.
+
+        A caller blocked here while another thread commits finds its row
+        either already written by that thread or written with the rows of
+        others that queued up meanwhile, so each save returns once durable.
+        """
+        with self._lock:
+            with self._pending_lock:
+                rows, self._pending = self._pending, []
+            if not rows:
+                return
+            conn = self._get_connection()
+            wrote_snapshot = False
+            try:
+                with conn:
+                    # Hold the write lock while checking which row is latest
+                    conn.execute("BEGIN IMMEDIATE")
+                    for table, row in rows:
+                        if table == "state":
+                            wrote_snapshot |= self._insert_state(conn, *row)
+                        else:
+                            conn.execute(
+                                """
+                            INSERT INTO flow_method_outputs (
+                                flow_uuid,
+                                method_name,
+                                timestamp,
+                                output_json,
+                                output_type
+                            ) VALUES (?, ?, ?, ?, ?)
+                            """,
+                                row,
+                            )
+            except Exception:
+                # Deltas are no longer based on what is stored
+                with self._pending_lock:
+                    for _, row in rows:
+                        self._last_states.pop(row[0], None)
+                        self._stored_ids.pop(row[0], None)
+                raise
+        if wrote_snapshot and self.compact:
+            self._request_compaction()
+
+    def _insert_state(
+        self,
+        conn: sqlite3.Connection,
+        flow_uuid: str,
+        method_name: str,
+        timestamp: str,
+        payload: str,
+        kind: Optional[str],
+        state_json: str,
+    ) -> bool:
+        """Insert a state row inside the current transaction.
+
+        Deltas and skipped saves are relative to the last row this instance
+        stored. If another writer stored a row for the flow since then, the
+        full state is written as a snapshot instead. Returns whether a
+        snapshot was written.
+        """
+        if kind != SNAPSHOT:
+            (latest_id,) = conn.execute(
+                "SELECT MAX(id) FROM flow_states WHERE flow_uuid = ?", (flow_uuid,)
+            ).fetchone()
+            if latest_id is None or latest_id != self._stored_ids.get(flow_uuid):
+                payload, kind = state_json, SNAPSHOT
+        if kind is None:
+            return False
+        cursor = conn.execute(
+            """
+        INSERT INTO flow_states (
+            flow_uuid,
+            method_name,
+            timestamp,
+            state_json,
+            kind
+        ) VALUES (?, ?, ?, ?, ?)
+        """,
+            (flow_uuid, method_name, timestamp, payload, kind),
+        )
+        with self._pending_lock:
+            self._stored_ids[flow_uuid] = cursor.lastrowid
+            self._stored_ids.move_to_end(flow_uuid)
+            while len(self._stored_ids) > self.max_cached_states:
+                self._stored_ids.popitem(last=False)
+        return kind == SNAPSHOT
+
+    def _request_compaction(self) -> None:
+        with self._pending_lock:
+            self._compaction_requested = True
+            if self._compaction_thread is not None and self._compaction_thread.is_alive():
+                return
+            self._compaction_thread = threading.Thread(
+                target=self._run_compaction, name="crewai_flow_compaction", daemon=True
             )
+            self._compaction_thread.start()
+
+    def _run_compaction(self) -> None:
+        while True:
+            with self._pending_lock:
+                if not self._compaction_requested:
+                    self._compaction_thread = None
+                    return
+                self._compaction_requested = False
+            self.compact_states()
+
+    def compact_states(self) -> int:
+        """Delete rows that precede the latest snapshot of their flow.
+
+        Returns:
+            The number of deleted rows.
+        """
+        # A separate connection keeps saves from waiting on the whole scan
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                cursor = conn.execute(
+                    """
+                DELETE FROM flow_states
+                WHERE id < (
+                    SELECT MAX(latest.id)
+                    FROM flow_states AS latest
+                    WHERE latest.flow_uuid = flow_states.flow_uuid
+                    AND latest.kind = 'snapshot'
+                )
+                """
+                )
+            return cursor.rowcount
+        finally:
+            conn.close()
 
     def load_state(self, flow_uuid: str) -> Optional[Dict[str, Any]]:
         """Load the most recent state for a given flow UUID.
@@ -116,19 +543,30 @@ class SQLiteFlowPersistence(FlowPersistence):
         Returns:
             The most recent state as a dictionary, or None if no state exists
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
+        with self._lock:
+            conn = self._get_connection()
+            rows = conn.execute(
                 """
-            SELECT state_json
+            SELECT kind, state_json
             FROM flow_states
             WHERE flow_uuid = ?
-            ORDER BY id DESC
-            LIMIT 1
-            """,
-                (flow_uuid,),
+            AND id >= COALESCE(
+                (
+                    SELECT MAX(id)
+                    FROM flow_states
+                    WHERE flow_uuid = ? AND kind = 'snapshot'
+                ),
+                0
             )
-            row = cursor.fetchone()
+            ORDER BY id
+            """,
+                (flow_uuid, flow_uuid),
+            ).fetchall()
 
-        if row:
-            return json.loads(row[0])
-        return None
+        state: Optional[Dict[str, Any]] = None
+        for kind, payload in rows:
+            if kind == SNAPSHOT:
+                state = json.loads(payload)
+            elif state is not None:
+                state = apply_patch(state, json.loads(payload))
+        return state
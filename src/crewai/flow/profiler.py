@@ -0,0 +1,359 @@
+"""Per-method timing and critical-path profiling of flow runs."""
+
+import json
+import os
+import threading
+import time
+from contextlib import ExitStack
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from pydantic import BaseModel, Field
+
+from crewai.flow.config import BLACK, WHITE
+from crewai.flow.flow_visualizer import FlowPlot
+from crewai.utilities.events.crew_events import (
+    CrewKickoffCompletedEvent,
+    CrewKickoffFailedEvent,
+    CrewKickoffStartedEvent,
+)
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+from crewai.utilities.events.flow_events import (
+    FlowFinishedEvent,
+    FlowStartedEvent,
+    MethodExecutionFailedEvent,
+    MethodExecutionFinishedEvent,
+    MethodExecutionStartedEvent,
+)
+
+# Heat scale from cold (fast) to hot (slow) nodes
+COLD_RGB = (255, 240, 200)
+HOT_RGB = (255, 90, 80)
+
+
+class ProfileSpan(BaseModel):
+    """One timed execution of a flow method or of a crew."""
+
+    name: str = Field(description="Method or crew name")
+    category: str = Field(description='Either "method" or "crew"')
+    start: float = Field(description="Seconds since the epoch when execution began")
+    end: float = Field(description="Seconds since the epoch when execution ended")
+    cpu_time: Optional[float] = Field(
+        default=None, description="CPU seconds spent, when it could be measured"
+    )
+    queue_wait: Optional[float] = Field(
+        default=None, description="Seconds spent waiting for a worker"
+    )
+    failed: bool = Field(default=False, description="Whether execution raised")
+
+    @property
+    def wall_time(self) -> float:
+        return self.end - self.start
+
+
+class FlowProfiler:
+    """Event listener timing the methods of a flow and the crews they run.
+
+    Wall time spans from a method being scheduled to its completion, so it
+    includes the queue wait for a worker, which is reported separately along
+    with the CPU time of synchronous methods. Crews are attributed to the
+    flow while it is running and timed on the thread that kicked them off.
+
+    The profiler listens on its own run-scoped event bus until `close` is
+    called, or until the end of its `with` block. It only sees the flow
+    when it is kicked off from the context the profiler was created in,
+    so concurrent runs elsewhere do not show up in its profile:
+
+        with FlowProfiler(flow) as profiler:
+            flow.kickoff()
+        profiler.export_chrome_trace("trace.json")
+        profiler.plot("flow_profile")
+    """
+
+    def __init__(self, flow: Any):
+        self.flow = flow
+        self.spans: List[ProfileSpan] = []
+        self._lock = threading.Lock()
+        self._running = False
+        # method name -> start times of its executions still running
+        self._open_methods: Dict[str, List[float]] = {}
+        # (crew id, thread id) -> (crew name, start time, thread CPU time)
+        self._open_crews: Dict[Tuple[int, int], Tuple[str, float, float]] = {}
+        self._scope = ExitStack()
+        run_bus = self._scope.enter_context(crewai_event_bus.run_scope())
+        run_bus.on(FlowStartedEvent)(self._on_flow_started)
+        run_bus.on(FlowFinishedEvent)(self._on_flow_finished)
+        run_bus.on(MethodExecutionStartedEvent)(self._on_method_started)
+        run_bus.on(MethodExecutionFinishedEvent)(self._on_method_finished)
+        run_bus.on(MethodExecutionFailedEvent)(self._on_method_failed)
+        run_bus.on(CrewKickoffStartedEvent)(self._on_crew_started)
+        run_bus.on(CrewKickoffCompletedEvent)(self._on_crew_finished)
+        run_bus.on(CrewKickoffFailedEvent)(self._on_crew_failed)
+
+    def close(self) -> None:
+        """Stop listening to events, keeping the recorded spans."""
+        self._scope.close()
+
+    def __enter__(self) -> "FlowProfiler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _on_flow_started(self, source: Any, event: FlowStartedEvent) -> None:
+        if source is self.flow:
+            self._running = True
+
+    def _on_flow_finished(self, source: Any, event: FlowFinishedEvent) -> None:
+        if source is self.flow:
+            self._running = False
+
+    def _on_method_started(
+        self, source: Any, event: MethodExecutionStartedEvent
+    ) -> None:
+        if source is not self.flow:
+            return
+        with self._lock:
+            self._open_methods.setdefault(event.method_name, []).append(
+                event.timestamp.timestamp()
+            )
+
+    def _on_method_finished(
+        self, source: Any, event: MethodExecutionFinishedEvent
+    ) -> None:
+        if source is self.flow:
+            self._close_method(
+                event.method_name,
+                event.timestamp.timestamp(),
+                cpu_time=event.cpu_time,
+                queue_wait=event.queue_wait,
+            )
+
+    def _on_method_failed(self, source: Any, event: MethodExecutionFailedEvent) -> None:
+        if source is self.flow:
+            self._close_method(
+                event.method_name, event.timestamp.timestamp(), failed=True
+            )
+
+    def _close_method(self, method_name: str, end: float, **fields: Any) -> None:
+        with self._lock:
+            starts = self._open_methods.get(method_name)
+            if not starts:
+                return
+            self.spans.append(
+                ProfileSpan(
+                    name=method_name,
+                    category="method",
+                    start=starts.pop(0),
+                    end=end,
+                    **fields,
+                )
+            )
+
+    def _on_crew_started(self, source: Any, event: CrewKickoffStartedEvent) -> None:
+        if not self._running:
+            return
+        with self._lock:
+            self._open_crews[(id(source), threading.get_ident())] = (
+                event.crew_name or type(source).__name__,
+                event.timestamp.timestamp(),
+                time.thread_time(),
+            )
+
+    def _on_crew_finished(
+        self, source: Any, event: CrewKickoffCompletedEvent
+    ) -> None:
+        self._close_crew(source, event.timestamp.timestamp(), failed=False)
+
+    def _on_crew_failed(self, source: Any, event: CrewKickoffFailedEvent) -> None:
+        self._close_crew(source, event.timestamp.timestamp(), failed=True)
+
+    def _close_crew(self, source: Any, end: float, failed: bool) -> None:
+        with self._lock:
+            opened = self._open_crews.pop((id(source), threading.get_ident()), None)
+            if opened is None:
+                return
+            name, start, cpu_start = opened
+            self.spans.append(
+                ProfileSpan(
+                    name=name,
+                    category="crew",
+                    start=start,
+                    end=end,
+                    cpu_time=time.thread_time() - cpu_start,
+                    failed=failed,
+                )
+            )
+
+    def summary(self, category: str = "method") -> Dict[str, Dict[str, float]]:
+        """Aggregate the recorded spans of a category by name.
+
+        Returns:
+            For each method or crew name, its number of calls and its total
+            wall, CPU and queue-wait seconds
+        """
+        totals: Dict[str, Dict[str, float]] = {}
+        for span in list(self.spans):
+            if span.category != category:
+                continue
+            entry = totals.setdefault(
+                span.name,
+                {"calls": 0, "wall_time": 0.0, "cpu_time": 0.0, "queue_wait": 0.0},
+            )
+            entry["calls"] += 1
+            entry["wall_time"] += span.wall_time
+            entry["cpu_time"] += span.cpu_time or 0.0
+            entry["queue_wait"] += span.queue_wait or 0.0
+        return totals
+
+    def _trigger_methods(self, method_name: str) -> Set[str]:
+        """Return the methods whose completion can trigger `method_name`."""
+        condition = self.flow._listeners.get(method_name)
+        if condition is None:
+            return set()
+        triggers: Set[str] = set()
+        for trigger in condition[1]:
+            if trigger in self.flow._methods:
+                triggers.add(trigger)
+                continue
+            # Router paths are labels returned by routers, not method names
+            routers = {
+                router
+                for router in self.flow._routers
+                if trigger in self.flow._router_paths.get(router, [])
+            }
+            triggers.update(routers or self.flow._routers)
+        return triggers
+
+    def critical_path(self) -> List[ProfileSpan]:
+        """Return the chain of method executions that determined the run time.
+
+        Starting from the execution that finished last, each step goes back
+        to the latest finishing execution among the methods able to trigger
+        it, which is the one that released it.
+        """
+        methods = [span for span in self.spans if span.category == "method"]
+        if not methods:
+            return []
+
+        current = max(methods, key=lambda span: span.end)
+        path = [current]
+        while True:
+            triggers = self._trigger_methods(current.name)
+            candidates = [
+                span
+                for span in methods
+                if span.name in triggers and span.end <= current.start
+            ]
+            if not candidates:
+                break
+            current = max(candidates, key=lambda span: span.end)
+            path.append(current)
+        path.reverse()
+        return path
+
+    def export_chrome_trace(self, path: Optional[str] = None) -> Dict[str, Any]:
+        """Build a Chrome trace-event document of the recorded spans.
+
+        The result can be loaded in chrome://tracing or Perfetto. Overlapping
+        spans are laid out on separate rows.
+
+        Args:
+            path: File to write the trace to as JSON
+
+        Returns:
+            The trace document
+        """
+        spans = sorted(self.spans, key=lambda span: span.start)
+        origin = spans[0].start if spans else 0.0
+        pid = os.getpid()
+        flow_name = self.flow.name or type(self.flow).__name__
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": flow_name},
+            }
+        ]
+        lanes: List[float] = []
+        for span in spans:
+            lane = next(
+                (index for index, end in enumerate(lanes) if end <= span.start),
+                len(lanes),
+            )
+            if lane == len(lanes):
+                lanes.append(span.end)
+            else:
+                lanes[lane] = span.end
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": (span.start - origin) * 1e6,
+                    "dur": span.wall_time * 1e6,
+                    "pid": pid,
+                    "tid": lane,
+                    "args": {
+                        "cpu_time": span.cpu_time,
+                        "queue_wait": span.queue_wait,
+                        "failed": span.failed,
+                    },
+                }
+            )
+
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(trace, f)
+        return trace
+
+    def plot(self, filename: str = "flow_profile") -> None:
+        """Save the flow plot with methods colored by their wall time.
+
+        Args:
+            filename: Output filename without extension
+        """
+        FlowProfilePlot(self.flow, self).plot(filename)
+
+
+def _heat_color(heat: float) -> str:
+    red, green, blue = (
+        round(cold + (hot - cold) * heat) for cold, hot in zip(COLD_RGB, HOT_RGB)
+    )
+    return f"#{red:02X}{green:02X}{blue:02X}"
+
+
+class FlowProfilePlot(FlowPlot):
+    """Flow plot annotated with the timings recorded by a `FlowProfiler`.
+
+    Executed methods are colored from cold to hot by total wall time and
+    labeled with it; methods on the critical path get a thick border.
+    """
+
+    def __init__(self, flow: Any, profiler: FlowProfiler):
+        super().__init__(flow)
+        self.profiler = profiler
+
+    def _annotate_network(self, net: Any) -> None:
+        stats = self.profiler.summary()
+        critical = {span.name for span in self.profiler.critical_path()}
+        slowest = max((entry["wall_time"] for entry in stats.values()), default=0.0)
+        for node in net.nodes:
+            entry = stats.get(node["id"])
+            if entry is None:
+                continue
+            heat = entry["wall_time"] / slowest if slowest else 0.0
+            node["color"] = {
+                "background": _heat_color(heat),
+                "border": BLACK if node["id"] in critical else _heat_color(heat),
+            }
+            node["borderWidth"] = 4 if node["id"] in critical else 1
+            node["font"] = {"multi": "html", "color": WHITE if heat > 0.6 else BLACK}
+            node["label"] = f"{node['label']}\n{entry['wall_time']:.3f}s"
+            node["title"] = (
+                f"calls: {int(entry['calls'])}\n"
+                f"wall: {entry['wall_time']:.3f}s\n"
+                f"cpu: {entry['cpu_time']:.3f}s\n"
+                f"queue wait: {entry['queue_wait']:.3f}s"
+            )
@@ -0,0 +1,18 @@
+"""
+CrewAI Flow Work Queues.
+
+This module provides queues and workers for running flow methods in other
+processes.
+"""
+
+from crewai.flow.work_queue.base import FlowWorkQueue, WorkItem, WorkResult
+from crewai.flow.work_queue.sqlite import SQLiteFlowWorkQueue
+from crewai.flow.work_queue.worker import FlowWorker
+
+__all__ = [
+    "FlowWorkQueue",
+    "FlowWorker",
+    "SQLiteFlowWorkQueue",
+    "WorkItem",
+    "WorkResult",
+]
@@ -0,0 +1,92 @@
+"""Base class for flow work queues."""
+
+import abc
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class WorkItem(BaseModel):
+    """A method execution claimed from a work queue."""
+
+    id: str = Field(description="Identifier assigned by the queue")
+    payload: Dict[str, Any] = Field(description="The enqueued message")
+    attempts: int = Field(
+        default=1, description="Number of times the item has been claimed"
+    )
+
+
+class WorkResult(BaseModel):
+    """The outcome of a finished work item."""
+
+    succeeded: bool = Field(description="Whether the method completed")
+    result: Any = Field(default=None, description="Message published on completion")
+    error: Optional[str] = Field(default=None, description="Failure description")
+
+
+class FlowWorkQueue(abc.ABC):
+    """Abstract base class for queues distributing flow method executions.
+
+    Messages are JSON-serializable dictionaries. A worker claims an item for
+    a limited lease and either completes or fails it; items whose lease
+    expires, e.g. because their worker died, are handed out again. Brokers
+    such as Redis or SQS fit this interface by mapping claims to their
+    visibility timeouts and completions to a reply queue.
+    """
+
+    @abc.abstractmethod
+    def enqueue(self, payload: Dict[str, Any]) -> str:
+        """Add a message to the queue.
+
+        Args:
+            payload: JSON-serializable message
+
+        Returns:
+            The identifier of the new work item
+        """
+        pass
+
+    @abc.abstractmethod
+    def claim(self, lease_seconds: float = 300.0) -> Optional[WorkItem]:
+        """Claim the oldest available work item.
+
+        Args:
+            lease_seconds: Time after which an unfinished claim expires and
+                the item becomes available again
+
+        Returns:
+            The claimed item, or None if the queue is empty
+        """
+        pass
+
+    @abc.abstractmethod
+    def complete(self, item_id: str, result: Dict[str, Any]) -> None:
+        """Mark a claimed item as done and publish its result.
+
+        Args:
+            item_id: Identifier of the claimed item
+            result: JSON-serializable completion message
+        """
+        pass
+
+    @abc.abstractmethod
+    def fail(self, item_id: str, error: str) -> None:
+        """Mark a claimed item as failed.
+
+        Args:
+            item_id: Identifier of the claimed item
+            error: Description of the failure
+        """
+        pass
+
+    @abc.abstractmethod
+    def pop_result(self, item_id: str) -> Optional[WorkResult]:
+        """Return and remove the outcome of a finished item.
+
+        Args:
+            item_id: Identifier returned by `enqueue`
+
+        Returns:
+            The outcome, or None while the item is still pending or running
+        """
+        pass
@@ -0,0 +1,198 @@
+"""
+SQLite-based implementation of a flow work queue.
+"""
+
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from crewai.flow.work_queue.base import FlowWorkQueue, WorkItem, WorkResult
+
+PENDING = "pending"
+CLAIMED = "claimed"
+DONE = "done"
+FAILED = "failed"
+
+
+class SQLiteFlowWorkQueue(FlowWorkQueue):
+    """SQLite-based work queue shared by the processes of one machine.
+
+    Every operation runs in its own short transaction on a WAL-mode
+    database, so coordinators and workers in separate processes can use the
+    same file concurrently. Claims take the write lock up front, which makes
+    handing an item to exactly one worker atomic.
+    """
+
+    db_path: str
+
+    def __init__(self, db_path: Optional[str] = None, max_attempts: int = 3):
+        """Initialize the SQLite work queue.
+
+        Args:
+            db_path: Path to the SQLite database file. If not provided, uses
+                    db_storage_path() from utilities.paths.
+            max_attempts: Number of claims after which an item whose lease
+                    keeps expiring is marked as failed.
+
+        Raises:
+            ValueError: If db_path is invalid
+        """
+        from crewai.utilities.paths import db_storage_path
+
+        path = db_path or str(Path(db_storage_path()) / "flow_work_queue.db")
+
+        if not path:
+            raise ValueError("Database path must be provided")
+
+        self.db_path = path
+        self.max_attempts = max(1, max_attempts)
+        self.init_db()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def init_db(self) -> None:
+        """Create the queue table if it doesn't exist."""
+        with self._transaction() as conn:
+            conn.execute(
+                """
+            CREATE TABLE IF NOT EXISTS flow_work_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                payload_json TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_expires_at REAL,
+                result_json TEXT,
+                error TEXT,
+                created_at REAL NOT NULL
+            )
+            """
+            )
+            conn.execute(
+                """
+            CREATE INDEX IF NOT EXISTS idx_flow_work_items_status
+            ON flow_work_items(status, id)
+            """
+            )
+
+    def enqueue(self, payload: Dict[str, Any]) -> str:
+        payload_json = json.dumps(payload)
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                """
+            INSERT INTO flow_work_items (payload_json, status, created_at)
+            VALUES (?, ?, ?)
+            """,
+                (payload_json, PENDING, time.time()),
+            )
+        return str(cursor.lastrowid)
+
+    def claim(self, lease_seconds: float = 300.0) -> Optional[WorkItem]:
+        now = time.time()
+        with self._transaction() as conn:
+            while True:
+                row = conn.execute(
+                    """
+                SELECT id, payload_json, attempts
+                FROM flow_work_items
+                WHERE status = ?
+                   OR (status = ? AND lease_expires_at < ?)
+                ORDER BY id
+                LIMIT 1
+                """,
+                    (PENDING, CLAIMED, now),
+                ).fetchone()
+                if row is None:
+                    return None
+
+                item_id, payload_json, attempts = row
+                if attempts >= self.max_attempts:
+                    # Every previous worker died or timed out on this item
+                    conn.execute(
+                        "UPDATE flow_work_items SET status = ?, error = ? WHERE id = ?",
+                        (
+                            FAILED,
+                            f"Lease expired {attempts} times without completion",
+                            item_id,
+                        ),
+                    )
+                    continue
+
+                conn.execute(
+                    """
+                UPDATE flow_work_items
+                SET status = ?, attempts = ?, lease_expires_at = ?
+                WHERE id = ?
+                """,
+                    (CLAIMED, attempts + 1, now + lease_seconds, item_id),
+                )
+                return WorkItem(
+                    id=str(item_id),
+                    payload=json.loads(payload_json),
+                    attempts=attempts + 1,
+                )
+
+    def complete(self, item_id: str, result: Dict[str, Any]) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE flow_work_items SET status = ?, result_json = ? WHERE id = ?",
+                (DONE, json.dumps(result), int(item_id)),
+            )
+
+    def fail(self, item_id: str, error: str) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE flow_work_items SET status = ?, error = ? WHERE id = ?",
+                (FAILED, error, int(item_id)),
+            )
+
+    def pop_result(self, item_id: str) -> Optional[WorkResult]:
+        # Polls are reads; only a finished item takes the write lock
+        with self._reader() as conn:
+            row = conn.execute(
+                """
+            SELECT status, result_json, error
+            FROM flow_work_items
+            WHERE id = ? AND status IN (?, ?)
+            """,
+                (int(item_id), DONE, FAILED),
+            ).fetchone()
+        if row is None:
+            return None
+        with self._transaction() as conn:
+            deleted = conn.execute(
+                "DELETE FROM flow_work_items WHERE id = ?", (int(item_id),)
+            ).rowcount
+        if not deleted:
+            # Popped by another caller in the meantime
+            return None
+
+        status, result_json, error = row
+        return WorkResult(
+            succeeded=status == DONE,
+            result=json.loads(result_json) if result_json is not None else None,
+            error=error,
+        )
@@ -0,0 +1,136 @@
+"""Worker executing flow methods pulled from a work queue."""
+
+import asyncio
+import importlib
+import json
+import logging
+import threading
+import traceback
+from typing import Any, Dict, Optional, Type
+
+from pydantic import BaseModel
+
+from crewai.flow.persistence.base import FlowPersistence
+from crewai.flow.persistence.json_patch import make_patch
+from crewai.flow.work_queue.base import FlowWorkQueue
+from crewai.utilities.serialization import to_serializable
+
+logger = logging.getLogger(__name__)
+
+
+def _import_flow_class(path: str) -> Type[Any]:
+    module_name, _, qualname = path.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        target = getattr(target, attribute)
+    return target
+
+
+def _dump_state(state: Any) -> Dict[str, Any]:
+    if isinstance(state, BaseModel):
+        return state.model_dump(mode="json")
+    return json.loads(json.dumps(state))
+
+
+class FlowWorker:
+    """Runs flow methods dispatched to a work queue.
+
+    For each message the worker instantiates the flow class, restores the
+    flow's state from the persistence backend, runs the method and publishes
+    its return value together with the JSON Patch of the state changes it
+    made. The coordinating flow applies the patch to its own state and
+    triggers the method's listeners, so workers never write flow state.
+
+    Workers can run in any process sharing the queue and the persistence
+    backend, as long as they can import the flow classes they are sent.
+    """
+
+    def __init__(
+        self,
+        queue: FlowWorkQueue,
+        persistence: FlowPersistence,
+        lease_seconds: float = 300.0,
+        poll_interval: float = 0.5,
+    ):
+        """Initialize the worker.
+
+        Args:
+            queue: Queue to claim method executions from
+            persistence: Backend holding the state of the dispatched flows
+            lease_seconds: Time a claimed method may run before it is handed
+                    to another worker
+            poll_interval: Seconds to wait before polling an empty queue again
+        """
+        self.queue = queue
+        self.persistence = persistence
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+
+    def run(
+        self,
+        stop_event: Optional[threading.Event] = None,
+        max_items: Optional[int] = None,
+    ) -> int:
+        """Process work items until stopped.
+
+        Args:
+            stop_event: Event that stops the worker once set
+            max_items: Number of items after which the worker returns
+
+        Returns:
+            The number of processed items
+        """
+        stop_event = stop_event or threading.Event()
+        processed = 0
+        while not stop_event.is_set():
+            if max_items is not None and processed >= max_items:
+                break
+            if self.run_once():
+                processed += 1
+            else:
+                stop_event.wait(self.poll_interval)
+        return processed
+
+    def run_once(self) -> bool:
+        """Process one work item.
+
+        Returns:
+            False if the queue had no item available
+        """
+        item = self.queue.claim(lease_seconds=self.lease_seconds)
+        if item is None:
+            return False
+
+        try:
+            result = self.execute(item.payload)
+        except Exception:
+            logger.exception("Flow method %s failed", item.payload.get("method"))
+            self.queue.fail(item.id, traceback.format_exc())
+        else:
+            self.queue.complete(item.id, result)
+        return True
+
+    def execute(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the flow method described by a work item payload.
+
+        Returns:
+            The method's result and the patch of its state changes
+        """
+        flow_class = _import_flow_class(payload["flow_class"])
+        flow = flow_class(persistence=self.persistence)
+        stored_state = self.persistence.load_state(payload["flow_id"])
+        if stored_state is None:
+            raise ValueError(f"No persisted state for flow {payload['flow_id']}")
+        flow._restore_state(stored_state)
+
+        method = flow._methods[payload["method"]]
+        before = _dump_state(flow.state)
+        if asyncio.iscoroutinefunction(method):
+            result = asyncio.run(method(*payload["args"], **payload["kwargs"]))
+        else:
+            result = method(*payload["args"], **payload["kwargs"])
+
+        return {
+            "result": to_serializable(result, max_depth=32),
+            "state_patch": make_patch(before, _dump_state(flow.state)),
+        }
@@ -1,10 +1,14 @@
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
-from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.knowledge.storage.base_knowledge_storage import (
+    BaseKnowledgeStorage,
+    retrieval_options,
+)
+from crewai.knowledge.utils.knowledge_utils import merge_knowledge_results
 
 os.environ["TOKENIZERS_PARALLELISM"] = "false"  # removes logging from fastembed
 
@@ -14,13 +18,13 @@ class Knowledge(BaseModel):
     Knowledge is a collection of sources and setup for the vector store to save and query relevant context.
     Args:
         sources: List[BaseKnowledgeSource] = Field(default_factory=list)
-        storage: Optional[KnowledgeStorage] = Field(default=None)
+        storage: Optional[BaseKnowledgeStorage] = Field(default=None)
         embedder: Optional[Dict[str, Any]] = None
     """
 
     sources: List[BaseKnowledgeSource] = Field(default_factory=list)
     model_config = ConfigDict(arbitrary_types_allowed=True)
-    storage: Optional[KnowledgeStorage] = Field(default=None)
+    storage: Optional[BaseKnowledgeStorage] = Field(default=None)
     embedder: Optional[Dict[str, Any]] = None
     collection_name: Optional[str] = None
 
@@ -29,13 +33,16 @@ class Knowledge(BaseModel):
         collection_name: str,
         sources: List[BaseKnowledgeSource],
         embedder: Optional[Dict[str, Any]] = None,
-        storage: Optional[KnowledgeStorage] = None,
+        storage: Optional[BaseKnowledgeStorage] = None,
         **data,
     ):
         super().__init__(**data)
         if storage:
             self.storage = storage
         else:
+            # Imported here so that chromadb only loads once knowledge is used
+            from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+
             self.storage = KnowledgeStorage(
                 embedder=embedder, collection_name=collection_name
             )
@@ -43,11 +50,17 @@ class Knowledge(BaseModel):
         self.storage.initialize_knowledge_storage()
 
     def query(
-        self, query: List[str], results_limit: int = 3, score_threshold: float = 0.35
+        self,
+        query: List[str],
+        results_limit: int = 3,
+        score_threshold: float = 0.35,
+        hybrid_search: bool = False,
+        candidates_limit: int = 20,
+        reranker_model: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Query across all knowledge sources to find the most relevant information.
-        Returns the top_k most relevant chunks.
+        Returns the top_k most relevant chunks across all queries.
 
         Raises:
             ValueError: If storage is not initialized.
@@ -59,9 +72,36 @@ class Knowledge(BaseModel):
             query,
             limit=results_limit,
             score_threshold=score_threshold,
+            **retrieval_options(hybrid_search, candidates_limit, reranker_model),
         )
         return results
 
+    def query_batch(
+        self,
+        queries: List[str],
+        results_limit: int = 3,
+        score_threshold: float = 0.35,
+        hybrid_search: bool = False,
+        candidates_limit: int = 20,
+        reranker_model: Optional[str] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Query the knowledge sources with several queries at once.
+        Returns the top_k most relevant chunks for each query, in query order.
+
+        Raises:
+            ValueError: If storage is not initialized.
+        """
+        return query_knowledge_batch(
+            [self],
+            queries,
+            results_limit=results_limit,
+            score_threshold=score_threshold,
+            hybrid_search=hybrid_search,
+            candidates_limit=candidates_limit,
+            reranker_model=reranker_model,
+        )
+
     def add_sources(self):
         try:
             for source in self.sources:
@@ -75,3 +115,60 @@ class Knowledge(BaseModel):
             self.storage.reset()
         else:
             raise ValueError("Storage is not initialized.")
+
+
+def query_knowledge_batch(
+    knowledge_bases: Sequence[Knowledge],
+    queries: List[str],
+    results_limit: int = 3,
+    score_threshold: float = 0.35,
+    hybrid_search: bool = False,
+    candidates_limit: int = 20,
+    reranker_model: Optional[str] = None,
+) -> List[List[Dict[str, Any]]]:
+    """
+    Query several knowledge bases with several queries in one pass.
+
+    Queries are embedded once per distinct embedder configuration and the
+    embeddings are reused for every collection that shares it. Results for
+    each query are merged across knowledge bases, deduplicated by chunk id and
+    ranked by score. Each result carries a `knowledge_index` pointing at the
+    knowledge base it came from.
+
+    Raises:
+        ValueError: If the storage of any knowledge base is not initialized.
+    """
+    embeddings: Dict[str, List[Any]] = {}
+    options = retrieval_options(hybrid_search, candidates_limit, reranker_model)
+    per_query: List[List[Dict[str, Any]]] = [[] for _ in queries]
+
+    for index, knowledge in enumerate(knowledge_bases):
+        storage = knowledge.storage
+        if storage is None:
+            raise ValueError("Storage is not initialized.")
+
+        # Storages exposing their embedder configuration share query embeddings
+        key = storage.embedder_key
+        if key is not None:
+            if key not in embeddings:
+                embeddings[key] = storage.embed(queries)
+            batch = storage.search_batch(
+                queries,
+                limit=results_limit,
+                score_threshold=score_threshold,
+                query_embeddings=embeddings[key],
+                **options,
+            )
+        else:
+            batch = storage.search_batch(
+                queries, limit=results_limit, score_threshold=score_threshold, **options
+            )
+
+        for results, query_results in zip(batch, per_query):
+            query_results.extend(
+                {**result, "knowledge_index": index} for result in results
+            )
+
+    return [
+        merge_knowledge_results([results], limit=results_limit) for results in per_query
+    ]
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -6,7 +8,10 @@ class KnowledgeConfig(BaseModel):
 
     Args:
         results_limit (int): The number of relevant documents to return.
-        score_threshold (float): The minimum score for a document to be considered relevant.
+        score_threshold (float): The minimum vector similarity for a document to be considered relevant.
+        hybrid_search (bool): Whether to fuse vector search with BM25 keyword search.
+        candidates_limit (int): The number of candidates gathered before fusion and reranking.
+        reranker_model (Optional[str]): The cross-encoder model used to rerank the candidates.
     """
 
     results_limit: int = Field(default=3, description="The number of results to return")
@@ -14,3 +19,15 @@ class KnowledgeConfig(BaseModel):
         default=0.35,
         description="The minimum score for a result to be considered relevant",
     )
+    hybrid_search: bool = Field(
+        default=False,
+        description="Fuse vector search with BM25 keyword search using reciprocal rank fusion",
+    )
+    candidates_limit: int = Field(
+        default=20,
+        description="The number of candidates each retriever contributes before fusion and reranking",
+    )
+    reranker_model: Optional[str] = Field(
+        default=None,
+        description="The sentence-transformers cross-encoder model used to rerank the candidates",
+    )
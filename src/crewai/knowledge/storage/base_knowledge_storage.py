@@ -5,6 +5,24 @@ from typing import Any, Dict, List, Optional
 class BaseKnowledgeStorage(ABC):
     """Abstract base class for knowledge storage implementations."""
 
+    def initialize_knowledge_storage(self) -> None:
+        """Prepare the storage before it is used, e.g. create its collection."""
+        pass
+
+    @property
+    def embedder_key(self) -> Optional[str]:
+        """Identify the embedder configuration of the storage.
+
+        Storages returning a key must implement `embed` and accept
+        `query_embeddings` in `search_batch`; storages sharing a key then
+        reuse the same query embeddings. None, the default, opts out.
+        """
+        return None
+
+    def embed(self, queries: List[str]) -> List[Any]:
+        """Embed queries for `search_batch`, for storages with an `embedder_key`."""
+        raise NotImplementedError(f"{type(self).__name__} does not embed queries")
+
     @abstractmethod
     def search(
         self,
@@ -12,10 +30,47 @@ class BaseKnowledgeStorage(ABC):
         limit: int = 3,
         filter: Optional[dict] = None,
         score_threshold: float = 0.35,
+        hybrid_search: bool = False,
+        candidates_limit: int = 20,
+        reranker_model: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Search for documents in the knowledge base."""
+        """Search for documents in the knowledge base.
+
+        `hybrid_search`, `candidates_limit` and `reranker_model` are only
+        passed when hybrid retrieval or reranking is requested, so storages
+        that do not support them may leave them out of their signature.
+        """
         pass
 
+    def search_batch(
+        self,
+        queries: List[str],
+        limit: int = 3,
+        filter: Optional[dict] = None,
+        score_threshold: float = 0.35,
+        query_embeddings: Optional[List[Any]] = None,
+        hybrid_search: bool = False,
+        candidates_limit: int = 20,
+        reranker_model: Optional[str] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for documents with several queries, returning one result list per query.
+
+        Storages that can embed and search many queries in one request should
+        override this; the default runs one search per query and ignores
+        `query_embeddings`.
+        """
+        options = retrieval_options(hybrid_search, candidates_limit, reranker_model)
+        return [
+            self.search(
+                [query],
+                limit=limit,
+                filter=filter,
+                score_threshold=score_threshold,
+                **options,
+            )
+            for query in queries
+        ]
+
     @abstractmethod
     def save(
         self, documents: List[str], metadata: Dict[str, Any] | List[Dict[str, Any]]
@@ -27,3 +82,20 @@ class BaseKnowledgeStorage(ABC):
     def reset(self) -> None:
         """Reset the knowledge base."""
         pass
+
+
+def retrieval_options(
+    hybrid_search: bool, candidates_limit: int, reranker_model: Optional[str]
+) -> Dict[str, Any]:
+    """Keyword arguments enabling hybrid retrieval or reranking in `search`.
+
+    Empty unless either is requested, so storages predating these options
+    keep working.
+    """
+    if not hybrid_search and reranker_model is None:
+        return {}
+    return {
+        "hybrid_search": hybrid_search,
+        "candidates_limit": candidates_limit,
+        "reranker_model": reranker_model,
+    }
@@ -0,0 +1,106 @@
+import heapq
+import math
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class BM25Index:
+    """In-memory inverted index ranking documents with Okapi BM25.
+
+    Args:
+        k1: Term frequency saturation.
+        b: Document length normalization.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._doc_terms: Dict[str, Counter] = {}
+        self._lengths: Dict[str, int] = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_terms
+
+    def add(self, ids: Iterable[str], documents: Iterable[str]) -> None:
+        """Index documents, replacing any document already stored under the same id."""
+        with self._lock:
+            for doc_id, document in zip(ids, documents):
+                self._remove(doc_id)
+                terms = Counter(tokenize(document or ""))
+                self._doc_terms[doc_id] = terms
+                self._lengths[doc_id] = sum(terms.values())
+                self._total_length += self._lengths[doc_id]
+                for term, frequency in terms.items():
+                    self._postings.setdefault(term, {})[doc_id] = frequency
+
+    def remove(self, doc_id: str) -> None:
+        with self._lock:
+            self._remove(doc_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._doc_terms.clear()
+            self._lengths.clear()
+            self._total_length = 0
+
+    def search(
+        self, query: str, limit: int, ids: Optional[Set[str]] = None
+    ) -> List[Tuple[str, float]]:
+        """Return up to `limit` (id, score) pairs, best match first.
+
+        Args:
+            query: The text to search for.
+            limit: Maximum number of results.
+            ids: Optional set of ids to restrict the search to.
+        """
+        with self._lock:
+            if not self._doc_terms or limit <= 0:
+                return []
+            total_docs = len(self._doc_terms)
+            average_length = self._total_length / total_docs or 1.0
+            scores: Dict[str, float] = {}
+            for term in set(tokenize(query)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(
+                    1 + (total_docs - len(postings) + 0.5) / (len(postings) + 0.5)
+                )
+                for doc_id, frequency in postings.items():
+                    if ids is not None and doc_id not in ids:
+                        continue
+                    norm = self.k1 * (
+                        1 - self.b + self.b * self._lengths[doc_id] / average_length
+                    )
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * (
+                        frequency * (self.k1 + 1) / (frequency + norm)
+                    )
+            return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def _remove(self, doc_id: str) -> None:
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        self._total_length -= self._lengths.pop(doc_id)
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
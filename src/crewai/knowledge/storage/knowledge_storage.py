@@ -1,10 +1,13 @@
 import contextlib
 import hashlib
 import io
+import json
 import logging
+import math
 import os
 import shutil
-from typing import Any, Dict, List, Optional, Union
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 import chromadb
 import chromadb.errors
@@ -13,6 +16,12 @@ from chromadb.api.types import OneOrMany
 from chromadb.config import Settings
 
 from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.knowledge.storage.keyword_index import BM25Index
+from crewai.knowledge.storage.reranker import rerank
+from crewai.knowledge.utils.knowledge_utils import (
+    merge_knowledge_results,
+    reciprocal_rank_fusion,
+)
 from crewai.rag.embeddings.configurator import EmbeddingConfigurator
 from crewai.utilities.chromadb import sanitize_collection_name
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
@@ -38,6 +47,12 @@ def suppress_logging(
     logger.setLevel(original_level)
 
 
+def _cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
 class KnowledgeStorage(BaseKnowledgeStorage):
     """
     Extends Storage to handle embeddings for memory entries, improving
@@ -54,6 +69,8 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         collection_name: Optional[str] = None,
     ):
         self.collection_name = collection_name
+        self._keyword_index: Optional[BM25Index] = None
+        self._keyword_index_lock = threading.Lock()
         self._set_embedder_config(embedder)
 
     def search(
@@ -62,28 +79,200 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         limit: int = 3,
         filter: Optional[dict] = None,
         score_threshold: float = 0.35,
+        hybrid_search: bool = False,
+        candidates_limit: int = 20,
+        reranker_model: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
+        """Search the collection with every query and merge the results.
+
+        Results from all queries are deduplicated by chunk id and ranked by
+        score, best first.
+        """
+        return merge_knowledge_results(
+            self.search_batch(
+                query,
+                limit=limit,
+                filter=filter,
+                score_threshold=score_threshold,
+                hybrid_search=hybrid_search,
+                candidates_limit=candidates_limit,
+                reranker_model=reranker_model,
+            ),
+            limit=limit,
+        )
+
+    def search_batch(
+        self,
+        queries: List[str],
+        limit: int = 3,
+        filter: Optional[dict] = None,
+        score_threshold: float = 0.35,
+        query_embeddings: Optional[List[Any]] = None,
+        hybrid_search: bool = False,
+        candidates_limit: int = 20,
+        reranker_model: Optional[str] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Search the collection with several queries in a single request.
+
+        Args:
+            queries: The queries to search for.
+            limit: Maximum number of results per query.
+            filter: Optional metadata filter.
+            score_threshold: Minimum cosine similarity for a result to be kept.
+            query_embeddings: Precomputed embeddings for `queries`, used to
+                share one embedding request across collections.
+            hybrid_search: Fuse the vector results with BM25 keyword results
+                using reciprocal rank fusion.
+            candidates_limit: Number of candidates each retriever contributes
+                before fusion and reranking.
+            reranker_model: Optional cross-encoder model used to rerank the
+                candidates, e.g. "cross-encoder/ms-marco-MiniLM-L-6-v2".
+
+        Returns:
+            One ranked list of results per query, in the order of `queries`.
+        """
+        if not queries:
+            return []
+        n_results = (
+            max(limit, candidates_limit)
+            if hybrid_search or reranker_model
+            else limit
+        )
         with suppress_logging():
             if self.collection:
+                if query_embeddings is None:
+                    query_embeddings = self.embed(queries)
+                cosine_space = self._uses_cosine_space()
                 fetched = self.collection.query(
-                    query_texts=query,
-                    n_results=limit,
+                    query_embeddings=query_embeddings,
+                    n_results=n_results,
                     where=filter,
+                    include=(
+                        ["metadatas", "documents", "distances"]
+                        if cosine_space
+                        else ["metadatas", "documents", "embeddings"]
+                    ),
                 )
-                results = []
-                for i in range(len(fetched["ids"][0])):  # type: ignore
-                    result = {
-                        "id": fetched["ids"][0][i],  # type: ignore
-                        "metadata": fetched["metadatas"][0][i],  # type: ignore
-                        "context": fetched["documents"][0][i],  # type: ignore
-                        "score": fetched["distances"][0][i],  # type: ignore
-                    }
-                    if result["score"] >= score_threshold:
-                        results.append(result)
-                return results
+                batch_results = []
+                for q in range(len(fetched["ids"])):  # type: ignore
+                    results = []
+                    for i in range(len(fetched["ids"][q])):  # type: ignore
+                        result = {
+                            "id": fetched["ids"][q][i],  # type: ignore
+                            "metadata": fetched["metadatas"][q][i],  # type: ignore
+                            "context": fetched["documents"][q][i],  # type: ignore
+                            "score": (
+                                1 - fetched["distances"][q][i]  # type: ignore
+                                if cosine_space
+                                else _cosine_similarity(
+                                    query_embeddings[q],
+                                    fetched["embeddings"][q][i],  # type: ignore
+                                )
+                            ),
+                        }
+                        if result["score"] >= score_threshold:
+                            results.append(result)
+                    batch_results.append(results)
             else:
                 raise Exception("Collection not initialized")
 
+            if hybrid_search:
+                batch_results = self._fuse_keyword_results(
+                    queries, batch_results, n_results, filter
+                )
+
+        if reranker_model:
+            batch_results = [
+                rerank(query, results, reranker_model)
+                for query, results in zip(queries, batch_results)
+            ]
+        return [results[:limit] for results in batch_results]
+
+    def _uses_cosine_space(self) -> bool:
+        """Whether the collection's distances are cosine distances.
+
+        Other spaces ("l2", "ip") only map to cosine similarity for
+        unit-normalized embeddings, so for them the similarity is computed
+        from the stored embeddings instead.
+        """
+        metadata = self.collection.metadata if self.collection else None
+        return isinstance(metadata, dict) and metadata.get("hnsw:space") == "cosine"
+
+    def _get_keyword_index(self) -> BM25Index:
+        """Return the BM25 index over the collection, building it on first use."""
+        with self._keyword_index_lock:
+            if self._keyword_index is None:
+                if not self.collection:
+                    raise Exception("Collection not initialized")
+                stored = self.collection.get(include=["documents"])  # type: ignore
+                index = BM25Index()
+                index.add(stored["ids"], stored["documents"] or [])
+                self._keyword_index = index
+            return self._keyword_index
+
+    def _fuse_keyword_results(
+        self,
+        queries: List[str],
+        batch_results: List[List[Dict[str, Any]]],
+        n_results: int,
+        filter: Optional[dict] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Fuse vector results with BM25 results by reciprocal rank fusion."""
+        index = self._get_keyword_index()
+        allowed_ids = None
+        if filter:
+            allowed_ids = set(self.collection.get(where=filter, include=[])["ids"])  # type: ignore
+
+        keyword_hits = [
+            [doc_id for doc_id, _ in index.search(query, n_results, allowed_ids)]
+            for query in queries
+        ]
+
+        known = {
+            result["id"]: result for results in batch_results for result in results
+        }
+        missing = [
+            doc_id
+            for hits in keyword_hits
+            for doc_id in hits
+            if doc_id not in known
+        ]
+        if missing:
+            stored = self.collection.get(  # type: ignore
+                ids=list(dict.fromkeys(missing)),
+                include=["documents", "metadatas"],
+            )
+            for i, doc_id in enumerate(stored["ids"]):
+                known[doc_id] = {
+                    "id": doc_id,
+                    "metadata": stored["metadatas"][i],  # type: ignore
+                    "context": stored["documents"][i],  # type: ignore
+                }
+
+        fused_batch = []
+        for results, hits in zip(batch_results, keyword_hits):
+            fused = reciprocal_rank_fusion(
+                [[result["id"] for result in results], hits]
+            )
+            fused_batch.append(
+                [
+                    {**known[doc_id], "score": score}
+                    for doc_id, score in fused[:n_results]
+                    if doc_id in known
+                ]
+            )
+        return fused_batch
+
+    def embed(self, queries: List[str]) -> List[Any]:
+        """Embed all queries with a single call to the embedding function."""
+        return list(self.embedder(queries))
+
+    @property
+    def embedder_key(self) -> str:
+        """Identify the embedder configuration, so that collections sharing it
+        can reuse the same query embeddings."""
+        return json.dumps(self.embedder_config, sort_keys=True, default=repr)
+
     def initialize_knowledge_storage(self):
         self.app = create_persistent_client(
             path=os.path.join(db_storage_path(), "knowledge"),
@@ -101,6 +290,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                     name=sanitize_collection_name(collection_name),
                     embedding_function=self.embedder,
                 )
+                self._keyword_index = None
             else:
                 raise Exception("Vector Database Client not initialized")
         except Exception:
@@ -117,6 +307,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         shutil.rmtree(base_path)
         self.app = None
         self.collection = None
+        self._keyword_index = None
 
     def save(
         self,
@@ -162,6 +353,8 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 metadatas=final_metadata,
                 ids=filtered_ids,
             )
+            if self._keyword_index is not None:
+                self._keyword_index.add(filtered_ids, filtered_docs)
         except chromadb.errors.InvalidDimensionException as e:
             Logger(verbose=True).log(
                 "error",
@@ -193,6 +386,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             embedder_config (Optional[Dict[str, Any]]): Configuration dictionary for the embedder.
                 If None or empty, defaults to the default embedding function.
         """
+        self.embedder_config = embedder
         self.embedder = (
             EmbeddingConfigurator().configure_embedder(embedder)
             if embedder
@@ -0,0 +1,37 @@
+import threading
+from typing import Any, Dict, List
+
+_models: Dict[str, Any] = {}
+_models_lock = threading.Lock()
+
+
+def load_cross_encoder(model_name: str) -> Any:
+    """Load a sentence-transformers cross-encoder, once per model name."""
+    with _models_lock:
+        if model_name not in _models:
+            try:
+                from sentence_transformers import CrossEncoder
+            except ImportError:
+                raise ImportError(
+                    "sentence-transformers is not installed. Please install it with: pip install sentence-transformers"
+                )
+            _models[model_name] = CrossEncoder(model_name)
+        return _models[model_name]
+
+
+def rerank(
+    query: str, results: List[Dict[str, Any]], model_name: str
+) -> List[Dict[str, Any]]:
+    """Score each result against the query with a local cross-encoder.
+
+    Returns the results sorted by the cross-encoder score, best first, with
+    `score` replaced by that score.
+    """
+    if not results:
+        return []
+    model = load_cross_encoder(model_name)
+    scores = model.predict([(query, result["context"] or "") for result in results])
+    reranked = [
+        {**result, "score": float(score)} for result, score in zip(results, scores)
+    ]
+    return sorted(reranked, key=lambda result: result["score"], reverse=True)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 
 def extract_knowledge_context(knowledge_snippets: List[Dict[str, Any]]) -> str:
@@ -10,3 +10,37 @@ def extract_knowledge_context(knowledge_snippets: List[Dict[str, Any]]) -> str:
     ]
     snippet = "\n".join(valid_snippets)
     return f"Additional Information: {snippet}" if valid_snippets else ""
+
+
+def merge_knowledge_results(
+    result_lists: List[List[Dict[str, Any]]], limit: int
+) -> List[Dict[str, Any]]:
+    """Merge several ranked result lists, keeping the best hit per chunk id.
+
+    Scores are relevance scores, so higher is better. Results without an id
+    are deduplicated by their context.
+    """
+    best: Dict[Any, Dict[str, Any]] = {}
+    for results in result_lists:
+        for result in results:
+            key = result.get("id") or result.get("context")
+            if key not in best or result.get("score", 0) > best[key].get("score", 0):
+                best[key] = result
+    return sorted(
+        best.values(), key=lambda result: result.get("score", 0), reverse=True
+    )[:limit]
+
+
+def reciprocal_rank_fusion(
+    ranked_ids: List[List[str]], k: int = 60
+) -> List[Tuple[str, float]]:
+    """Fuse several rankings of ids with reciprocal rank fusion.
+
+    Each id scores `1 / (k + rank)` in every ranking it appears in, with ranks
+    starting at 1. Returns (id, fused score) pairs, best first.
+    """
+    scores: Dict[str, float] = {}
+    for ranking in ranked_ids:
+        for rank, doc_id in enumerate(ranking, start=1):
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
@@ -3,6 +3,7 @@ import logging
 import os
 import sys
 import threading
+import time
 import warnings
 from collections import defaultdict
 from contextlib import contextmanager
@@ -45,17 +46,24 @@ with warnings.catch_warnings():
         get_supported_openai_params,
     )
     from litellm.types.utils import ModelResponse
-    from litellm.utils import supports_response_schema
+    from litellm.utils import supports_prompt_caching, supports_response_schema
 
 
 import io
 from typing import TextIO
 
 from crewai.llms.base_llm import BaseLLM
+from crewai.telemetry.tracing import (
+    is_tracing_enabled,
+    set_span_attributes,
+    traced,
+)
+from crewai.utilities.crew.crew_context import get_usage_ledger
 from crewai.utilities.events import crewai_event_bus
 from crewai.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededException,
 )
+from crewai.utilities.usage_ledger import usage_label
 
 load_dotenv()
 
@@ -253,6 +261,12 @@ LLM_CONTEXT_WINDOW_SIZES = {
 DEFAULT_CONTEXT_WINDOW_SIZE = 8192
 CONTEXT_WINDOW_USAGE_RATIO = 0.85
 
+# Providers that only cache prompt prefixes marked with explicit
+# `cache_control` blocks. OpenAI-compatible providers cache stable prefixes
+# automatically and reject unknown content keys, so they are never marked.
+CACHE_CONTROL_PROVIDERS = ("anthropic", "bedrock", "gemini", "vertex_ai")
+PROMPT_CACHE_CONTROL = {"type": "ephemeral"}
+
 
 @contextmanager
 def suppress_warnings():
@@ -310,6 +324,7 @@ class LLM(BaseLLM):
         callbacks: List[Any] = [],
         reasoning_effort: Optional[Literal["none", "low", "medium", "high"]] = None,
         stream: bool = False,
+        prompt_caching: bool = False,
         **kwargs,
     ):
         self.model = model
@@ -336,6 +351,7 @@ class LLM(BaseLLM):
         self.additional_params = kwargs
         self.is_anthropic = self._is_anthropic_model(model)
         self.stream = stream
+        self.prompt_caching = prompt_caching
 
         litellm.drop_params = True
 
@@ -382,6 +398,8 @@ class LLM(BaseLLM):
         if isinstance(messages, str):
             messages = [{"role": "user", "content": messages}]
         formatted_messages = self._format_messages_for_provider(messages)
+        if self.prompt_caching and self._requires_cache_control():
+            formatted_messages = self._apply_prompt_caching(formatted_messages)
 
         # --- 2) Prepare the parameters for the completion call
         params = {
@@ -451,6 +469,7 @@ class LLM(BaseLLM):
         params["stream"] = True
         params["stream_options"] = {"include_usage": True}
 
+        started_at = time.perf_counter()
         try:
             # --- 3) Process each chunk in the stream
             for chunk in litellm.completion(**params):
@@ -534,6 +553,11 @@ class LLM(BaseLLM):
                         self,
                         event=LLMStreamChunkEvent(chunk=chunk_content, from_task=from_task, from_agent=from_agent),
                     )
+            if chunk_count > 0:
+                self._record_usage(
+                    usage_info, time.perf_counter() - started_at, from_task, from_agent
+                )
+
             # --- 4) Fallback to non-streaming if no content received
             if not full_response.strip() and chunk_count == 0:
                 logging.warning(
@@ -778,11 +802,18 @@ class LLM(BaseLLM):
             # and convert them to our own exception type for consistent handling
             # across the codebase. This allows CrewAgentExecutor to handle context
             # length issues appropriately.
+            started_at = time.perf_counter()
             response = litellm.completion(**params)
         except ContextWindowExceededError as e:
             # Convert litellm's context window error to our own exception type
             # for consistent handling in the rest of the codebase
             raise LLMContextLengthExceededException(str(e))
+        self._record_usage(
+            getattr(response, "usage", None),
+            time.perf_counter() - started_at,
+            from_task,
+            from_agent,
+        )
         # --- 2) Extract response message and content
         response_message = cast(Choices, cast(ModelResponse, response).choices)[
             0
@@ -896,6 +927,10 @@ class LLM(BaseLLM):
                 )
         return None
 
+    @traced(
+        "crewai.llm.call",
+        lambda self, *args, **kwargs: {"gen_ai.request.model": self.model},
+    )
     def call(
         self,
         messages: Union[str, List[Dict[str, str]]],
@@ -1006,6 +1041,74 @@ class LLM(BaseLLM):
                 )
                 raise
 
+    def _record_usage(
+        self,
+        usage: Any,
+        latency: float,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> None:
+        """Record a request in the usage ledger of the running crew, if any.
+
+        Args:
+            usage: Usage reported by the provider, as an object or a dict
+            latency: Seconds the request took
+            from_task: Optional Task that invoked the LLM
+            from_agent: Optional Agent that invoked the LLM
+        """
+        ledger = get_usage_ledger()
+        if not usage or (ledger is None and not is_tracing_enabled()):
+            return
+
+        def read(source: Any, name: str) -> Any:
+            if isinstance(source, dict):
+                return source.get(name)
+            return getattr(source, name, None)
+
+        prompt_tokens = read(usage, "prompt_tokens") or 0
+        completion_tokens = read(usage, "completion_tokens") or 0
+        details = read(usage, "prompt_tokens_details")
+        cached_prompt_tokens = (read(details, "cached_tokens") if details else 0) or 0
+        cache_creation_prompt_tokens = read(usage, "cache_creation_input_tokens")
+        try:
+            cost = sum(
+                litellm.cost_per_token(
+                    model=self.model,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                )
+            )
+        except Exception:
+            # Models unknown to litellm's price list have no cost estimate
+            cost = 0.0
+
+        set_span_attributes(
+            {
+                "gen_ai.usage.input_tokens": prompt_tokens,
+                "gen_ai.usage.output_tokens": completion_tokens,
+                "crewai.llm.cached_prompt_tokens": cached_prompt_tokens,
+            }
+        )
+        if ledger is None:
+            return
+
+        agent = from_task.agent if from_task else from_agent
+        ledger.record_llm_call(
+            self.model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cached_prompt_tokens=cached_prompt_tokens,
+            cache_creation_prompt_tokens=(
+                cache_creation_prompt_tokens
+                if isinstance(cache_creation_prompt_tokens, int)
+                else 0
+            ),
+            latency=latency,
+            cost=cost,
+            task=usage_label(from_task),
+            agent=agent.role if agent else None,
+        )
+
     def _handle_emit_call_events(self, response: Any, call_type: LLMCallType, from_task: Optional[Any] = None, from_agent: Optional[Any] = None, messages: str | list[dict[str, Any]] | None = None):
         """Handle the events for the LLM call.
 
@@ -1092,6 +1195,71 @@ class LLM(BaseLLM):
 
         return messages
 
+    def _requires_cache_control(self) -> bool:
+        """Check whether the provider needs explicit cache-control hints.
+
+        Returns:
+            bool: True if the model supports prompt caching and its provider
+            only caches prefixes that are explicitly marked.
+        """
+        provider = self._get_custom_llm_provider()
+        if not self.is_anthropic and provider not in CACHE_CONTROL_PROVIDERS:
+            return False
+        return self.supports_prompt_caching()
+
+    def _apply_prompt_caching(
+        self, messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Mark the stable prefix of a conversation as cacheable.
+
+        Agent conversations are laid out as a stable prefix (system prompt with
+        the rendered tool descriptions, followed by the task prompt) and a
+        dynamic suffix that grows with every iteration. Cache breakpoints are
+        placed on the last system message, on the first turn after it and on
+        the last message, so every iteration reuses the prefix cached by the
+        previous one. Anthropic allows at most four breakpoints per request.
+
+        Args:
+            messages: Messages already formatted for the provider.
+
+        Returns:
+            A new list of messages with cache-control hints; the input list and
+            its dictionaries are left untouched.
+        """
+        if not messages:
+            return messages
+
+        system_indexes = [
+            i for i, message in enumerate(messages) if message["role"] == "system"
+        ]
+        prefix_end = system_indexes[-1] if system_indexes else -1
+        breakpoints = {len(messages) - 1}
+        if prefix_end >= 0:
+            breakpoints.add(prefix_end)
+        if prefix_end + 1 < len(messages):
+            breakpoints.add(prefix_end + 1)
+
+        cached_messages = []
+        for i, message in enumerate(messages):
+            content = message["content"]
+            if i not in breakpoints or not content:
+                cached_messages.append(message)
+                continue
+            if isinstance(content, str):
+                blocks = [
+                    {
+                        "type": "text",
+                        "text": content,
+                        "cache_control": PROMPT_CACHE_CONTROL,
+                    }
+                ]
+            else:
+                blocks = list(content)
+                if isinstance(blocks[-1], dict):
+                    blocks[-1] = {**blocks[-1], "cache_control": PROMPT_CACHE_CONTROL}
+            cached_messages.append({**message, "content": blocks})
+        return cached_messages
+
     def _get_custom_llm_provider(self) -> Optional[str]:
         """
         Derives the custom_llm_provider from the model string.
@@ -1132,6 +1300,14 @@ class LLM(BaseLLM):
             logging.error(f"Failed to check function calling support: {str(e)}")
             return False
 
+    def supports_prompt_caching(self) -> bool:
+        try:
+            provider = self._get_custom_llm_provider()
+            return supports_prompt_caching(self.model, custom_llm_provider=provider)
+        except Exception as e:
+            logging.error(f"Failed to check prompt caching support: {str(e)}")
+            return False
+
     def supports_stop_words(self) -> bool:
         try:
             params = get_supported_openai_params(model=self.model)
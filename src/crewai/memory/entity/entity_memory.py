@@ -5,7 +5,6 @@ from pydantic import PrivateAttr
 
 from crewai.memory.entity.entity_memory_item import EntityMemoryItem
 from crewai.memory.memory import Memory
-from crewai.memory.storage.rag_storage import RAGStorage
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.memory_events import (
     MemoryQueryStartedEvent,
@@ -41,6 +40,8 @@ class EntityMemory(Memory):
                 )
             storage = Mem0Storage(type="entities", crew=crew)
         else:
+            from crewai.memory.storage.rag_storage import RAGStorage
+
             storage = (
                 storage
                 if storage
@@ -5,7 +5,6 @@ from pydantic import PrivateAttr
 
 from crewai.memory.memory import Memory
 from crewai.memory.short_term.short_term_memory_item import ShortTermMemoryItem
-from crewai.memory.storage.rag_storage import RAGStorage
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.memory_events import (
     MemoryQueryStartedEvent,
@@ -43,6 +42,8 @@ class ShortTermMemory(Memory):
                 )
             storage = Mem0Storage(type="short_term", crew=crew)
         else:
+            from crewai.memory.storage.rag_storage import RAGStorage
+
             storage = (
                 storage
                 if storage
@@ -1,3 +1,4 @@
+import contextvars
 import datetime
 import inspect
 import json
@@ -37,6 +38,7 @@ from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.security import Fingerprint, SecurityConfig
 from crewai.tasks.output_format import OutputFormat
 from crewai.tasks.task_output import TaskOutput
+from crewai.telemetry.tracing import set_span_attributes, traced
 from crewai.tools.base_tool import BaseTool
 from crewai.utilities.config import process_config
 from crewai.utilities.constants import NOT_SPECIFIED, _NotSpecified
@@ -50,6 +52,7 @@ from crewai.utilities.events import (
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.i18n import I18N
 from crewai.utilities.printer import Printer
+from crewai.utilities.profiling import profiled
 from crewai.utilities.string_utils import interpolate_only
 
 
@@ -377,10 +380,12 @@ class Task(BaseModel):
     ) -> Future[TaskOutput]:
         """Execute the task asynchronously."""
         future: Future[TaskOutput] = Future()
+        # Run in a copy of the caller's context so context-bound state, such
+        # as the stream of a streamed kickoff, follows the task
         threading.Thread(
             daemon=True,
-            target=self._execute_task_async,
-            args=(agent, context, tools, future),
+            target=contextvars.copy_context().run,
+            args=(self._execute_task_async, agent, context, tools, future),
         ).start()
         return future
 
@@ -395,6 +400,13 @@ class Task(BaseModel):
         result = self._execute_core(agent, context, tools)
         future.set_result(result)
 
+    @traced(
+        "crewai.task",
+        lambda self, *args, **kwargs: {
+            "crewai.task.name": self.name or self.description,
+            "crewai.task.id": str(self.id),
+        },
+    )
     def _execute_core(
         self,
         agent: Optional[BaseAgent],
@@ -411,6 +423,7 @@ class Task(BaseModel):
                 )
 
             self.start_time = datetime.datetime.now()
+            set_span_attributes({"crewai.agent.role": agent.role})
 
             self.prompt_context = context
             tools = tools or self.tools or []
@@ -694,6 +707,7 @@ Follow these guidelines:
 
         return copied_task
 
+    @profiled("output_conversion")
     def _export_output(
         self, result: str
     ) -> Tuple[Optional[BaseModel], Optional[Dict[str, Any]]]:
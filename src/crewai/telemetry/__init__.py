@@ -1,3 +1,4 @@
 from .telemetry import Telemetry
+from .tracing import disable_tracing, enable_tracing
 
-__all__ = ["Telemetry"]
+__all__ = ["Telemetry", "enable_tracing", "disable_tracing"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import os
@@ -12,9 +13,6 @@ from typing import TYPE_CHECKING, Any, Callable, Optional
 import threading
 
 from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
-    OTLPSpanExporter,
-)
 from opentelemetry.sdk.resources import SERVICE_NAME, Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import (
@@ -43,13 +41,23 @@ if TYPE_CHECKING:
     from crewai.task import Task
 
 
-class SafeOTLPSpanExporter(OTLPSpanExporter):
-    def export(self, spans) -> SpanExportResult:
-        try:
-            return super().export(spans)
-        except Exception as e:
-            logger.error(e)
-            return SpanExportResult.FAILURE
+@functools.lru_cache(maxsize=None)
+def _safe_otlp_span_exporter() -> type:
+    """Define the exporter on first use, as the OTLP exporter pulls in the
+    HTTP and protobuf stacks, which are not needed when telemetry is off."""
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+        OTLPSpanExporter,
+    )
+
+    class SafeOTLPSpanExporter(OTLPSpanExporter):
+        def export(self, spans) -> SpanExportResult:
+            try:
+                return super().export(spans)
+            except Exception as e:
+                logger.error(e)
+                return SpanExportResult.FAILURE
+
+    return SafeOTLPSpanExporter
 
 
 class Telemetry:
@@ -95,7 +103,7 @@ class Telemetry:
                 self.provider = TracerProvider(resource=self.resource)
 
             processor = BatchSpanProcessor(
-                SafeOTLPSpanExporter(
+                _safe_otlp_span_exporter()(
                     endpoint=f"{CREWAI_TELEMETRY_BASE_URL}/v1/traces",
                     timeout=30,
                 )
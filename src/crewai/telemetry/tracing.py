@@ -0,0 +1,135 @@
+"""Opt-in OpenTelemetry tracing of crew execution for collectors you own.
+
+Unlike `Telemetry`, which sends a few anonymous spans to crewAI, tracing emits
+the full span tree of a run (crew, task, agent iteration, LLM and tool calls,
+memory and knowledge retrieval) to the exporter or tracer provider passed to
+`enable_tracing`. It is off by default and costs a single global lookup per
+instrumented call while off.
+"""
+
+import functools
+from contextlib import nullcontext
+from importlib.metadata import version
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Mapping,
+    Optional,
+    TypeVar,
+)
+
+from opentelemetry import trace
+from opentelemetry.trace import Span, Tracer
+from opentelemetry.util.types import AttributeValue
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SpanExporter
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_tracer: Optional[Tracer] = None
+_no_span: ContextManager[Optional[Span]] = nullcontext()
+
+
+def enable_tracing(
+    exporter: Optional["SpanExporter"] = None,
+    tracer_provider: Optional["TracerProvider"] = None,
+    service_name: str = "crewai",
+) -> "TracerProvider":
+    """Start emitting crew execution spans.
+
+    Args:
+        exporter: Exporter receiving the spans, for example an OTLPSpanExporter
+            pointed at your collector. Defaults to printing spans to the
+            console when no tracer provider is given either.
+        tracer_provider: Provider to create the spans with. Use it to share the
+            provider, resource and processors of the rest of your application.
+        service_name: Service name of the provider created when none is given.
+
+    Returns:
+        The tracer provider the spans are created with, so it can be flushed
+        or shut down.
+    """
+    global _tracer
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+    )
+
+    if tracer_provider is None:
+        tracer_provider = TracerProvider(
+            resource=Resource(attributes={SERVICE_NAME: service_name})
+        )
+        exporter = exporter or ConsoleSpanExporter()
+    if exporter is not None:
+        tracer_provider.add_span_processor(BatchSpanProcessor(exporter))
+
+    _tracer = tracer_provider.get_tracer("crewai", version("crewai"))
+    return tracer_provider
+
+
+def disable_tracing() -> None:
+    """Stop emitting crew execution spans."""
+    global _tracer
+    _tracer = None
+
+
+def is_tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def trace_span(
+    name: str, attributes: Optional[Mapping[str, AttributeValue]] = None
+) -> ContextManager[Optional[Span]]:
+    """Run a block in a span that is a child of the current span.
+
+    Returns a no-op context manager yielding None while tracing is disabled.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _no_span
+    return tracer.start_as_current_span(name, attributes=attributes)
+
+
+def traced(
+    name: str,
+    attributes: Optional[Callable[..., Mapping[str, AttributeValue]]] = None,
+) -> Callable[[F], F]:
+    """Run every call of the decorated function in a span.
+
+    Args:
+        name: Name of the span.
+        attributes: Called with the arguments of the decorated function to
+            build the span attributes; only called while tracing is enabled.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            span_attributes = attributes(*args, **kwargs) if attributes else None
+            with tracer.start_as_current_span(name, attributes=span_attributes):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def set_span_attributes(attributes: Dict[str, Optional[AttributeValue]]) -> None:
+    """Add attributes to the current span, skipping None values."""
+    if _tracer is None:
+        return
+    span = trace.get_current_span()
+    if span.is_recording():
+        span.set_attributes(
+            {key: value for key, value in attributes.items() if value is not None}
+        )
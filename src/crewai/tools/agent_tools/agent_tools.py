@@ -3,15 +3,22 @@ from crewai.tools.base_tool import BaseTool
 from crewai.utilities import I18N
 
 from .ask_question_tool import AskQuestionTool
+from .delegate_work_batch_tool import DelegateWorkBatchTool
 from .delegate_work_tool import DelegateWorkTool
 
 
 class AgentTools:
     """Manager class for agent-related tools"""
 
-    def __init__(self, agents: list[BaseAgent], i18n: I18N = I18N()):
+    def __init__(
+        self,
+        agents: list[BaseAgent],
+        i18n: I18N = I18N(),
+        parallel_delegation: bool = False,
+    ):
         self.agents = agents
         self.i18n = i18n
+        self.parallel_delegation = parallel_delegation
 
     def tools(self) -> list[BaseTool]:
         """Get all available agent tools"""
@@ -29,4 +36,16 @@ class AgentTools:
             description=self.i18n.tools("ask_question").format(coworkers=coworkers),  # type: ignore
         )
 
-        return [delegate_tool, ask_tool]
+        tools: list[BaseTool] = [delegate_tool, ask_tool]
+
+        # Fanning out only makes sense when there is more than one coworker
+        if self.parallel_delegation and len(self.agents) > 1:
+            tools.append(
+                DelegateWorkBatchTool(
+                    agents=self.agents,
+                    i18n=self.i18n,
+                    description=self.i18n.tools("delegate_work_batch").format(coworkers=coworkers),  # type: ignore
+                )
+            )
+
+        return tools
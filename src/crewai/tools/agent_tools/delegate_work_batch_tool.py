@@ -0,0 +1,86 @@
+import concurrent.futures
+import contextvars
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from crewai.tools.agent_tools.base_agent_tools import BaseAgentTool
+
+
+class DelegationRequest(BaseModel):
+    task: str = Field(..., description="The task to delegate")
+    context: str = Field(..., description="The context for the task")
+    coworker: str = Field(
+        ..., description="The role/name of the coworker to delegate to"
+    )
+
+
+class DelegateWorkBatchToolSchema(BaseModel):
+    delegations: List[DelegationRequest] = Field(
+        ...,
+        description="The tasks to delegate, each with its coworker and context",
+    )
+
+
+class DelegateWorkBatchTool(BaseAgentTool):
+    """Tool for delegating several tasks to coworkers concurrently.
+
+    Delegations addressed to different coworkers run in parallel. Delegations
+    addressed to the same coworker run one after another, since an agent can
+    only work on one task at a time. All results are gathered into a single
+    observation, in the order the delegations were given.
+    """
+
+    name: str = "Delegate work to multiple coworkers"
+    args_schema: type[BaseModel] = DelegateWorkBatchToolSchema
+    max_workers: Optional[int] = Field(
+        default=None,
+        description="Maximum number of coworkers working at the same time",
+    )
+
+    def _run(
+        self,
+        delegations: List[Dict[str, str]],
+        **kwargs,
+    ) -> str:
+        requests = [
+            request
+            if isinstance(request, DelegationRequest)
+            else DelegationRequest.model_validate(request)
+            for request in delegations
+        ]
+        if not requests:
+            return ""
+
+        # Group by coworker so that no agent runs two tasks at the same time
+        groups: Dict[str, List[int]] = {}
+        for index, request in enumerate(requests):
+            coworker = self._get_coworker(request.coworker) or ""
+            groups.setdefault(self.sanitize_agent_name(coworker), []).append(index)
+
+        results: List[str] = [""] * len(requests)
+
+        def run_group(indexes: List[int]) -> None:
+            for index in indexes:
+                request = requests[index]
+                results[index] = self._execute(
+                    self._get_coworker(request.coworker),
+                    request.task,
+                    request.context,
+                )
+
+        max_workers = min(self.max_workers or len(groups), len(groups))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, run_group, indexes)
+                for indexes in groups.values()
+            ]
+            for future in futures:
+                future.result()
+
+        return "\n\n".join(
+            self.i18n.slice("delegation_result").format(
+                coworker=request.coworker, task=request.task, result=result
+            )
+            for request, result in zip(requests, results)
+        )
@@ -1,7 +1,6 @@
 from pydantic import BaseModel, Field
 
 from crewai.agents.cache import CacheHandler
-from crewai.tools.structured_tool import CrewStructuredTool
 
 
 class CacheTools(BaseModel):
@@ -14,6 +13,9 @@ class CacheTools(BaseModel):
     )
 
     def tool(self):
+        # crewai.tools indirectly imports this module
+        from crewai.tools.structured_tool import CrewStructuredTool
+
         return CrewStructuredTool.from_function(
             func=self.hit_cache,
             name=self.name,
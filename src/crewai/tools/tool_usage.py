@@ -13,6 +13,7 @@ from json_repair import repair_json
 from crewai.agents.tools_handler import ToolsHandler
 from crewai.task import Task
 from crewai.telemetry import Telemetry
+from crewai.telemetry.tracing import set_span_attributes, traced
 from crewai.tools.structured_tool import CrewStructuredTool
 from crewai.tools.tool_calling import InstructorToolCalling, ToolCalling
 from crewai.utilities import I18N, Converter, Printer
@@ -20,6 +21,7 @@ from crewai.utilities.agent_utils import (
     get_tool_names,
     render_text_description_and_args,
 )
+from crewai.utilities.crew.crew_context import get_usage_ledger
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.tool_usage_events import (
     ToolSelectionErrorEvent,
@@ -28,6 +30,7 @@ from crewai.utilities.events.tool_usage_events import (
     ToolUsageStartedEvent,
     ToolValidateInputErrorEvent,
 )
+from crewai.utilities.usage_ledger import usage_label
 
 if TYPE_CHECKING:
     from crewai.agents.agent_builder.base_agent import BaseAgent
@@ -143,6 +146,10 @@ class ToolUsage:
 
         return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}"
 
+    @traced(
+        "crewai.tool.call",
+        lambda self, tool_string, tool, calling: {"crewai.tool.name": tool.name},
+    )
     def _use(
         self,
         tool_string: str,
@@ -176,9 +183,7 @@ class ToolUsage:
                 "agent": self.agent,
             }
 
-            if self.agent.fingerprint:
-                event_data.update(self.agent.fingerprint)
-
+            # The event reads the fingerprint from the agent
             crewai_event_bus.emit(self,ToolUsageStartedEvent(**event_data))
             
         started_at = time.time()
@@ -222,6 +227,17 @@ class ToolUsage:
                     )
                     if self.task:
                         self.task.increment_delegations(coworker)
+                elif calling.tool_name == "Delegate work to multiple coworkers":
+                    delegations = (
+                        calling.arguments.get("delegations") if calling.arguments else None
+                    )
+                    if self.task and isinstance(delegations, list):
+                        for delegation in delegations:
+                            self.task.increment_delegations(
+                                delegation.get("coworker")
+                                if isinstance(delegation, dict)
+                                else None
+                            )
 
                 if calling.arguments:
                     try:
@@ -596,6 +612,21 @@ class ToolUsage:
         result: Any,
     ) -> None:
         finished_at = time.time()
+        set_span_attributes(
+            {
+                "crewai.tool.from_cache": from_cache,
+                "crewai.tool.run_attempts": self._run_attempts,
+            }
+        )
+        ledger = get_usage_ledger()
+        if ledger is not None:
+            ledger.record_tool_call(
+                tool.name,
+                latency=finished_at - started_at,
+                from_cache=from_cache,
+                task=usage_label(self.task),
+                agent=getattr(self.agent, "role", None),
+            )
         event_data = self._prepare_event_data(tool, tool_calling)
         event_data.update(
             {
@@ -1,3 +1,5 @@
+from typing import Dict, List, Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -9,6 +11,7 @@ class UsageMetrics(BaseModel):
         total_tokens: Total number of tokens used.
         prompt_tokens: Number of tokens used in prompts.
         cached_prompt_tokens: Number of cached prompt tokens used.
+        cache_creation_prompt_tokens: Number of prompt tokens written to the prompt cache.
         completion_tokens: Number of tokens used in completions.
         successful_requests: Number of successful requests made.
     """
@@ -20,6 +23,9 @@ class UsageMetrics(BaseModel):
     cached_prompt_tokens: int = Field(
         default=0, description="Number of cached prompt tokens used."
     )
+    cache_creation_prompt_tokens: int = Field(
+        default=0, description="Number of prompt tokens written to the prompt cache."
+    )
     completion_tokens: int = Field(
         default=0, description="Number of tokens used in completions."
     )
@@ -37,5 +43,82 @@ class UsageMetrics(BaseModel):
         self.total_tokens += usage_metrics.total_tokens
         self.prompt_tokens += usage_metrics.prompt_tokens
         self.cached_prompt_tokens += usage_metrics.cached_prompt_tokens
+        self.cache_creation_prompt_tokens += usage_metrics.cache_creation_prompt_tokens
         self.completion_tokens += usage_metrics.completion_tokens
         self.successful_requests += usage_metrics.successful_requests
+
+
+class UsageStats(UsageMetrics):
+    """
+    Usage metrics of one model, task, agent or tool, with time and spend.
+
+    Attributes:
+        tool_calls: Number of tool calls made.
+        cached_tool_calls: Number of tool calls answered from the cache.
+        latency: Seconds spent waiting on LLM requests and tool calls.
+        cost: Estimated cost of the LLM requests in USD.
+    """
+
+    tool_calls: int = Field(default=0, description="Number of tool calls made.")
+    cached_tool_calls: int = Field(
+        default=0, description="Number of tool calls answered from the cache."
+    )
+    latency: float = Field(
+        default=0.0, description="Seconds spent waiting on LLM requests and tool calls."
+    )
+    cost: float = Field(
+        default=0.0, description="Estimated cost of the LLM requests in USD."
+    )
+
+    def add_usage_stats(self, usage_stats: "UsageStats"):
+        """
+        Add the usage stats from another UsageStats object.
+
+        Args:
+            usage_stats (UsageStats): The usage stats to add.
+        """
+        self.add_usage_metrics(usage_stats)
+        self.tool_calls += usage_stats.tool_calls
+        self.cached_tool_calls += usage_stats.cached_tool_calls
+        self.latency += usage_stats.latency
+        self.cost += usage_stats.cost
+
+
+class UsageReport(BaseModel):
+    """
+    Usage of a crew run broken down by model, task, agent and tool.
+
+    The totals and breakdowns include the usage of `children`, the reports of
+    the crew copies the run was split into.
+    """
+
+    name: Optional[str] = Field(default=None, description="Name of the crew.")
+    total: UsageStats = Field(default_factory=UsageStats, description="Usage of the run.")
+    by_model: Dict[str, UsageStats] = Field(
+        default_factory=dict, description="Usage per LLM model."
+    )
+    by_task: Dict[str, UsageStats] = Field(
+        default_factory=dict, description="Usage per task name or description."
+    )
+    by_agent: Dict[str, UsageStats] = Field(
+        default_factory=dict, description="Usage per agent role."
+    )
+    by_tool: Dict[str, UsageStats] = Field(
+        default_factory=dict, description="Usage per tool name."
+    )
+    children: List["UsageReport"] = Field(
+        default_factory=list, description="Reports of the crew copies of the run."
+    )
+
+    def add_usage_report(self, usage_report: "UsageReport"):
+        """
+        Add the totals and breakdowns of another UsageReport object.
+
+        Args:
+            usage_report (UsageReport): The usage report to add.
+        """
+        self.total.add_usage_stats(usage_report.total)
+        for name in ("by_model", "by_task", "by_agent", "by_tool"):
+            breakdown = getattr(self, name)
+            for key, stats in getattr(usage_report, name).items():
+                breakdown.setdefault(key, UsageStats()).add_usage_stats(stats)
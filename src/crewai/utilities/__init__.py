@@ -1,10 +1,12 @@
 from .converter import Converter, ConverterError
+from .execution_log import ExecutionLogWriter, read_execution_log
 from .file_handler import FileHandler
 from .i18n import I18N
 from .internal_instructor import InternalInstructor
 from .logger import Logger
 from .parser import YamlParser
 from .printer import Printer
+from .profiling import ProfileReport, RunProfiler
 from .prompts import Prompts
 from .rpm_controller import RPMController
 from .exceptions.context_window_exceeding_exception import (
@@ -14,13 +16,17 @@ from .exceptions.context_window_exceeding_exception import (
 __all__ = [
     "Converter",
     "ConverterError",
+    "ExecutionLogWriter",
     "FileHandler",
     "I18N",
     "InternalInstructor",
     "Logger",
     "Printer",
+    "ProfileReport",
     "Prompts",
     "RPMController",
+    "RunProfiler",
     "YamlParser",
+    "read_execution_log",
     "LLMContextLengthExceededException",
 ]
@@ -5,6 +5,7 @@ from typing import Optional
 from opentelemetry import baggage
 
 from crewai.utilities.crew.models import CrewContext
+from crewai.utilities.usage_ledger import UsageLedger
 
 
 def get_crew_context() -> Optional[CrewContext]:
@@ -14,3 +15,13 @@ def get_crew_context() -> Optional[CrewContext]:
         CrewContext instance containing crew context information, or None if no context is set
     """
     return baggage.get_baggage("crew_context")
+
+
+def get_usage_ledger() -> Optional[UsageLedger]:
+    """Get the usage ledger of the crew run in the current context.
+
+    Returns:
+        The UsageLedger of the running crew, or None outside of a crew run
+    """
+    context = get_crew_context()
+    return context.usage_ledger if context else None
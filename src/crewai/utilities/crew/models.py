@@ -2,15 +2,24 @@
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from crewai.utilities.usage_ledger import UsageLedger
 
 
 class CrewContext(BaseModel):
     """Model representing crew context information."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     id: Optional[str] = Field(
         default=None, description="Unique identifier for the crew"
     )
     key: Optional[str] = Field(
         default=None, description="Optional crew key/name for identification"
     )
+    usage_ledger: Optional[UsageLedger] = Field(
+        default=None,
+        exclude=True,
+        description="Ledger recording the token, cost and latency usage of the run",
+    )
@@ -36,7 +36,7 @@ from .flow_events import (
     MethodExecutionFinishedEvent,
     MethodExecutionFailedEvent,
 )
-from .crewai_event_bus import CrewAIEventsBus, crewai_event_bus
+from .crewai_event_bus import CrewAIEventsBus, RunEventBus, crewai_event_bus
 from .tool_usage_events import (
     ToolUsageFinishedEvent,
     ToolUsageErrorEvent,
@@ -73,6 +73,7 @@ __all__ = [
     "EventListener",
     "agentops_listener",
     "CrewAIEventsBus",
+    "RunEventBus",
     "crewai_event_bus",
     "AgentExecutionStartedEvent",
     "AgentExecutionCompletedEvent",
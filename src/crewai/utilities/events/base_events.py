@@ -1,9 +1,16 @@
+import copy
+import json
+import time
+from dataclasses import dataclass, field, fields, replace
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Iterator, Optional, Tuple, Type, TypeVar
 from pydantic import BaseModel, Field
 
 from crewai.utilities.serialization import to_serializable
 
+# Converts monotonic clock readings to wall-clock time
+_EPOCH_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
 
 class BaseEvent(BaseModel):
     """Base class for all events"""
@@ -25,3 +32,91 @@ class BaseEvent(BaseModel):
             dict: A JSON-serializable dictionary.
         """
         return to_serializable(self, exclude=exclude)
+
+
+_CompactEventT = TypeVar("_CompactEventT", bound="CompactEvent")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CompactEvent:
+    """Base class for events emitted on hot paths, such as stream chunks.
+
+    Compact events are frozen dataclasses with slots rather than Pydantic
+    models: their fields are stored as given, without validation or copies,
+    and their creation time is read from the monotonic clock and only turned
+    into a `datetime` when `timestamp` is read. They are converted to plain
+    data at serialization boundaries, with `to_json` or `model_dump`.
+
+    Compact events are not `BaseEvent` instances. Handlers registered for
+    any of the classes in `event_bases`, `BaseEvent` by default, still
+    receive them, and `model_dump_json` and `model_copy` are provided for
+    code written against Pydantic events.
+    """
+
+    type: ClassVar[str]
+    event_bases: ClassVar[Tuple[Type[Any], ...]] = (BaseEvent,)
+    source_fingerprint: Optional[str] = None
+    source_type: Optional[str] = None
+    fingerprint_metadata: Optional[Dict[str, Any]] = None
+    monotonic_ns: int = field(
+        default_factory=time.monotonic_ns, repr=False, compare=False
+    )
+
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock time at which the event was created."""
+        return datetime.fromtimestamp(
+            (self.monotonic_ns + _EPOCH_OFFSET_NS) / 1e9, tz=timezone.utc
+        )
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        # Same fields, in the same order, as iterating over a BaseEvent
+        yield "timestamp", self.timestamp
+        yield "type", self.type
+        for event_field in fields(self):
+            if event_field.name != "monotonic_ns":
+                yield event_field.name, getattr(self, event_field.name)
+
+    def model_dump(self, exclude: set[str] | None = None) -> Dict[str, Any]:
+        """Return the fields of the event as a dictionary, like a BaseEvent."""
+        return {key: value for key, value in self if not exclude or key not in exclude}
+
+    def to_json(self, exclude: set[str] | None = None):
+        """
+        Converts the event to a JSON-serializable dictionary.
+
+        Args:
+            exclude (set[str], optional): Set of keys to exclude from the result. Defaults to None.
+
+        Returns:
+            dict: A JSON-serializable dictionary.
+        """
+        return to_serializable(self.model_dump(), exclude=exclude)
+
+    def model_dump_json(self, exclude: set[str] | None = None) -> str:
+        """Return the event serialized to a JSON string, like a BaseEvent."""
+        return json.dumps(self.to_json(exclude=exclude))
+
+    def model_copy(
+        self: _CompactEventT,
+        *,
+        update: Optional[Dict[str, Any]] = None,
+        deep: bool = False,
+    ) -> _CompactEventT:
+        """Return a copy of the event with the fields in `update` replaced.
+
+        Compact events are frozen, so this is how a changed event is made.
+        The copy keeps the creation time of the original event.
+        """
+        event = copy.deepcopy(self) if deep else self
+        return replace(event, **(update or {}))
+
+
+def is_event_subclass(event_type: type, registered_type: type) -> bool:
+    """Whether handlers of `registered_type` receive events of `event_type`."""
+    if issubclass(event_type, registered_type):
+        return True
+    return any(
+        issubclass(base, registered_type)
+        for base in getattr(event_type, "event_bases", ())
+    )
@@ -1,36 +1,42 @@
 import threading
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, List, Type, TypeVar, cast
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from blinker import Signal
 
-from crewai.utilities.events.base_events import BaseEvent
+from crewai.utilities.events.base_events import (
+    BaseEvent,
+    CompactEvent,
+    is_event_subclass,
+)
 from crewai.utilities.events.event_types import EventTypes
+from crewai.utilities.profiling import profiled
 
-EventT = TypeVar("EventT", bound=BaseEvent)
+Event = Union[BaseEvent, CompactEvent]
+EventT = TypeVar("EventT", bound=Event)
 
 
-class CrewAIEventsBus:
-    """
-    A singleton event bus that uses blinker signals for event handling.
-    Allows both internal (Flow/Crew) and external event handling.
-    """
+class _HandlerRegistry:
+    """Event handlers keyed by event type, shared by the global and run buses."""
 
-    _instance = None
-    _lock = threading.Lock()
-
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:  # prevent race condition
-                    cls._instance = super(CrewAIEventsBus, cls).__new__(cls)
-                    cls._instance._initialize()
-        return cls._instance
-
-    def _initialize(self) -> None:
-        """Initialize the event bus internal state"""
-        self._signal = Signal("crewai_event_bus")
-        self._handlers: Dict[Type[BaseEvent], List[Callable]] = {}
+    def _init_registry(self) -> None:
+        self._handlers: Dict[Type[Event], List[Callable]] = {}
+        # Concrete event class -> handlers it is dispatched to, so emitting
+        # does not check the event against every registered type
+        self._dispatch_cache: Dict[Type[Event], List[Callable]] = {}
+        self._registry_lock = threading.Lock()
 
     def on(
         self, event_type: Type[EventT]
@@ -50,16 +56,118 @@ class CrewAIEventsBus:
         def decorator(
             handler: Callable[[Any, EventT], None],
         ) -> Callable[[Any, EventT], None]:
-            if event_type not in self._handlers:
-                self._handlers[event_type] = []
-            self._handlers[event_type].append(
-                cast(Callable[[Any, EventT], None], handler)
-            )
+            self.register_handler(event_type, handler)  # type: ignore[arg-type]
             return handler
 
         return decorator
 
-    def emit(self, source: Any, event: BaseEvent) -> None:
+    def register_handler(
+        self, event_type: Type[EventTypes], handler: Callable[[Any, EventTypes], None]
+    ) -> None:
+        """Register an event handler for a specific event type"""
+        with self._registry_lock:
+            # Lists are replaced rather than mutated so that concurrent emits
+            # keep iterating over a consistent snapshot
+            self._handlers[event_type] = self._handlers.get(event_type, []) + [
+                cast(Callable[[Any, EventTypes], None], handler)
+            ]
+            self._dispatch_cache = {}
+
+    def remove_handler(
+        self, event_type: Type[EventTypes], handler: Callable[[Any, EventTypes], None]
+    ) -> None:
+        """Unregister a handler previously registered for an event type"""
+        with self._registry_lock:
+            if event_type in self._handlers:
+                self._handlers[event_type] = [
+                    registered
+                    for registered in self._handlers[event_type]
+                    if registered != handler
+                ]
+                self._dispatch_cache = {}
+
+    def _handlers_for(self, event_type: Type[Event]) -> List[Callable]:
+        handlers = self._dispatch_cache.get(event_type)
+        if handlers is None:
+            with self._registry_lock:
+                handlers = [
+                    handler
+                    for registered_type, registered in self._handlers.items()
+                    if is_event_subclass(event_type, registered_type)
+                    for handler in registered
+                ]
+                self._dispatch_cache[event_type] = handlers
+        return handlers
+
+    def _dispatch(self, source: Any, event: Event) -> None:
+        for handler in self._handlers_for(type(event)):
+            try:
+                handler(source, event)
+            except Exception as e:
+                print(
+                    f"[EventBus Error] Handler '{handler.__name__}' failed for event '{type(event).__name__}': {e}"
+                )
+
+
+class RunEventBus(_HandlerRegistry):
+    """Handlers that only receive the events of one run.
+
+    Created by `CrewAIEventsBus.run_scope`. Events emitted inside the scope,
+    including from threads started with a copy of its context, still reach
+    every global handler and are then dispatched to the handlers of each
+    enclosing run bus, outermost first. A run bus is only referenced by the
+    context of its run, so it is garbage-collected along with its handlers
+    once the run is over.
+    """
+
+    def __init__(self, parent: Optional["RunEventBus"] = None) -> None:
+        self._init_registry()
+        self.parent = parent
+
+    def has_handlers(self, event_type: Type[Event]) -> bool:
+        """Check whether this bus or an enclosing run bus handles the event type."""
+        run_bus: Optional[RunEventBus] = self
+        while run_bus is not None:
+            if run_bus._handlers_for(event_type):
+                return True
+            run_bus = run_bus.parent
+        return False
+
+    def _dispatch_run(self, source: Any, event: Event) -> None:
+        if self.parent is not None:
+            self.parent._dispatch_run(source, event)
+        self._dispatch(source, event)
+
+
+_current_run_bus: ContextVar[Optional[RunEventBus]] = ContextVar(
+    "crewai_run_event_bus", default=None
+)
+
+
+class CrewAIEventsBus(_HandlerRegistry):
+    """
+    A singleton event bus that uses blinker signals for event handling.
+    Allows both internal (Flow/Crew) and external event handling.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:  # prevent race condition
+                    cls._instance = super(CrewAIEventsBus, cls).__new__(cls)
+                    cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self) -> None:
+        """Initialize the event bus internal state"""
+        self._signal = Signal("crewai_event_bus")
+        self._init_registry()
+
+    @profiled("event_emission")
+    def emit(self, source: Any, event: Event) -> None:
         """
         Emit an event to all registered handlers
 
@@ -67,27 +175,47 @@ class CrewAIEventsBus:
             source: The object emitting the event
             event: The event instance to emit
         """
-        for event_type, handlers in self._handlers.items():
-            if isinstance(event, event_type):
-                for handler in handlers:
-                    try:
-                        handler(source, event)
-                    except Exception as e:
-                        print(
-                            f"[EventBus Error] Handler '{handler.__name__}' failed for event '{event_type.__name__}': {e}"
-                        )
+        self._dispatch(source, event)
+        run_bus = _current_run_bus.get()
+        if run_bus is not None:
+            run_bus._dispatch_run(source, event)
 
         self._signal.send(source, event=event)
 
-    def register_handler(
-        self, event_type: Type[EventTypes], handler: Callable[[Any, EventTypes], None]
-    ) -> None:
-        """Register an event handler for a specific event type"""
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(
-            cast(Callable[[Any, EventTypes], None], handler)
-        )
+    def has_handlers(self, event_type: Type[Event]) -> bool:
+        """Check whether an event of the given type would reach any handler.
+
+        Lets emitters skip building expensive event payloads nobody receives.
+        """
+        if self._signal.receivers or self._handlers_for(event_type):
+            return True
+        run_bus = _current_run_bus.get()
+        return run_bus is not None and run_bus.has_handlers(event_type)
+
+    @contextmanager
+    def run_scope(self) -> Iterator[RunEventBus]:
+        """
+        Context manager giving a run its own event bus.
+
+        Handlers registered on the yielded bus only receive events emitted
+        within the scope, so concurrent runs, for example the requests of a
+        web server, do not see each other's events. Unlike `scoped_handlers`,
+        it leaves the global handlers untouched and is safe to use from
+        several threads at once.
+
+        Usage:
+            with crewai_event_bus.run_scope() as run_bus:
+                @run_bus.on(TaskCompletedEvent)
+                def on_task_completed(source, event):
+                    print(f"Task completed: {event.output.raw}")
+                crew.kickoff()
+        """
+        run_bus = RunEventBus(parent=_current_run_bus.get())
+        token = _current_run_bus.set(run_bus)
+        try:
+            yield run_bus
+        finally:
+            _current_run_bus.reset(token)
 
     @contextmanager
     def scoped_handlers(self):
@@ -103,12 +231,16 @@ class CrewAIEventsBus:
                 # Do stuff...
             # Handlers are cleared after the context
         """
-        previous_handlers = self._handlers.copy()
-        self._handlers.clear()
+        with self._registry_lock:
+            previous_handlers = self._handlers
+            self._handlers = {}
+            self._dispatch_cache = {}
         try:
             yield
         finally:
-            self._handlers = previous_handlers
+            with self._registry_lock:
+                self._handlers = previous_handlers
+                self._dispatch_cache = {}
 
 
 # Global instance
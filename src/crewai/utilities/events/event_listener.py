@@ -1,9 +1,6 @@
-from io import StringIO
 from typing import Any, Dict
 
 from pydantic import Field, PrivateAttr
-from crewai.llm import LLM
-from crewai.task import Task
 from crewai.telemetry.telemetry import Telemetry
 from crewai.utilities import Logger
 from crewai.utilities.constants import EMITTER_COLOR
@@ -76,9 +73,9 @@ class EventListener(BaseEventListener):
     _instance = None
     _telemetry: Telemetry = PrivateAttr(default_factory=lambda: Telemetry())
     logger = Logger(verbose=True, default_color=EMITTER_COLOR)
-    execution_spans: Dict[Task, Any] = Field(default_factory=dict)
-    next_chunk = 0
-    text_stream = StringIO()
+    # Keyed by Task; crewai.task and crewai.llm import this module, so neither
+    # is imported here at module level
+    execution_spans: Dict[Any, Any] = Field(default_factory=dict)
     knowledge_retrieval_in_progress = False
     knowledge_query_in_progress = False
 
@@ -294,6 +291,8 @@ class EventListener(BaseEventListener):
 
         @crewai_event_bus.on(ToolUsageStartedEvent)
         def on_tool_usage_started(source, event: ToolUsageStartedEvent):
+            from crewai.llm import LLM
+
             if isinstance(source, LLM):
                 self.formatter.handle_llm_tool_usage_started(
                     event.tool_name,
@@ -308,6 +307,8 @@ class EventListener(BaseEventListener):
 
         @crewai_event_bus.on(ToolUsageFinishedEvent)
         def on_tool_usage_finished(source, event: ToolUsageFinishedEvent):
+            from crewai.llm import LLM
+
             if isinstance(source, LLM):
                 self.formatter.handle_llm_tool_usage_finished(
                     event.tool_name,
@@ -321,6 +322,8 @@ class EventListener(BaseEventListener):
 
         @crewai_event_bus.on(ToolUsageErrorEvent)
         def on_tool_usage_error(source, event: ToolUsageErrorEvent):
+            from crewai.llm import LLM
+
             if isinstance(source, LLM):
                 self.formatter.handle_llm_tool_usage_error(
                     event.tool_name,
@@ -365,14 +368,7 @@ class EventListener(BaseEventListener):
 
         @crewai_event_bus.on(LLMStreamChunkEvent)
         def on_llm_stream_chunk(source, event: LLMStreamChunkEvent):
-            self.text_stream.write(event.chunk)
-
-            self.text_stream.seek(self.next_chunk)
-
-            # Read from the in-memory stream
-            content = self.text_stream.read()
-            print(content, end="", flush=True)
-            self.next_chunk = self.text_stream.tell()
+            print(event.chunk, end="", flush=True)
 
         # ----------- LLM GUARDRAIL EVENTS -----------
 
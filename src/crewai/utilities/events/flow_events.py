@@ -1,6 +1,6 @@
 from typing import Any, Dict, Optional, Union
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from .base_events import BaseEvent
 
@@ -44,6 +44,14 @@ class MethodExecutionFinishedEvent(FlowEvent):
     method_name: str
     result: Any = None
     state: Union[Dict[str, Any], BaseModel]
+    queue_wait: Optional[float] = Field(
+        default=None,
+        description="Seconds a synchronous method waited for a worker before running",
+    )
+    cpu_time: Optional[float] = Field(
+        default=None,
+        description="CPU seconds the worker spent running a synchronous method",
+    )
     type: str = "method_execution_finished"
 
 
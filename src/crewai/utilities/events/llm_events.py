@@ -1,9 +1,10 @@
+from dataclasses import InitVar, dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
-from crewai.utilities.events.base_events import BaseEvent
+from crewai.utilities.events.base_events import BaseEvent, CompactEvent
 
 class LLMEventBase(BaseEvent):
     task_name: Optional[str] = None
@@ -81,9 +82,28 @@ class ToolCall(BaseModel):
     index: int
 
 
-class LLMStreamChunkEvent(LLMEventBase):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LLMStreamChunkEvent(CompactEvent):
     """Event emitted when a streaming chunk is received"""
 
-    type: str = "llm_stream_chunk"
+    type: ClassVar[str] = "llm_stream_chunk"
+    event_bases: ClassVar[Tuple[Type[Any], ...]] = (LLMEventBase,)
+    task_name: Optional[str] = None
+    task_id: Optional[str] = None
+    agent_id: Optional[str] = None
+    agent_role: Optional[str] = None
     chunk: str
     tool_call: Optional[ToolCall] = None
+    from_task: InitVar[Optional[Any]] = None
+    from_agent: InitVar[Optional[Any]] = None
+
+    def __post_init__(self, from_task: Any, from_agent: Any) -> None:
+        if isinstance(self.tool_call, dict):
+            object.__setattr__(self, "tool_call", ToolCall(**self.tool_call))
+        if from_task:
+            object.__setattr__(self, "task_id", from_task.id)
+            object.__setattr__(self, "task_name", from_task.name)
+        agent = from_task.agent if from_task else from_agent
+        if agent:
+            object.__setattr__(self, "agent_id", agent.id)
+            object.__setattr__(self, "agent_role", agent.role)
@@ -1,12 +1,14 @@
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Optional
 
-from crewai.utilities.events.base_events import BaseEvent
+from crewai.utilities.events.base_events import BaseEvent, CompactEvent
 
 
-class MemoryQueryStartedEvent(BaseEvent):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class MemoryQueryStartedEvent(CompactEvent):
     """Event emitted when a memory query is started"""
 
-    type: str = "memory_query_started"
+    type: ClassVar[str] = "memory_query_started"
     query: str
     limit: int
     score_threshold: Optional[float] = None
@@ -1,7 +1,8 @@
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, Type
 
-from .base_events import BaseEvent
+from .base_events import BaseEvent, CompactEvent
 
 
 class ToolUsageEvent(BaseEvent):
@@ -31,10 +32,29 @@ class ToolUsageEvent(BaseEvent):
                 self.fingerprint_metadata = self.agent.fingerprint.metadata
 
 
-class ToolUsageStartedEvent(ToolUsageEvent):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ToolUsageStartedEvent(CompactEvent):
     """Event emitted when a tool execution is started"""
 
-    type: str = "tool_usage_started"
+    type: ClassVar[str] = "tool_usage_started"
+    event_bases: ClassVar[Tuple[Type[Any], ...]] = (ToolUsageEvent,)
+    agent_key: Optional[str] = None
+    agent_role: Optional[str] = None
+    tool_name: str
+    tool_args: Dict[str, Any] | str
+    tool_class: Optional[str] = None
+    run_attempts: int | None = None
+    delegations: int | None = None
+    agent: Optional[Any] = None
+
+    def __post_init__(self) -> None:
+        # Set fingerprint data from the agent
+        fingerprint = getattr(self.agent, "fingerprint", None) if self.agent else None
+        if fingerprint:
+            object.__setattr__(self, "source_fingerprint", fingerprint.uuid_str)
+            object.__setattr__(self, "source_type", "agent")
+            if getattr(fingerprint, "metadata", None):
+                object.__setattr__(self, "fingerprint_metadata", fingerprint.metadata)
 
 
 class ToolUsageFinishedEvent(ToolUsageEvent):
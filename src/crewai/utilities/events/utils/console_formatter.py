@@ -1,3 +1,4 @@
+import os
 from typing import Any, Dict, Optional
 
 from rich.console import Console
@@ -8,6 +9,30 @@ from rich.live import Live
 from rich.syntax import Syntax
 
 
+class _ThrottledLive(Live):
+    """A Live display that only redraws when its renderable has changed.
+
+    Callers mark the display dirty instead of refreshing it, so rendering
+    happens on the refresh thread at most ``refresh_per_second`` times a second
+    and bursts of events between two frames cost a single render.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._dirty = True
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    def refresh(self) -> None:
+        with self._lock:
+            # The final refresh on stop() always renders
+            if not self._dirty and self._started:
+                return
+            self._dirty = False
+            super().refresh()
+
+
 class ConsoleFormatter:
     current_crew_tree: Optional[Tree] = None
     current_task_branch: Optional[Tree] = None
@@ -21,15 +46,26 @@ class ConsoleFormatter:
     _live_paused: bool = False
     current_llm_tool_tree: Optional[Tree] = None
 
-    def __init__(self, verbose: bool = False):
+    def __init__(
+        self,
+        verbose: bool = False,
+        headless: Optional[bool] = None,
+        refresh_per_second: float = 4,
+    ):
         self.console = Console(width=None)
         self.verbose = verbose
+        # Headless mode never builds or renders the crew, flow and agent trees,
+        # only the status panels, which suits logs collected from non-terminals
+        if headless is None:
+            headless = os.getenv("CREWAI_HEADLESS", "false").lower() == "true"
+        self.headless = headless
+        self.refresh_per_second = refresh_per_second
         # Live instance to dynamically update a Tree renderable (e.g. the Crew tree)
         # When multiple Tree objects are printed sequentially we reuse this Live
         # instance so the previous render is replaced instead of writing a new one.
         # Once any non-Tree renderable is printed we stop the Live session so the
         # final Tree persists on the terminal.
-        self._live: Optional[Live] = None
+        self._live: Optional[_ThrottledLive] = None
 
     def create_panel(self, content: Text, title: str, style: str = "blue") -> Panel:
         """Create a standardized panel with consistent styling."""
@@ -91,7 +127,9 @@ class ConsoleFormatter:
         * If the argument is a single ``Tree`` instance, we either start a
           ``Live`` session (first tree) or update the existing one (subsequent
           trees). This results in the tree being rendered in-place instead of
-          being appended repeatedly to the log.
+          being appended repeatedly to the log. Updates only mark the display
+          as changed; it is redrawn by the Live refresh thread, so the calling
+          thread never waits for a render. Trees are never shown when headless.
 
         * A blank call (no positional arguments) is ignored while a Live
           session is active so it does not prematurely terminate the tree
@@ -105,14 +143,22 @@ class ConsoleFormatter:
         # Case 1: updating / starting live Tree rendering
         if len(args) == 1 and isinstance(args[0], Tree):
             tree = args[0]
+            if self.headless:
+                return
 
             if not self._live:
                 # Start a new Live session for the first tree
-                self._live = Live(tree, console=self.console, refresh_per_second=4)
+                self._live = _ThrottledLive(
+                    tree,
+                    console=self.console,
+                    refresh_per_second=self.refresh_per_second,
+                )
                 self._live.start()
             else:
-                # Update existing Live session
-                self._live.update(tree, refresh=True)
+                # Update existing Live session, the refresh thread redraws it
+                if self._live.renderable is not tree:
+                    self._live.update(tree)
+                self._live.mark_dirty()
             return  # Nothing else to do
 
         # Case 2: blank line while a live session is running – ignore so we
@@ -163,7 +209,7 @@ class ConsoleFormatter:
         final_string_output: str = "",
     ) -> None:
         """Handle crew tree updates with consistent formatting."""
-        if not self.verbose or tree is None:
+        if not self.verbose or (tree is None and not self.headless):
             return
 
         if status == "completed":
@@ -179,12 +225,13 @@ class ConsoleFormatter:
             title = "Crew Execution"
             content_title = "Crew Execution Started"
 
-        self.update_tree_label(
-            tree,
-            prefix,
-            crew_name or "Crew",
-            style,
-        )
+        if tree is not None:
+            self.update_tree_label(
+                tree,
+                prefix,
+                crew_name or "Crew",
+                style,
+            )
 
         content = self.create_status_content(
             content_title,
@@ -201,9 +248,8 @@ class ConsoleFormatter:
         if not self.verbose:
             return None
 
-        tree = Tree(
-            Text("🚀 Crew: ", style="cyan bold") + Text(crew_name, style="cyan")
-        )
+        # Tool usage is counted per run
+        self.tool_usage_counts = {}
 
         content = self.create_status_content(
             "Crew Execution Started",
@@ -214,6 +260,12 @@ class ConsoleFormatter:
 
         self.print_panel(content, "Crew Execution Started", "cyan")
 
+        tree = None
+        if not self.headless:
+            tree = Tree(
+                Text("🚀 Crew: ", style="cyan bold") + Text(crew_name, style="cyan")
+            )
+
         # Set the current_crew_tree attribute directly
         self.current_crew_tree = tree
 
@@ -253,7 +305,7 @@ class ConsoleFormatter:
         status: str = "completed",
     ) -> None:
         """Update task status in the tree."""
-        if not self.verbose or crew_tree is None:
+        if not self.verbose or (crew_tree is None and not self.headless):
             return
 
         if status == "completed":
@@ -266,7 +318,7 @@ class ConsoleFormatter:
             panel_title = "Task Failure"
 
         # Update tree label
-        for branch in crew_tree.children:
+        for branch in crew_tree.children if crew_tree is not None else []:
             if str(task_id) in str(branch.label):
                 # Build label without introducing stray blank lines
                 task_content = Text()
@@ -327,6 +379,8 @@ class ConsoleFormatter:
             "Starting Flow Execution", flow_name, "blue", ID=flow_id
         )
         self.print_panel(content, "Flow Execution", "blue", is_flow=True)
+        if self.headless:
+            return None
 
         # Create initial tree with flow ID
         flow_label = Text()
@@ -343,6 +397,9 @@ class ConsoleFormatter:
 
     def start_flow(self, flow_name: str, flow_id: str) -> Optional[Tree]:
         """Initialize a flow execution tree."""
+        if self.headless:
+            return None
+
         flow_tree = Tree("")
         flow_label = Text()
         flow_label.append("🌊 Flow: ", style="blue bold")
@@ -367,7 +424,23 @@ class ConsoleFormatter:
         status: str = "completed",
     ) -> None:
         """Update flow status in the tree."""
+        if flow_tree is None and not self.headless:
+            return
+
+        content = self.create_status_content(
+            (
+                "Flow Execution Completed"
+                if status == "completed"
+                else "Flow Execution Failed"
+            ),
+            flow_name,
+            "green" if status == "completed" else "red",
+            ID=flow_id,
+        )
         if flow_tree is None:
+            self.print_panel(
+                content, "Flow Completion", "green" if status == "completed" else "red"
+            )
             return
 
         # Update main flow label
@@ -391,16 +464,6 @@ class ConsoleFormatter:
                 )
                 break
 
-        content = self.create_status_content(
-            (
-                "Flow Execution Completed"
-                if status == "completed"
-                else "Flow Execution Failed"
-            ),
-            flow_name,
-            "green" if status == "completed" else "red",
-            ID=flow_id,
-        )
         self.print(flow_tree)
         self.print_panel(
             content, "Flow Completion", "green" if status == "completed" else "red"
@@ -900,7 +963,7 @@ class ConsoleFormatter:
 
     def create_lite_agent_branch(self, lite_agent_role: str) -> Optional[Tree]:
         """Create and initialize a lite agent branch."""
-        if not self.verbose:
+        if not self.verbose or self.headless:
             return None
 
         # Create initial tree for LiteAgent if it doesn't exist
@@ -0,0 +1,190 @@
+"""Append-only JSON Lines execution logs with rotation and background flushing."""
+
+import atexit
+import glob
+import gzip
+import json
+import os
+import shutil
+import threading
+import time
+import weakref
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+_writers: "weakref.WeakSet[ExecutionLogWriter]" = weakref.WeakSet()
+
+
+class ExecutionLogWriter:
+    """Appends log entries to a JSON Lines file.
+
+    Entries are appended to a buffered file handle and never re-read, so
+    writing costs the same however large the log has grown. A background
+    thread flushes the buffer every ``flush_interval`` seconds, and pending
+    entries are flushed when the interpreter exits.
+
+    Args:
+        path: Path of the log file. Rotated segments are stored next to it as
+            ``<path>.1``, ``<path>.2``, ... from newest to oldest.
+        max_bytes: Rotate once the current segment reaches this size.
+        max_age: Rotate once the current segment is older than this many
+            seconds.
+        backup_count: Number of rotated segments to keep.
+        compress: Gzip rotated segments, which are then named ``<path>.N.gz``.
+        flush_interval: Seconds between background flushes. When None, every
+            entry is flushed as it is written.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+        backup_count: int = 5,
+        compress: bool = False,
+        flush_interval: Optional[float] = 1.0,
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.backup_count = backup_count
+        self.compress = compress
+        self.flush_interval = flush_interval
+        self._file: Optional[IO[str]] = None
+        self._opened_at = 0.0
+        self._size = 0
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        _writers.add(self)
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        """Append one entry to the log."""
+        line = json.dumps(entry, default=str) + "\n"
+        size = len(line.encode("utf-8"))
+        with self._lock:
+            file = self._file or self._open()
+            if self._should_rotate(size):
+                file = self._rotate()
+            file.write(line)
+            self._size += size
+            if self.flush_interval is None:
+                file.flush()
+            elif self._flusher is None:
+                self._start_flusher()
+
+    def flush(self) -> None:
+        """Write buffered entries to disk."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Flush buffered entries and close the log file."""
+        with self._lock:
+            self._closed.set()
+            # A later write reopens the file and starts a new flush thread
+            self._closed = threading.Event()
+            self._flusher = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def segments(self) -> List[str]:
+        """Paths of the log's segments, from oldest to newest."""
+        return _segments(self.path)
+
+    def _open(self) -> IO[str]:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._opened_at = time.monotonic()
+        self._size = os.path.getsize(self.path)
+        return self._file
+
+    def _should_rotate(self, pending: int) -> bool:
+        # Sizes are tracked here because tell() would flush the buffer
+        if not self._size:
+            return False
+        if self.max_bytes is not None and self._size + pending > self.max_bytes:
+            return True
+        if self.max_age is not None:
+            return time.monotonic() - self._opened_at >= self.max_age
+        return False
+
+    def _rotate(self) -> IO[str]:
+        assert self._file is not None
+        self._file.close()
+
+        for index in range(self.backup_count - 1, 0, -1):
+            for ext in (".gz", ""):
+                backup = f"{self.path}.{index}{ext}"
+                if os.path.exists(backup):
+                    os.replace(backup, f"{self.path}.{index + 1}{ext}")
+        if self.backup_count <= 0:
+            os.remove(self.path)
+        elif self.compress:
+            with open(self.path, "rb") as plain, gzip.open(
+                f"{self.path}.1.gz", "wb"
+            ) as gz:
+                shutil.copyfileobj(plain, gz)
+            os.remove(self.path)
+        else:
+            os.replace(self.path, f"{self.path}.1")
+        return self._open()
+
+    def _start_flusher(self) -> None:
+        self._flusher = threading.Thread(
+            target=_flush_periodically,
+            args=(weakref.ref(self), self._closed, self.flush_interval),
+            name="crewai-execution-log-flush",
+            daemon=True,
+        )
+        self._flusher.start()
+
+
+def _flush_periodically(
+    writer_ref: "weakref.ref[ExecutionLogWriter]",
+    closed: threading.Event,
+    interval: float,
+) -> None:
+    # Holds the writer weakly so that an unused writer can still be collected
+    while not closed.wait(interval):
+        writer = writer_ref()
+        if writer is None:
+            return
+        writer.flush()
+        del writer
+
+
+@atexit.register
+def _flush_all() -> None:
+    for writer in list(_writers):
+        writer.flush()
+
+
+def read_execution_log(path: str) -> Iterator[Dict[str, Any]]:
+    """Iterate lazily over the entries of an execution log.
+
+    Rotated segments, compressed or not, are read first, oldest to newest,
+    followed by the current log file. Lines are decoded one at a time, so
+    logs of any size can be scanned in constant memory.
+    """
+    for segment in _segments(path):
+        opener = gzip.open if segment.endswith(".gz") else open
+        with opener(segment, "rt", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _segments(path: str) -> List[str]:
+    rotated = []
+    for candidate in glob.glob(glob.escape(path) + ".*"):
+        index = candidate[len(path) + 1 :].removesuffix(".gz")
+        if index.isdigit():
+            rotated.append((int(index), candidate))
+    segments = [candidate for _, candidate in sorted(rotated, reverse=True)]
+    if os.path.exists(path):
+        segments.append(path)
+    return segments
@@ -1,55 +1,68 @@
 import json
 import os
 import pickle
+import textwrap
+import weakref
 from datetime import datetime
-from typing import Union
+from typing import Any, Dict, Union
+
+from crewai.utilities.execution_log import ExecutionLogWriter
+
+# Crews copied by kickoff_for_each log to the same file through one writer
+_jsonl_writers: "weakref.WeakValueDictionary[str, ExecutionLogWriter]" = (
+    weakref.WeakValueDictionary()
+)
 
 
 class FileHandler:
-    """Handler for file operations supporting both JSON and text-based logging.
-    
+    """Handler for file operations supporting JSON, JSON Lines and text-based logging.
+
     Args:
-        file_path (Union[bool, str]): Path to the log file or boolean flag
+        file_path (Union[bool, str, ExecutionLogWriter]): Path to the log file,
+            boolean flag, or a configured writer for rotated JSON Lines logs
     """
 
-    def __init__(self, file_path: Union[bool, str]):
+    def __init__(self, file_path: Union[bool, str, ExecutionLogWriter]):
+        self._writer = None
+        if isinstance(file_path, ExecutionLogWriter):
+            self._writer = file_path
+            self._path = file_path.path
+            return
         self._initialize_path(file_path)
-        
+        if self._path.endswith(".jsonl"):
+            real_path = os.path.realpath(self._path)
+            self._writer = _jsonl_writers.get(real_path)
+            if self._writer is None:
+                self._writer = _jsonl_writers[real_path] = ExecutionLogWriter(
+                    self._path
+                )
+
     def _initialize_path(self, file_path: Union[bool, str]):
         if file_path is True:  # File path is boolean True
             self._path = os.path.join(os.curdir, "logs.txt")
-        
+
         elif isinstance(file_path, str):  # File path is a string
-            if file_path.endswith((".json", ".txt")):
-                self._path = file_path  # No modification if the file ends with .json or .txt
+            if file_path.endswith((".json", ".jsonl", ".txt")):
+                self._path = file_path  # No modification if the file ends with .json, .jsonl or .txt
             else:
-                self._path = file_path + ".txt"  # Append .txt if the file doesn't end with .json or .txt
-        
+                self._path = file_path + ".txt"  # Append .txt if the file doesn't end with .json, .jsonl or .txt
+
         else:
             raise ValueError("file_path must be a string or boolean.")  # Handle the case where file_path isn't valid
-        
+
     def log(self, **kwargs):
         try:
             now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_entry = {"timestamp": now, **kwargs}
 
-            if self._path.endswith(".json"):
+            if self._writer is not None:
+                # Append log in JSON Lines format
+                self._writer.write(log_entry)
+
+            elif self._path.endswith(".json"):
                 # Append log in JSON format
-                with open(self._path, "a", encoding="utf-8") as file:
-                    # If the file is empty, start with a list; else, append to it
-                    try:
-                        # Try reading existing content to avoid overwriting
-                        with open(self._path, "r", encoding="utf-8") as read_file:
-                            existing_data = json.load(read_file)
-                            existing_data.append(log_entry)
-                    except (json.JSONDecodeError, FileNotFoundError):
-                        # If no valid JSON or file doesn't exist, start with an empty list
-                        existing_data = [log_entry]
-                    
-                    with open(self._path, "w", encoding="utf-8") as write_file:
-                        json.dump(existing_data, write_file, indent=4)
-                        write_file.write("\n")
-            
+                self._append_to_json_array(log_entry)
+
             else:
                 # Append log in plain text format
                 message = f"{now}: " + ", ".join([f"{key}=\"{value}\"" for key, value in kwargs.items()]) + "\n"
@@ -58,7 +71,41 @@ class FileHandler:
 
         except Exception as e:
             raise ValueError(f"Failed to log message: {str(e)}")
-        
+
+    def flush(self) -> None:
+        """Write buffered JSON Lines entries to disk."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def _append_to_json_array(self, log_entry: Dict[str, Any]) -> None:
+        """Append an entry to a JSON array file without rewriting it.
+
+        Only the closing bracket at the end of the file is replaced, so the
+        cost does not grow with the number of entries already logged.
+        """
+        entry = textwrap.indent(json.dumps(log_entry, indent=4), " " * 4).encode(
+            "utf-8"
+        )
+        try:
+            with open(self._path, "r+b") as file:
+                file.seek(0, os.SEEK_END)
+                tail_start = max(file.tell() - 4096, 0)
+                file.seek(tail_start)
+                tail = file.read().rstrip()
+                if tail.endswith(b"]") and tail[:-1].rstrip():
+                    body = tail[:-1].rstrip()
+                    separator = b"\n" if body.endswith(b"[") else b",\n"
+                    file.seek(tail_start + len(body))
+                    file.truncate()
+                    file.write(separator + entry + b"\n]\n")
+                    return
+        except FileNotFoundError:
+            pass
+        # If no valid JSON array or file doesn't exist, start with a new list
+        with open(self._path, "wb") as file:
+            file.write(b"[\n" + entry + b"\n]\n")
+
+
 class PickleHandler:
     def __init__(self, file_name: str) -> None:
         """
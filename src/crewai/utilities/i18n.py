@@ -1,14 +1,89 @@
 import json
 import os
-from typing import Dict, Optional, Union
+import sys
+import threading
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 """Internationalization support for CrewAI prompts and messages."""
 
+DEFAULT_PROMPT_FILE = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "../translations/en.json"
+)
+
+# realpath -> (mtime, catalog); shared by every I18N of the process
+_catalogs: Dict[str, Tuple[int, Mapping[str, Any]]] = {}
+_catalogs_lock = threading.Lock()
+
+
+class _FrozenDict(dict):
+    """A read-only dict.
+
+    Copies share the instance, so agents and crews that deep-copy their I18N
+    do not duplicate the catalog.
+    """
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("Prompt catalogs are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> "_FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_FrozenDict":
+        return self
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (_FrozenDict, (dict(self),))
+
+
+def _freeze(value: Any) -> Any:
+    """Make a decoded JSON value immutable, interning its strings."""
+    if isinstance(value, dict):
+        return _FrozenDict({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def load_prompt_catalog(path: str) -> Mapping[str, Any]:
+    """Return the immutable prompt catalog stored in a JSON file.
+
+    Catalogs are parsed once per process and reused until the file's
+    modification time changes.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    real_path = os.path.realpath(path)
+    mtime = os.stat(real_path).st_mtime_ns
+    cached = _catalogs.get(real_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with _catalogs_lock:
+        cached = _catalogs.get(real_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(real_path, "r", encoding="utf-8") as f:
+            catalog = _freeze(json.load(f) or {})
+        _catalogs[real_path] = (mtime, catalog)
+        return catalog
+
+
 class I18N(BaseModel):
-    """Handles loading and retrieving internationalized prompts."""
-    _prompts: Dict[str, Dict[str, str]] = PrivateAttr()
+    """Handles loading and retrieving internationalized prompts.
+
+    Instances are views over a prompt catalog shared across the process, so
+    creating one only costs a file stat once the catalog is loaded.
+    """
+    _prompts: Mapping[str, Mapping[str, Any]] = PrivateAttr()
     prompt_file: Optional[str] = Field(
         default=None,
         description="Path to the prompt_file file to load",
@@ -18,23 +93,14 @@ class I18N(BaseModel):
     def load_prompts(self) -> "I18N":
         """Load prompts from a JSON file."""
         try:
-            if self.prompt_file:
-                with open(self.prompt_file, "r", encoding="utf-8") as f:
-                    self._prompts = json.load(f)
-            else:
-                dir_path = os.path.dirname(os.path.realpath(__file__))
-                prompts_path = os.path.join(dir_path, "../translations/en.json")
-
-                with open(prompts_path, "r", encoding="utf-8") as f:
-                    self._prompts = json.load(f)
+            self._prompts = load_prompt_catalog(
+                self.prompt_file or DEFAULT_PROMPT_FILE
+            )
         except FileNotFoundError:
             raise Exception(f"Prompt file '{self.prompt_file}' not found.")
         except json.JSONDecodeError:
             raise Exception("Error decoding JSON from the prompts file.")
 
-        if not self._prompts:
-            self._prompts = {}
-
         return self
 
     def slice(self, slice: str) -> str:
@@ -44,9 +110,25 @@ class I18N(BaseModel):
         return self.retrieve("errors", error)
 
     def tools(self, tool: str) -> Union[str, Dict[str, str]]:
-        return self.retrieve("tools", tool)
+        value = self._lookup("tools", tool)
+        return dict(value) if isinstance(value, Mapping) else value
+
+    def retrieve(self, kind: str, key: str) -> str:
+        value = self._lookup(kind, key)
+        if not isinstance(value, str):
+            raise TypeError(
+                f"Prompt for '{kind}':'{key}' is structured, use retrieve_section."
+            )
+        return value
+
+    def retrieve_section(self, kind: str, key: str) -> Dict[str, Any]:
+        """Return a structured prompt, copied so callers cannot alter the shared catalog."""
+        value = self._lookup(kind, key)
+        if not isinstance(value, Mapping):
+            raise TypeError(f"Prompt for '{kind}':'{key}' is not structured.")
+        return dict(value)
 
-    def retrieve(self, kind, key) -> str:
+    def _lookup(self, kind: str, key: str) -> Any:
         try:
             return self._prompts[kind][key]
         except Exception as _:
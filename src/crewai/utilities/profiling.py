@@ -0,0 +1,287 @@
+"""Profiling of the framework overhead in agent loops.
+
+A `RunProfiler` times the phases of the agent loop that happen between LLM
+calls (prompt formatting, output parsing, tool execution, memory, event
+emission, output conversion) and can sample the stacks of the threads running
+them. Phases are timed with `profile_phase`, which costs a single context
+variable lookup while no profiler is active.
+"""
+
+import functools
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar, Token
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from pydantic import BaseModel, Field
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Durations are bucketed by powers of two of microseconds, up to ~18 minutes
+_BUCKETS = 31
+# Position of each counter in a shard entry, followed by the bucket counts
+_COUNT, _TOTAL, _MAX = range(3)
+
+_current_profiler: ContextVar[Optional["RunProfiler"]] = ContextVar(
+    "crewai_run_profiler", default=None
+)
+_no_phase: ContextManager[None] = nullcontext()
+
+
+class PhaseStats(BaseModel):
+    """Durations of one phase of the agent loop, in seconds."""
+
+    count: int = Field(default=0, description="Number of times the phase ran")
+    total: float = Field(default=0.0, description="Total time spent in the phase")
+    max: float = Field(default=0.0, description="Longest run of the phase")
+    histogram: Dict[float, int] = Field(
+        default_factory=dict,
+        description="Number of runs by upper bound of their duration",
+    )
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the duration of the q-th percentile run (0 < q <= 100)."""
+        rank = self.count * q / 100
+        seen = 0
+        for upper_bound, count in sorted(self.histogram.items()):
+            seen += count
+            if seen >= rank:
+                return min(upper_bound, self.max)
+        return self.max
+
+
+class ProfileReport(BaseModel):
+    """Phase timings and stack samples of a profiled run."""
+
+    phases: Dict[str, PhaseStats] = Field(
+        default_factory=dict, description="Timings by phase name"
+    )
+    samples: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Sampled stacks, in the collapsed format of flamegraph tools",
+    )
+
+    def summary(self) -> str:
+        """Render the phase timings as a table, slowest phases first."""
+        lines = [
+            f"{'phase':<24}{'count':>8}{'total s':>11}{'mean ms':>11}"
+            f"{'p50 ms':>11}{'p95 ms':>11}{'max ms':>11}"
+        ]
+        for name, stats in sorted(
+            self.phases.items(), key=lambda item: item[1].total, reverse=True
+        ):
+            lines.append(
+                f"{name:<24}{stats.count:>8}{stats.total:>11.3f}"
+                f"{stats.mean * 1e3:>11.2f}{stats.percentile(50) * 1e3:>11.2f}"
+                f"{stats.percentile(95) * 1e3:>11.2f}{stats.max * 1e3:>11.2f}"
+            )
+        return "\n".join(lines)
+
+    def export_collapsed_stacks(self, path: str) -> None:
+        """Write the sampled stacks for flamegraph.pl, speedscope or inferno."""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in sorted(self.samples.items()):
+                f.write(f"{stack} {count}\n")
+
+
+class RunProfiler:
+    """Times the phases of the agent loops of a run.
+
+    Like the usage ledger, every thread records into its own shard, so timing
+    a phase never takes a lock. While the profiler is active, phases timed in
+    the current context, including threads started with a copy of it, are
+    recorded by this profiler.
+
+    Args:
+        sample_interval: Seconds between stack samples of the threads running
+            a phase. Sampling is off when None.
+    """
+
+    def __init__(self, sample_interval: Optional[float] = None) -> None:
+        self.sample_interval = sample_interval
+        self._local = threading.local()
+        self._shards: List[Dict[str, List[float]]] = []
+        # Thread id -> names of the phases the thread is in, innermost last
+        self._stacks: Dict[int, List[str]] = {}
+        self._samples: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._active = 0
+        self._sampler: Optional[threading.Thread] = None
+        self._sampler_done = threading.Event()
+
+    def activate(self) -> Token:
+        """Record the phases timed in the current context with this profiler."""
+        with self._lock:
+            self._active += 1
+            if self.sample_interval and self._sampler is None:
+                self._sampler_done = threading.Event()
+                self._sampler = threading.Thread(
+                    target=self._sample,
+                    args=(self._sampler_done,),
+                    name="crewai-profiler-sampler",
+                    daemon=True,
+                )
+                self._sampler.start()
+        return _current_profiler.set(self)
+
+    def deactivate(self, token: Token) -> None:
+        """Undo the matching `activate`, stopping the sampler after the last one."""
+        _current_profiler.reset(token)
+        with self._lock:
+            self._active -= 1
+            sampler = self._sampler if self._active == 0 else None
+            if sampler is not None:
+                self._sampler_done.set()
+                self._sampler = None
+        if sampler is not None and sampler is not threading.current_thread():
+            sampler.join()
+
+    def phase(self, name: str) -> "_PhaseTimer":
+        return _PhaseTimer(self, name)
+
+    def report(self) -> ProfileReport:
+        """Merge the shards of every thread into a report."""
+        with self._lock:
+            shards = list(self._shards)
+            samples = dict(self._samples)
+
+        report = ProfileReport(samples=samples)
+        for shard in shards:
+            # dict.copy() is atomic, unlike iterating a dict another thread grows
+            for name, counters in shard.copy().items():
+                stats = report.phases.setdefault(name, PhaseStats())
+                stats.count += int(counters[_COUNT])
+                stats.total += counters[_TOTAL]
+                stats.max = max(stats.max, counters[_MAX])
+                for bucket, count in enumerate(counters[3:]):
+                    if count:
+                        upper_bound = (1 << bucket) / 1e6
+                        stats.histogram[upper_bound] = (
+                            stats.histogram.get(upper_bound, 0) + int(count)
+                        )
+        return report
+
+    def _record(self, name: str, elapsed: float) -> None:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append(shard)
+        counters = shard.get(name)
+        if counters is None:
+            counters = shard[name] = [0.0] * (3 + _BUCKETS)
+        counters[_COUNT] += 1
+        counters[_TOTAL] += elapsed
+        if elapsed > counters[_MAX]:
+            counters[_MAX] = elapsed
+        counters[3 + min(int(elapsed * 1e6).bit_length(), _BUCKETS - 1)] += 1
+
+    def _phase_stack(self) -> List[str]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+            with self._lock:
+                self._stacks[threading.get_ident()] = stack
+        return stack
+
+    def _release_phase_stack(self) -> None:
+        """Forget the calling thread's stack once its outermost phase ends,
+        so threads that are done with the run are not kept track of."""
+        self._local.stack = None
+        with self._lock:
+            self._stacks.pop(threading.get_ident(), None)
+
+    def _sample(self, done: threading.Event) -> None:
+        interval = self.sample_interval or 0.01
+        while not done.wait(interval):
+            frames = sys._current_frames()
+            with self._lock:
+                stacks = [
+                    (thread_id, list(phases))
+                    for thread_id, phases in self._stacks.items()
+                    if phases
+                ]
+            for thread_id, phases in stacks:
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                key = ";".join(phases + _collapse(frame))
+                with self._lock:
+                    self._samples[key] = self._samples.get(key, 0) + 1
+
+
+class _PhaseTimer:
+    __slots__ = ("_profiler", "_name", "_stack", "_started_at")
+
+    def __init__(self, profiler: RunProfiler, name: str) -> None:
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._stack = self._profiler._phase_stack()
+        self._stack.append(self._name)
+        self._started_at = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        elapsed = time.perf_counter() - self._started_at
+        self._stack.pop()
+        self._profiler._record(self._name, elapsed)
+        if not self._stack:
+            self._profiler._release_phase_stack()
+
+
+def _collapse(frame: Any) -> List[str]:
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(
+            f"{getattr(code, 'co_qualname', code.co_name)} "
+            f"({code.co_filename}:{code.co_firstlineno})"
+        )
+        frame = frame.f_back
+    names.reverse()
+    return names
+
+
+def current_profiler() -> Optional[RunProfiler]:
+    """Return the profiler active in the current context, if any."""
+    return _current_profiler.get()
+
+
+def profile_phase(name: str) -> ContextManager[None]:
+    """Time a block as a phase of the active profiler; a no-op without one."""
+    profiler = _current_profiler.get()
+    if profiler is None:
+        return _no_phase
+    return profiler.phase(name)
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    """Time every call of the decorated function as a phase."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            profiler = _current_profiler.get()
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,236 @@
+"""Streaming of incremental outputs from crew and flow runs."""
+
+import asyncio
+import contextvars
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Deque, Optional
+
+from pydantic import BaseModel, Field
+
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+from crewai.utilities.events.flow_events import (
+    MethodExecutionFinishedEvent,
+    MethodExecutionStartedEvent,
+)
+from crewai.utilities.events.llm_events import LLMStreamChunkEvent
+from crewai.utilities.events.task_events import TaskCompletedEvent, TaskStartedEvent
+from crewai.utilities.events.tool_usage_events import (
+    ToolUsageErrorEvent,
+    ToolUsageFinishedEvent,
+)
+
+
+class StreamItem(BaseModel):
+    """Base class for the progress items yielded while a run streams."""
+
+    type: str
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class TaskStartedItem(StreamItem):
+    """A task started running"""
+
+    type: str = "task_started"
+    task_name: Optional[str] = None
+    agent_role: Optional[str] = None
+
+
+class TaskFinishedItem(StreamItem):
+    """A task completed"""
+
+    type: str = "task_finished"
+    task_name: Optional[str] = None
+    agent_role: Optional[str] = None
+    output: str
+
+
+class TokenItem(StreamItem):
+    """A chunk of text streamed by an LLM"""
+
+    type: str = "token"
+    chunk: str
+
+
+class ToolResultItem(StreamItem):
+    """A tool call returned or failed"""
+
+    type: str = "tool_result"
+    tool_name: str
+    agent_role: Optional[str] = None
+    output: Any = None
+    error: Optional[str] = None
+
+
+class MethodStartedItem(StreamItem):
+    """A flow method started running"""
+
+    type: str = "method_started"
+    method_name: str
+
+
+class MethodFinishedItem(StreamItem):
+    """A flow method completed"""
+
+    type: str = "method_finished"
+    method_name: str
+    result: Any = None
+
+
+class FinalOutputItem(StreamItem):
+    """The run completed; always the last item of a stream"""
+
+    type: str = "final_output"
+    output: Any = None
+
+
+class RunStream:
+    """Bounded buffer carrying the progress items of one run to its consumer.
+
+    Producers publish from the threads running the crew or flow and block
+    while `max_buffered` items are waiting, so a slow consumer slows the run
+    down instead of letting the buffer grow. The consumer reads the items
+    from its event loop. Closing the stream drops pending and future items.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_buffered: int = 1024):
+        self._loop = loop
+        self._max_buffered = max(1, max_buffered)
+        self._items: Deque[StreamItem] = deque()
+        self._condition = threading.Condition()
+        self._ready = asyncio.Event()
+        self._closed = False
+        self._finished = False
+        self._error: Optional[BaseException] = None
+
+    def publish(self, item: StreamItem) -> None:
+        with self._condition:
+            while len(self._items) >= self._max_buffered and not self._closed:
+                self._condition.wait()
+            if self._closed or self._finished:
+                return
+            self._items.append(item)
+        self._loop.call_soon_threadsafe(self._ready.set)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._finished = True
+            self._error = error
+        self._loop.call_soon_threadsafe(self._ready.set)
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._items.clear()
+            self._condition.notify_all()
+
+    async def __aiter__(self) -> AsyncIterator[StreamItem]:
+        while True:
+            await self._ready.wait()
+            with self._condition:
+                batch = list(self._items)
+                self._items.clear()
+                finished, error = self._finished, self._error
+                self._ready.clear()
+                self._condition.notify_all()
+            for item in batch:
+                yield item
+            if finished:
+                if error is not None:
+                    raise error
+                return
+
+
+def _agent_role(agent: Any) -> Optional[str]:
+    return getattr(agent, "role", None)
+
+
+def _to_stream_item(event: Any) -> Optional[StreamItem]:
+    if isinstance(event, LLMStreamChunkEvent):
+        return TokenItem(chunk=event.chunk)
+    if isinstance(event, TaskStartedEvent):
+        return TaskStartedItem(
+            task_name=getattr(event.task, "name", None),
+            agent_role=_agent_role(getattr(event.task, "agent", None)),
+        )
+    if isinstance(event, TaskCompletedEvent):
+        return TaskFinishedItem(
+            task_name=event.output.name,
+            agent_role=event.output.agent,
+            output=event.output.raw,
+        )
+    if isinstance(event, ToolUsageFinishedEvent):
+        return ToolResultItem(
+            tool_name=event.tool_name, agent_role=event.agent_role, output=event.output
+        )
+    if isinstance(event, ToolUsageErrorEvent):
+        return ToolResultItem(
+            tool_name=event.tool_name,
+            agent_role=event.agent_role,
+            error=str(event.error),
+        )
+    if isinstance(event, MethodExecutionStartedEvent):
+        return MethodStartedItem(method_name=event.method_name)
+    if isinstance(event, MethodExecutionFinishedEvent):
+        return MethodFinishedItem(method_name=event.method_name, result=event.result)
+    return None
+
+
+_STREAMED_EVENTS = (
+    LLMStreamChunkEvent,
+    TaskStartedEvent,
+    TaskCompletedEvent,
+    ToolUsageFinishedEvent,
+    ToolUsageErrorEvent,
+    MethodExecutionStartedEvent,
+    MethodExecutionFinishedEvent,
+)
+
+
+async def stream_run(
+    run: Callable[[], Any], max_buffered: int = 1024
+) -> AsyncIterator[StreamItem]:
+    """Run `run` in a worker thread and yield its progress as it happens.
+
+    Events emitted by the run, including from the threads it starts with a
+    copy of its context, are turned into stream items. The last item is a
+    `FinalOutputItem` with the return value of `run`; if `run` raises, the
+    exception is raised from the iterator instead.
+
+    Args:
+        run: Blocking callable performing the run
+        max_buffered: Number of unread items after which the run pauses
+    """
+    stream = RunStream(asyncio.get_running_loop(), max_buffered)
+    context = contextvars.copy_context()
+
+    def forward(source: Any, event: Any) -> None:
+        item = _to_stream_item(event)
+        if item is not None:
+            stream.publish(item)
+
+    def produce() -> None:
+        with crewai_event_bus.run_scope() as run_bus:
+            for event_type in _STREAMED_EVENTS:
+                run_bus.register_handler(event_type, forward)
+            try:
+                output = run()
+            except BaseException as e:
+                stream.finish(e)
+            else:
+                stream.publish(FinalOutputItem(output=output))
+                stream.finish()
+
+    worker = threading.Thread(
+        target=context.run, args=(produce,), name="crewai_stream", daemon=True
+    )
+    worker.start()
+    try:
+        async for item in stream:
+            yield item
+    finally:
+        # Unblocks the producer if the consumer stopped early
+        stream.close()
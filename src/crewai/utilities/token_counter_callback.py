@@ -41,3 +41,10 @@ class TokenCalcHandler(CustomLogger):
                         self.token_cost_process.sum_cached_prompt_tokens(
                             usage.prompt_tokens_details.cached_tokens
                         )
+                    cache_creation_tokens = getattr(
+                        usage, "cache_creation_input_tokens", None
+                    )
+                    if isinstance(cache_creation_tokens, int):
+                        self.token_cost_process.sum_cache_creation_prompt_tokens(
+                            cache_creation_tokens
+                        )
@@ -0,0 +1,144 @@
+"""Usage accounting for crew runs, broken down by model, task, agent and tool."""
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from crewai.types.usage_metrics import UsageReport, UsageStats
+
+# Position of each counter in a shard entry
+_PROMPT, _COMPLETION, _CACHED, _CACHE_CREATION, _REQUESTS = range(5)
+_TOOL_CALLS, _CACHED_TOOL_CALLS, _LATENCY, _COST = range(5, 9)
+_COUNTERS = 9
+
+# (dimension, key) -> counters; "total" is keyed by ""
+_Shard = Dict[Tuple[str, str], List[float]]
+
+
+class UsageLedger:
+    """Records tokens, cost and latency of a crew run.
+
+    Every thread writes to its own shard, so recording never takes a lock and
+    concurrent tasks cannot lose updates. Shards are only merged when a report
+    is requested. Ledgers form a tree: the ledger of a crew copy (for example
+    one run of `kickoff_for_each`) is a child of the ledger of the crew it was
+    copied from, and reports roll children up into their parent.
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        self.name = name
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._children: List["UsageLedger"] = []
+        self._lock = threading.Lock()
+
+    def child(self, name: Optional[str] = None) -> "UsageLedger":
+        """Create a ledger whose usage rolls up into this one."""
+        ledger = UsageLedger(name)
+        with self._lock:
+            self._children.append(ledger)
+        return ledger
+
+    def record_llm_call(
+        self,
+        model: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cached_prompt_tokens: int = 0,
+        cache_creation_prompt_tokens: int = 0,
+        latency: float = 0.0,
+        cost: float = 0.0,
+        task: Optional[str] = None,
+        agent: Optional[str] = None,
+    ) -> None:
+        """Record one successful LLM request."""
+        for counters in self._entries(model=model, task=task, agent=agent):
+            counters[_PROMPT] += prompt_tokens
+            counters[_COMPLETION] += completion_tokens
+            counters[_CACHED] += cached_prompt_tokens
+            counters[_CACHE_CREATION] += cache_creation_prompt_tokens
+            counters[_REQUESTS] += 1
+            counters[_LATENCY] += latency
+            counters[_COST] += cost
+
+    def record_tool_call(
+        self,
+        tool: str,
+        latency: float = 0.0,
+        from_cache: bool = False,
+        task: Optional[str] = None,
+        agent: Optional[str] = None,
+    ) -> None:
+        """Record one finished tool call."""
+        for counters in self._entries(tool=tool, task=task, agent=agent):
+            counters[_TOOL_CALLS] += 1
+            counters[_CACHED_TOOL_CALLS] += from_cache
+            counters[_LATENCY] += latency
+
+    def report(self) -> UsageReport:
+        """Merge the shards of this ledger and its children into a report."""
+        with self._lock:
+            shards = list(self._shards)
+            children = [child.report() for child in self._children]
+
+        report = UsageReport(name=self.name, children=children)
+        for shard in shards:
+            # dict.copy() is atomic, unlike iterating a dict another thread grows
+            for (dimension, key), counters in shard.copy().items():
+                _add_counters(_stats_for(report, dimension, key), counters)
+        for child in children:
+            report.add_usage_report(child)
+        return report
+
+    def _entries(self, **keys: Optional[str]) -> List[List[float]]:
+        shard = self._shard()
+        entries = [_entry(shard, ("total", ""))]
+        for dimension, key in keys.items():
+            if key is not None:
+                entries.append(_entry(shard, (dimension, key)))
+        return entries
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+
+def usage_label(task: Optional[Any]) -> Optional[str]:
+    """Key a task's usage is reported under: its name, else its description."""
+    if task is None:
+        return None
+    return task.name or task.description
+
+
+def _entry(shard: _Shard, key: Tuple[str, str]) -> List[float]:
+    counters = shard.get(key)
+    if counters is None:
+        counters = shard[key] = [0] * _COUNTERS
+    return counters
+
+
+def _stats_for(report: UsageReport, dimension: str, key: str) -> UsageStats:
+    if dimension == "total":
+        return report.total
+    breakdown = getattr(report, f"by_{dimension}")
+    return breakdown.setdefault(key, UsageStats())
+
+
+def _add_counters(stats: UsageStats, counters: List[float]) -> None:
+    stats.add_usage_stats(
+        UsageStats(
+            prompt_tokens=int(counters[_PROMPT]),
+            completion_tokens=int(counters[_COMPLETION]),
+            total_tokens=int(counters[_PROMPT] + counters[_COMPLETION]),
+            cached_prompt_tokens=int(counters[_CACHED]),
+            cache_creation_prompt_tokens=int(counters[_CACHE_CREATION]),
+            successful_requests=int(counters[_REQUESTS]),
+            tool_calls=int(counters[_TOOL_CALLS]),
+            cached_tool_calls=int(counters[_CACHED_TOOL_CALLS]),
+            latency=counters[_LATENCY],
+            cost=counters[_COST],
+        )
+    )
@@ -1965,9 +1965,19 @@ def test_agent_knowledege_with_crewai_knowledge():
     )
 
     crew = Crew(agents=[agent],tasks=[task],knowledge=crew_knowledge)
-    crew.kickoff()
-    agent_knowledge.query.assert_called_once()
-    crew_knowledge.query.assert_called_once()
+    with patch(
+        "crewai.agent.query_knowledge_batch", return_value=[[]]
+    ) as mock_query_knowledge_batch:
+        crew.kickoff()
+
+    # Agent and crew knowledge are searched together in a single pass
+    mock_query_knowledge_batch.assert_called_once()
+    assert mock_query_knowledge_batch.call_args.args[0] == [
+        agent_knowledge,
+        crew_knowledge,
+    ]
+    agent_knowledge.query.assert_not_called()
+    crew_knowledge.query.assert_not_called()
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
@@ -2154,6 +2164,67 @@ def test_get_knowledge_search_query():
         )
 
 
+def test_knowledge_search_query_is_cached_for_identical_task_prompts():
+    agent = Agent(
+        role="Cached Query Agent",
+        goal="Answer questions",
+        backstory="I reuse rewritten queries",
+        llm=LLM(model="gpt-4o-mini"),
+    )
+    task_prompt = "Summarize the cached knowledge query behaviour"
+
+    with patch.object(
+        agent, "_get_knowledge_search_query", return_value="cached query"
+    ) as mock_get_query:
+        assert agent._get_cached_knowledge_search_query(task_prompt) == "cached query"
+        assert agent._get_cached_knowledge_search_query(task_prompt) == "cached query"
+
+        mock_get_query.assert_called_once_with(task_prompt)
+
+    with patch.object(
+        Agent, "_get_knowledge_search_query", return_value="cached query"
+    ) as mock_get_query:
+        assert (
+            agent.copy()._get_cached_knowledge_search_query(task_prompt)
+            == "cached query"
+        )
+        mock_get_query.assert_not_called()
+
+
+def test_memory_and_knowledge_are_prefetched_concurrently():
+    import threading
+
+    agent = Agent(
+        role="Prefetching Agent",
+        goal="Answer questions",
+        backstory="I fetch context in parallel",
+        llm=LLM(model="gpt-4o-mini"),
+    )
+    agent.knowledge = MagicMock()
+    task = Task(description="Do it", expected_output="Done", agent=agent)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def retrieve_memory(task, context):
+        barrier.wait()
+        return "memory"
+
+    def retrieve_knowledge(task_prompt):
+        barrier.wait()
+        return "knowledge"
+
+    with (
+        patch.object(agent, "_is_any_available_memory", return_value=True),
+        patch.object(agent, "_retrieve_memory_context", side_effect=retrieve_memory),
+        patch.object(
+            agent, "_retrieve_knowledge_context", side_effect=retrieve_knowledge
+        ),
+    ):
+        assert agent._prefetch_task_context(task, "prompt", None) == (
+            "memory",
+            "knowledge",
+        )
+
+
 @pytest.fixture
 def mock_get_auth_token():
     with patch(
@@ -3036,7 +3036,9 @@ def test_crew_train_error(researcher, writer):
         )
 
 
-def test__setup_for_training(researcher, writer):
+def test__setup_for_training(researcher, writer, tmp_path, monkeypatch):
+    # The training data files are created in the working directory
+    monkeypatch.chdir(tmp_path)
     researcher.allow_delegation = True
     writer.allow_delegation = True
     agents = [researcher, writer]
@@ -1,7 +1,10 @@
 """Test Flow creation and execution basic functionality."""
 
 import asyncio
+import os
+import threading
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 from pydantic import BaseModel
@@ -17,6 +20,50 @@ from crewai.utilities.events import (
 from crewai.utilities.events.flow_events import FlowPlotEvent
 
 
+class ProcessExecutorFlow(Flow):
+    """Defined at module level so the flow can be pickled for a process pool."""
+
+    @start(executor="process")
+    def compute(self):
+        return os.getpid()
+
+
+class CheckpointedReport(BaseModel):
+    """Defined at module level so checkpoints can rebuild it."""
+
+    title: str
+    sections: list[str]
+
+
+class QueuedState(BaseModel):
+    topic: str = ""
+    outline: str = ""
+    keywords: list = []
+
+
+class QueuedFlow(Flow[QueuedState]):
+    """Defined at module level so flow workers can import it."""
+
+    @start()
+    def pick_topic(self):
+        self.state.topic = "flows"
+        return self.state.topic
+
+    @listen(pick_topic, executor="queue")
+    def write_outline(self, topic):
+        self.state.outline = f"outline of {topic}"
+        return threading.current_thread().name
+
+    @listen(pick_topic, executor="queue")
+    def extract_keywords(self, topic):
+        self.state.keywords = [topic, "queue"]
+        return threading.current_thread().name
+
+    @listen(and_(write_outline, extract_keywords))
+    def publish(self):
+        return f"{self.state.outline} {self.state.keywords}"
+
+
 def test_simple_sequential_flow():
     """Test a simple flow with two steps called sequentially."""
     execution_order = []
@@ -630,7 +677,7 @@ def test_stateless_flow_event_emission():
     assert isinstance(received_events[5].timestamp, datetime)
 
 
-def test_flow_plotting():
+def test_flow_plotting(tmp_path):
     class StatelessFlow(Flow):
         @start()
         def init(self):
@@ -648,7 +695,7 @@ def test_flow_plotting():
     def handle_flow_plot(source, event):
         received_events.append(event)
 
-    flow.plot("test_flow")
+    flow.plot(str(tmp_path / "test_flow"))
 
     assert len(received_events) == 1
     assert isinstance(received_events[0], FlowPlotEvent)
@@ -767,3 +814,698 @@ def test_flow_name():
 
     flow = MyFlow()
     assert flow.name == "MyFlow"
+
+
+def test_parallel_sync_listeners_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    class FanOutFlow(Flow):
+        @start()
+        def begin(self):
+            return "go"
+
+        @listen(begin)
+        def first(self):
+            barrier.wait()
+            return threading.current_thread().name
+
+        @listen(begin)
+        def second(self):
+            barrier.wait()
+            return threading.current_thread().name
+
+    flow = FanOutFlow()
+    flow.kickoff()
+
+    # Both listeners passed the barrier, so they were running at the same time
+    assert flow.method_outputs[0] == "go"
+    assert all(name.startswith("crewai_flow") for name in flow.method_outputs[1:])
+
+
+def test_inline_executor_runs_on_event_loop_thread():
+    loop_threads = []
+
+    class InlineFlow(Flow):
+        @start(executor="inline")
+        def begin(self):
+            loop_threads.append(threading.current_thread())
+
+        @listen(begin)
+        async def check(self):
+            return threading.current_thread() is loop_threads[0]
+
+    flow = InlineFlow()
+    assert flow.kickoff() is True
+
+
+def test_max_concurrency_limits_parallel_sync_methods():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    class LimitedFlow(Flow):
+        max_concurrency = 1
+
+        @start()
+        def begin(self):
+            pass
+
+        def _work(self):
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            threading.Event().wait(0.05)
+            with lock:
+                running.pop()
+
+        @listen(begin)
+        def first(self):
+            self._work()
+
+        @listen(begin)
+        def second(self):
+            self._work()
+
+        @listen(begin)
+        def third(self):
+            self._work()
+
+    LimitedFlow().kickoff()
+
+    assert max(peak) == 1
+
+
+def test_process_executor_runs_method_in_worker_process():
+    flow = ProcessExecutorFlow()
+
+    assert flow.kickoff() != os.getpid()
+
+
+def test_invalid_executor_hint_raises():
+    with pytest.raises(ValueError, match="Invalid executor"):
+        listen("begin", executor="gpu")
+
+
+def test_method_events_skip_state_snapshot_without_handlers():
+    class QuietFlow(Flow):
+        @start()
+        def begin(self):
+            return "done"
+
+    with crewai_event_bus.scoped_handlers():
+        with patch.object(QuietFlow, "_copy_state") as copy_state:
+            assert QuietFlow().kickoff() == "done"
+
+    copy_state.assert_not_called()
+
+
+def test_method_event_state_is_isolated_from_later_mutations():
+    received_events = []
+
+    class SnapshotFlow(Flow):
+        @start()
+        def begin(self):
+            self.state["documents"] = ["a"]
+
+        @listen(begin)
+        def extend(self):
+            self.state["documents"].append("b")
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MethodExecutionFinishedEvent)
+        def handle_method_finished(source, event):
+            received_events.append(event)
+
+        SnapshotFlow().kickoff()
+
+    begin_event, extend_event = received_events
+    assert begin_event.state["documents"] == ["a"]
+    assert extend_event.state["documents"] == ["a", "b"]
+    assert "documents" in extend_event.model_dump()["state"]
+
+
+def test_flow_meta_builds_trigger_index():
+    class IndexedFlow(Flow):
+        @start()
+        def begin(self):
+            pass
+
+        @listen(or_(begin, "begin"))
+        def either(self):
+            pass
+
+        @listen(and_(begin, either))
+        def both(self):
+            pass
+
+        @router(begin)
+        def route(self):
+            return "next"
+
+    assert IndexedFlow._listener_triggers == {
+        "begin": [("either", 0), ("both", 0b01)],
+        "either": [("both", 0b10)],
+    }
+    assert IndexedFlow._router_triggers == {"begin": [("route", 0)]}
+    assert IndexedFlow._and_masks == {"both": 0b11}
+
+
+def test_and_listener_waits_for_every_trigger():
+    class AndFlow(Flow):
+        @start()
+        def begin(self):
+            pass
+
+        @listen(and_("first", "second"))
+        def both(self):
+            pass
+
+    flow = AndFlow()
+
+    assert flow._find_triggered_methods("first", router_only=False) == []
+    assert flow._find_triggered_methods("first", router_only=False) == []
+    assert flow._find_triggered_methods("unrelated", router_only=False) == []
+    assert flow._find_triggered_methods("second", router_only=False) == ["both"]
+    assert flow._and_listener_progress == {}
+
+
+def test_programmatic_flow_with_many_methods():
+    def make_step(index):
+        @listen(f"step_{index - 1}")
+        def step(self):
+            return index
+
+        return step
+
+    methods = {"step_0": start()(lambda self: 0)}
+    for index in range(1, 200):
+        methods[f"step_{index}"] = make_step(index)
+
+    ChainFlow = type("ChainFlow", (Flow,), methods)
+
+    assert ChainFlow().kickoff() == 199
+
+
+class GreetingFlow(Flow):
+    @start()
+    def greet(self):
+        return f"Hello, {self.state['name']}!"
+
+
+def test_kickoff_many_returns_results_in_input_order():
+    results = GreetingFlow.kickoff_many(
+        [{"name": "Ada"}, {"name": "Grace"}, {"name": "Linus"}]
+    )
+
+    assert results == ["Hello, Ada!", "Hello, Grace!", "Hello, Linus!"]
+
+
+def test_kickoff_many_caps_concurrent_flows():
+    running = []
+    peak = []
+
+    class SlowFlow(Flow):
+        @start()
+        async def work(self):
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+            return self.state["n"]
+
+    results = SlowFlow.kickoff_many([{"n": n} for n in range(10)], max_concurrency=3)
+
+    assert results == list(range(10))
+    assert max(peak) == 3
+
+
+def test_kickoff_many_as_completed_streams_results():
+    class DelayFlow(Flow):
+        @start()
+        async def wait(self):
+            await asyncio.sleep(self.state["delay"])
+            return self.state["delay"]
+
+    async def collect():
+        return [
+            index
+            async for index, _ in DelayFlow.kickoff_many_as_completed(
+                [{"delay": 0.05}, {"delay": 0.0}]
+            )
+        ]
+
+    assert asyncio.run(collect()) == [1, 0]
+
+
+def test_kickoff_many_shares_executor_and_returns_exceptions():
+    class MaybeFailFlow(Flow):
+        @start()
+        def run(self):
+            if self.state["fail"]:
+                raise ValueError("boom")
+            return threading.current_thread().name
+
+    results = MaybeFailFlow.kickoff_many(
+        [{"fail": False}, {"fail": True}], return_exceptions=True
+    )
+
+    assert results[0].startswith("crewai_flow")
+    assert isinstance(results[1], ValueError)
+
+    with pytest.raises(ValueError, match="boom"):
+        MaybeFailFlow.kickoff_many([{"fail": True}])
+
+
+def test_kickoff_inside_running_event_loop():
+    async def run_inside_loop():
+        return GreetingFlow().kickoff(inputs={"name": "loop"})
+
+    assert asyncio.run(run_inside_loop()) == "Hello, loop!"
+
+
+def test_max_method_outputs_bounds_retention_in_cyclic_flow():
+    class PollingFlow(Flow):
+        max_method_outputs = 2
+
+        @start("poll_again")
+        def poll(self):
+            self.state["polls"] = self.state.get("polls", 0) + 1
+            return self.state["polls"]
+
+        @router(poll)
+        def check(self):
+            return "poll_again" if self.state["polls"] < 50 else "done"
+
+        @listen("done")
+        def finish(self):
+            return "finished"
+
+    flow = PollingFlow()
+
+    assert flow.kickoff() == "finished"
+    assert flow.state["polls"] == 50
+    assert flow.method_outputs == ["done", "finished"]
+
+
+@pytest.mark.parametrize("max_method_outputs", [0, -1])
+def test_max_method_outputs_must_keep_at_least_one_output(max_method_outputs):
+    class BoundedFlow(Flow):
+        @start()
+        def begin(self):
+            return "done"
+
+    BoundedFlow.max_method_outputs = max_method_outputs
+
+    with pytest.raises(ValueError, match="max_method_outputs must be None or at least 1"):
+        BoundedFlow()
+
+
+def test_persist_method_outputs_requires_a_backend_storing_outputs():
+    from crewai.flow.persistence.base import FlowPersistence
+
+    class StateOnlyPersistence(FlowPersistence):
+        def init_db(self):
+            pass
+
+        def save_state(self, flow_uuid, method_name, state_data):
+            pass
+
+        def load_state(self, flow_uuid):
+            return None
+
+    class SpillingFlow(Flow):
+        persist_method_outputs = True
+
+        @start()
+        def begin(self):
+            return "done"
+
+    persistence = StateOnlyPersistence()
+    assert persistence.load_method_outputs("flow-1") == []
+    with pytest.raises(ValueError, match="StateOnlyPersistence does not"):
+        SpillingFlow(persistence=persistence)
+
+
+def test_persist_method_outputs_writes_every_output(tmp_path):
+    from crewai.flow.persistence.sqlite import SQLiteFlowPersistence
+
+    persistence = SQLiteFlowPersistence(str(tmp_path / "outputs.db"))
+
+    class SpillingFlow(Flow):
+        max_method_outputs = 1
+        persist_method_outputs = True
+
+        @start()
+        def first(self):
+            return {"rows": [1, 2]}
+
+        @listen(first)
+        def second(self):
+            return "final"
+
+    flow = SpillingFlow(persistence=persistence)
+
+    assert flow.kickoff() == "final"
+    assert flow.method_outputs == ["final"]
+    assert persistence.load_method_outputs(flow.flow_id) == [
+        ("first", {"rows": [1, 2]}),
+        ("second", "final"),
+    ]
+
+
+def test_persist_method_outputs_requires_persistence():
+    class SpillingFlow(Flow):
+        persist_method_outputs = True
+
+        @start()
+        def first(self):
+            pass
+
+    with pytest.raises(ValueError, match="requires a persistence backend"):
+        SpillingFlow()
+
+
+def test_checkpointed_flow_resumes_from_frontier(tmp_path):
+    from crewai.flow.persistence.sqlite import SQLiteFlowPersistence
+
+    persistence = SQLiteFlowPersistence(str(tmp_path / "checkpoints.db"))
+    calls = []
+    should_fail = [True]
+
+    class CheckpointFlow(Flow):
+        checkpoint = True
+
+        @start()
+        def fetch(self):
+            calls.append("fetch")
+            self.state["fetched"] = True
+            return "data"
+
+        @listen(fetch)
+        def summarize(self, data):
+            calls.append("summarize")
+            return f"summary of {data}"
+
+        @listen(fetch)
+        def classify(self):
+            calls.append("classify")
+            return "label"
+
+        @listen(and_(summarize, classify))
+        def report(self):
+            calls.append("report")
+            if should_fail[0]:
+                raise RuntimeError("crashed")
+            return f"{self.state['fetched']}: {self.method_outputs[-2:]}"
+
+    flow = CheckpointFlow(persistence=persistence)
+    with pytest.raises(RuntimeError, match="crashed"):
+        flow.kickoff()
+    flow_id = flow.flow_id
+    assert sorted(calls) == ["classify", "fetch", "report", "summarize"]
+
+    calls.clear()
+    should_fail[0] = False
+    resumed = CheckpointFlow(persistence=persistence)
+    result = resumed.kickoff(inputs={"id": flow_id})
+
+    assert calls == ["report"]
+    assert result.startswith("True: ")
+    assert "summary of data" in result and "label" in result
+
+
+def test_checkpointed_model_output_is_rebuilt_on_resume(tmp_path):
+    from crewai.flow.persistence.sqlite import SQLiteFlowPersistence
+
+    persistence = SQLiteFlowPersistence(str(tmp_path / "checkpoints.db"))
+    should_fail = [True]
+
+    class ReportFlow(Flow):
+        checkpoint = True
+
+        @start()
+        def draft(self):
+            return CheckpointedReport(title="Q3", sections=["intro"])
+
+        @listen(draft)
+        def publish(self, report):
+            if should_fail[0]:
+                raise RuntimeError("crashed")
+            return f"{report.title}: {', '.join(report.sections)}"
+
+    flow = ReportFlow(persistence=persistence)
+    with pytest.raises(RuntimeError, match="crashed"):
+        flow.kickoff()
+
+    should_fail[0] = False
+    resumed = ReportFlow(persistence=persistence)
+
+    assert resumed.kickoff(inputs={"id": flow.flow_id}) == "Q3: intro"
+    assert resumed.method_outputs[0] == CheckpointedReport(
+        title="Q3", sections=["intro"]
+    )
+
+
+def test_checkpoint_rejects_outputs_that_do_not_round_trip(tmp_path):
+    from crewai.flow.persistence.sqlite import SQLiteFlowPersistence
+
+    persistence = SQLiteFlowPersistence(str(tmp_path / "checkpoints.db"))
+
+    class LocalModel(BaseModel):
+        value: int
+
+    class PairFlow(Flow):
+        checkpoint = True
+
+        @start()
+        def pair(self):
+            return ("a", 1)
+
+    class LocalModelFlow(Flow):
+        checkpoint = True
+
+        @start()
+        def build(self):
+            return LocalModel(value=1)
+
+    with pytest.raises(ValueError, match="tuple values do not round-trip"):
+        PairFlow(persistence=persistence).kickoff()
+    with pytest.raises(ValueError, match="LocalModel model cannot be rebuilt"):
+        LocalModelFlow(persistence=persistence).kickoff()
+
+
+def test_checkpoint_requires_persistence():
+    class CheckpointFlow(Flow):
+        checkpoint = True
+
+        @start()
+        def first(self):
+            pass
+
+    with pytest.raises(ValueError, match="checkpoint requires a persistence backend"):
+        CheckpointFlow()
+
+
+def test_queue_executor_runs_methods_on_workers(tmp_path):
+    from crewai.flow.persistence.sqlite import SQLiteFlowPersistence
+    from crewai.flow.work_queue import FlowWorker, SQLiteFlowWorkQueue
+
+    queue = SQLiteFlowWorkQueue(str(tmp_path / "queue.db"))
+    persistence = SQLiteFlowPersistence(str(tmp_path / "states.db"))
+    worker = FlowWorker(queue, persistence, poll_interval=0.01)
+    stop = threading.Event()
+    worker_thread = threading.Thread(
+        target=worker.run, args=(stop,), name="flow_worker"
+    )
+    worker_thread.start()
+    try:
+        with patch.object(QueuedFlow, "work_queue", queue):
+            flow = QueuedFlow(persistence=persistence)
+            result = flow.kickoff()
+    finally:
+        stop.set()
+        worker_thread.join()
+
+    assert result == "outline of flows ['flows', 'queue']"
+    assert flow.method_outputs[1:3] == ["flow_worker", "flow_worker"]
+    assert flow.state.keywords == ["flows", "queue"]
+
+
+def test_queue_executor_reports_worker_failures(tmp_path):
+    from crewai.flow.persistence.sqlite import SQLiteFlowPersistence
+    from crewai.flow.work_queue import FlowWorker, SQLiteFlowWorkQueue
+
+    queue = SQLiteFlowWorkQueue(str(tmp_path / "queue.db"))
+    persistence = SQLiteFlowPersistence(str(tmp_path / "states.db"))
+
+    with patch.object(QueuedFlow, "work_queue", queue):
+        flow = QueuedFlow(persistence=persistence)
+        with patch.object(
+            FlowWorker, "execute", side_effect=RuntimeError("worker crashed")
+        ):
+            worker_thread = threading.Thread(
+                target=FlowWorker(queue, persistence, poll_interval=0.01).run,
+                kwargs={"max_items": 2},
+            )
+            worker_thread.start()
+            with pytest.raises(RuntimeError, match="worker crashed"):
+                flow.kickoff()
+            worker_thread.join()
+
+
+def test_queue_executor_requires_work_queue():
+    with pytest.raises(ValueError, match="requires a work_queue"):
+        QueuedFlow().kickoff()
+
+
+def test_sqlite_work_queue_reclaims_expired_leases(tmp_path):
+    from crewai.flow.work_queue import SQLiteFlowWorkQueue
+
+    queue = SQLiteFlowWorkQueue(str(tmp_path / "queue.db"), max_attempts=2)
+    item_id = queue.enqueue({"method": "step"})
+
+    assert queue.claim(lease_seconds=-1).attempts == 1
+    assert queue.claim(lease_seconds=-1).attempts == 2
+    assert queue.claim() is None
+
+    outcome = queue.pop_result(item_id)
+    assert not outcome.succeeded
+    assert "expired 2 times" in outcome.error
+    assert queue.pop_result(item_id) is None
+
+
+def test_sqlite_work_queue_polls_without_the_write_lock(tmp_path):
+    import sqlite3
+
+    from crewai.flow.work_queue import SQLiteFlowWorkQueue
+
+    db_path = str(tmp_path / "queue.db")
+    queue = SQLiteFlowWorkQueue(db_path)
+    item_id = queue.enqueue({"method": "step"})
+
+    writer = sqlite3.connect(db_path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        # Another writer holds the lock: a write transaction would wait for it
+        assert queue.pop_result(item_id) is None
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+
+    queue.complete(item_id, {"result": 1})
+    assert queue.pop_result(item_id).result == {"result": 1}
+    assert queue.pop_result(item_id) is None
+
+
+def test_flow_profiler_records_critical_path_and_trace(tmp_path):
+    import json
+    import time
+
+    from crewai.flow.profiler import FlowProfiler
+
+    class ProfiledFlow(Flow):
+        @start()
+        def fetch(self):
+            return "data"
+
+        @listen(fetch)
+        def slow_branch(self):
+            time.sleep(0.2)
+
+        @listen(fetch)
+        def fast_branch(self):
+            pass
+
+        @listen(and_(slow_branch, fast_branch))
+        def report(self):
+            pass
+
+    flow = ProfiledFlow()
+    with FlowProfiler(flow) as profiler:
+        flow.kickoff()
+    flow.kickoff()  # not recorded once closed
+
+    summary = profiler.summary()
+    assert {name: entry["calls"] for name, entry in summary.items()} == {
+        "fetch": 1,
+        "slow_branch": 1,
+        "fast_branch": 1,
+        "report": 1,
+    }
+    assert summary["slow_branch"]["wall_time"] >= 0.2
+    assert summary["slow_branch"]["cpu_time"] < 0.1
+    assert [span.name for span in profiler.critical_path()] == [
+        "fetch",
+        "slow_branch",
+        "report",
+    ]
+
+    trace_path = tmp_path / "trace.json"
+    profiler.export_chrome_trace(str(trace_path))
+    slices = [
+        event
+        for event in json.loads(trace_path.read_text())["traceEvents"]
+        if event["ph"] == "X"
+    ]
+    assert len(slices) == 4
+    # The two branches overlap, so they are laid out on different rows
+    rows = {event["name"]: event["tid"] for event in slices}
+    assert rows["slow_branch"] != rows["fast_branch"]
+
+
+def test_flow_profiler_ignores_crews_of_concurrent_runs():
+    from crewai.flow.profiler import FlowProfiler
+    from crewai.utilities.events.crew_events import (
+        CrewKickoffCompletedEvent,
+        CrewKickoffStartedEvent,
+    )
+
+    def run_crew(name):
+        crew = object()
+        crewai_event_bus.emit(
+            crew, CrewKickoffStartedEvent(crew_name=name, inputs=None)
+        )
+        crewai_event_bus.emit(
+            crew, CrewKickoffCompletedEvent(crew_name=name, output=None)
+        )
+
+    class CrewFlow(Flow):
+        @start()
+        def research(self):
+            run_crew("own")
+            # A thread outside the flow's context, like another request
+            other = threading.Thread(target=run_crew, args=("other",))
+            other.start()
+            other.join()
+
+    flow = CrewFlow()
+    with FlowProfiler(flow) as profiler:
+        flow.kickoff()
+
+    assert list(profiler.summary("crew")) == ["own"]
+
+
+def test_kickoff_stream_yields_method_progress_and_result():
+    class StreamedFlow(Flow):
+        @start()
+        def first(self):
+            return "one"
+
+        @listen(first)
+        def second(self, value):
+            return f"{value} two"
+
+    async def consume():
+        return [item async for item in StreamedFlow().kickoff_stream()]
+
+    items = asyncio.run(consume())
+
+    assert [(item.type, getattr(item, "method_name", None)) for item in items] == [
+        ("method_started", "first"),
+        ("method_finished", "first"),
+        ("method_started", "second"),
+        ("method_finished", "second"),
+        ("final_output", None),
+    ]
+    assert items[-1].output == "one two"
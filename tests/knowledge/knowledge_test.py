@@ -2,10 +2,11 @@
 
 from pathlib import Path
 from typing import List, Union
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from crewai.knowledge.knowledge import Knowledge, query_knowledge_batch
 from crewai.knowledge.source.crew_docling_source import CrewDoclingSource
 from crewai.knowledge.source.csv_knowledge_source import CSVKnowledgeSource
 from crewai.knowledge.source.excel_knowledge_source import ExcelKnowledgeSource
@@ -13,6 +14,10 @@ from crewai.knowledge.source.json_knowledge_source import JSONKnowledgeSource
 from crewai.knowledge.source.pdf_knowledge_source import PDFKnowledgeSource
 from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
 from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledgeSource
+from crewai.knowledge.utils.knowledge_utils import reciprocal_rank_fusion
+from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.knowledge.storage.keyword_index import BM25Index
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
 
 
 @pytest.fixture(autouse=True)
@@ -603,3 +608,204 @@ def test_file_path_validation():
         match="file_path/file_paths must be a Path, str, or a list of these types",
     ):
         PDFKnowledgeSource()
+
+
+class FakeEmbedder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+
+def _fake_storage(fetched, embedder, embedder_config=None):
+    with patch.object(KnowledgeStorage, "_set_embedder_config"):
+        storage = KnowledgeStorage(collection_name="test")
+    storage.embedder = embedder
+    storage.embedder_config = embedder_config
+    storage.collection = MagicMock()
+    storage.collection.metadata = {"hnsw:space": "cosine"}
+    storage.collection.query.return_value = fetched
+    return storage
+
+
+def _fetched(*queries):
+    return {
+        "ids": [[hit[0] for hit in hits] for hits in queries],
+        "documents": [[f"doc {hit[0]}" for hit in hits] for hits in queries],
+        "metadatas": [[{} for _ in hits] for hits in queries],
+        "distances": [[hit[1] for hit in hits] for hits in queries],
+    }
+
+
+def test_knowledge_storage_search_uses_every_query():
+    embedder = FakeEmbedder()
+    storage = _fake_storage(
+        _fetched([("a", 0.5), ("b", 0.7)], [("c", 0.4), ("a", 0.6)]), embedder
+    )
+
+    results = storage.search(["first query", "second"], limit=3, score_threshold=0)
+
+    assert embedder.calls == [["first query", "second"]]
+    assert storage.collection.query.call_count == 1
+    assert [result["id"] for result in results] == ["c", "a", "b"]
+    assert results[1]["score"] == 0.5
+
+
+def test_knowledge_storage_search_batch_returns_results_per_query():
+    storage = _fake_storage(
+        _fetched([("a", 0.5)], [("b", 0.4), ("c", 0.6)]), FakeEmbedder()
+    )
+
+    results = storage.search_batch(["first", "second"], score_threshold=0)
+
+    assert [[result["id"] for result in hits] for hits in results] == [
+        ["a"],
+        ["b", "c"],
+    ]
+
+
+def test_query_knowledge_batch_shares_embeddings_and_dedupes():
+    embedder = FakeEmbedder()
+    agent_storage = _fake_storage(_fetched([("a", 0.5), ("b", 0.8)]), embedder)
+    crew_storage = _fake_storage(_fetched([("a", 0.5), ("c", 0.6)]), embedder)
+
+    with patch.object(KnowledgeStorage, "initialize_knowledge_storage"):
+        agent_knowledge = Knowledge(
+            collection_name="agent", sources=[], storage=agent_storage
+        )
+        crew_knowledge = Knowledge(
+            collection_name="crew", sources=[], storage=crew_storage
+        )
+
+    results = query_knowledge_batch(
+        [agent_knowledge, crew_knowledge], ["query"], score_threshold=0
+    )
+
+    assert embedder.calls == [["query"]]
+    assert [
+        (result["id"], result["knowledge_index"]) for result in results[0]
+    ] == [("a", 0), ("c", 1), ("b", 0)]
+
+
+class ListStorage(BaseKnowledgeStorage):
+    """A custom storage written against the original search signature."""
+
+    def __init__(self, documents):
+        self.documents = documents
+
+    def search(self, query, limit=3, filter=None, score_threshold=0.35):
+        return [
+            {"id": doc, "context": doc, "metadata": {}, "score": 1.0}
+            for doc in self.documents
+            if query[0] in doc
+        ][:limit]
+
+    def save(self, documents, metadata):
+        self.documents.extend(documents)
+
+    def reset(self):
+        self.documents = []
+
+
+def test_custom_storage_without_hybrid_options_keeps_working():
+    knowledge = Knowledge(
+        collection_name="custom",
+        sources=[],
+        storage=ListStorage(["red apple", "green pear"]),
+    )
+
+    assert [r["id"] for r in knowledge.query(["apple"])] == ["red apple"]
+    assert [
+        [r["id"] for r in results]
+        for results in query_knowledge_batch([knowledge], ["pear", "apple"])
+    ] == [["green pear"], ["red apple"]]
+    with pytest.raises(TypeError, match="hybrid_search"):
+        knowledge.query(["apple"], hybrid_search=True)
+
+
+def test_knowledge_storage_score_threshold_keeps_close_results():
+    storage = _fake_storage(_fetched([("near", 0.2), ("far", 1.6)]), FakeEmbedder())
+
+    results = storage.search(["query"], limit=3, score_threshold=0.35)
+
+    assert [result["id"] for result in results] == ["near"]
+    assert results[0]["score"] == pytest.approx(0.8)
+
+
+def test_knowledge_storage_scores_non_cosine_space_from_embeddings():
+    storage = _fake_storage(
+        {
+            "ids": [["same", "orthogonal"]],
+            "documents": [["doc same", "doc orthogonal"]],
+            "metadatas": [[{}, {}]],
+            "embeddings": [[[6.0, 8.0], [-8.0, 6.0]]],
+        },
+        lambda texts: [[3.0, 4.0] for _ in texts],
+    )
+    storage.collection.metadata = None
+
+    results = storage.search(["query"], limit=3, score_threshold=0.35)
+
+    assert "embeddings" in storage.collection.query.call_args.kwargs["include"]
+    assert [result["id"] for result in results] == ["same"]
+    assert results[0]["score"] == pytest.approx(1.0)
+
+
+def test_bm25_index_ranks_matching_documents():
+    index = BM25Index()
+    index.add(
+        ["a", "b", "c"],
+        [
+            "The quick brown fox",
+            "Error code E1234 raised by the billing service",
+            "A fox chased another fox",
+        ],
+    )
+
+    assert [doc_id for doc_id, _ in index.search("E1234 billing", 5)] == ["b"]
+    assert [doc_id for doc_id, _ in index.search("fox", 5)][0] == "c"
+    assert index.search("fox", 5, ids={"a"})[0][0] == "a"
+
+    index.add(["b"], ["nothing relevant"])
+    assert index.search("billing", 5) == []
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "d"]])
+
+    assert [doc_id for doc_id, _ in fused] == ["b", "a", "d", "c"]
+
+
+def test_knowledge_storage_hybrid_search_fuses_keyword_hits():
+    storage = _fake_storage(_fetched([("a", 0.5), ("b", 0.6)]), FakeEmbedder())
+    storage.collection.get.side_effect = [
+        {"ids": ["a", "b", "c"], "documents": ["doc a", "doc b", "error E42"]},
+        {"ids": ["c"], "documents": ["error E42"], "metadatas": [{"source": "c"}]},
+    ]
+
+    results = storage.search(
+        ["E42"], limit=3, score_threshold=0, hybrid_search=True, candidates_limit=5
+    )
+
+    assert storage.collection.query.call_args.kwargs["n_results"] == 5
+    assert [result["id"] for result in results] == ["a", "c", "b"]
+    assert results[1]["context"] == "error E42"
+    assert results[1]["metadata"] == {"source": "c"}
+
+
+def test_knowledge_storage_reranks_with_cross_encoder():
+    storage = _fake_storage(_fetched([("a", 0.5), ("b", 0.6)]), FakeEmbedder())
+    model = MagicMock()
+    model.predict.return_value = [0.1, 2.5]
+
+    with patch(
+        "crewai.knowledge.storage.reranker.load_cross_encoder", return_value=model
+    ):
+        results = storage.search(
+            ["query"], limit=1, score_threshold=0, reranker_model="cross-encoder/test"
+        )
+
+    model.predict.assert_called_once_with([("query", "doc a"), ("query", "doc b")])
+    assert [(result["id"], result["score"]) for result in results] == [("b", 2.5)]
@@ -711,3 +711,62 @@ def test_ollama_does_not_modify_when_last_is_user(ollama_llm):
     formatted = ollama_llm._format_messages_for_provider(original_messages)
 
     assert formatted == original_messages
+
+
+def test_prompt_caching_marks_stable_prefix_for_anthropic():
+    llm = LLM(model="anthropic/claude-3-5-sonnet-20241022", prompt_caching=True)
+    messages = [
+        {"role": "system", "content": "You are a researcher. Tools: search"},
+        {"role": "user", "content": "Current Task: research"},
+        {"role": "assistant", "content": "Thought: searching\nObservation: done"},
+    ]
+
+    params = llm._prepare_completion_params(messages)
+    formatted = params["messages"]
+
+    assert formatted[0] == {"role": "user", "content": "."}
+    for message in formatted[1:]:
+        assert message["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert formatted[1]["content"][0]["text"] == messages[0]["content"]
+    # The caller's messages must not be mutated
+    assert messages[0]["content"] == "You are a researcher. Tools: search"
+
+
+def test_prompt_caching_only_marks_prefix_and_last_message():
+    llm = LLM(model="anthropic/claude-3-5-sonnet-20241022", prompt_caching=True)
+    messages = [
+        {"role": "system", "content": "system"},
+        {"role": "user", "content": "task"},
+        {"role": "assistant", "content": "step 1"},
+        {"role": "assistant", "content": "step 2"},
+    ]
+
+    formatted = llm._apply_prompt_caching(messages)
+
+    assert [isinstance(m["content"], list) for m in formatted] == [
+        True,
+        True,
+        False,
+        True,
+    ]
+
+
+def test_prompt_caching_does_not_mark_openai_messages():
+    llm = LLM(model="gpt-4o", prompt_caching=True)
+    messages = [
+        {"role": "system", "content": "system"},
+        {"role": "user", "content": "task"},
+    ]
+
+    params = llm._prepare_completion_params(messages)
+
+    assert params["messages"] == messages
+
+
+def test_prompt_caching_disabled_by_default():
+    llm = LLM(model="anthropic/claude-3-5-sonnet-20241022")
+    messages = [{"role": "user", "content": "task"}]
+
+    params = llm._prepare_completion_params(messages)
+
+    assert params["messages"] == messages
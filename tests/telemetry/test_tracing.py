@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+import pytest
+from litellm.types.utils import ModelResponse
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from crewai import Agent, Crew, Task
+from crewai.telemetry import disable_tracing, enable_tracing
+from crewai.telemetry.tracing import trace_span, traced
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    enable_tracing(tracer_provider=provider)
+    yield exporter
+    disable_tracing()
+
+
+def llm_response(content):
+    return ModelResponse(
+        model="gpt-4o-mini",
+        choices=[{"message": {"role": "assistant", "content": content}}],
+        usage={"prompt_tokens": 20, "completion_tokens": 5, "total_tokens": 25},
+    )
+
+
+def test_spans_are_not_created_while_tracing_is_disabled():
+    calls = []
+
+    @traced("never", lambda value: calls.append(value) or {})
+    def double(value):
+        return value * 2
+
+    with trace_span("never") as span:
+        assert span is None
+    assert double(2) == 4
+    # Attributes are only built for spans that are recorded
+    assert calls == []
+
+
+def test_crew_run_emits_nested_spans(exporter):
+    agent = Agent(
+        role="Researcher",
+        goal="Answer questions",
+        backstory="You answer questions.",
+        llm="gpt-4o-mini",
+    )
+    task = Task(
+        name="answer",
+        description="Say hi",
+        expected_output="A greeting",
+        agent=agent,
+    )
+    crew = Crew(agents=[agent], tasks=[task])
+
+    with patch(
+        "litellm.completion",
+        return_value=llm_response("Thought: done\nFinal Answer: hi"),
+    ):
+        crew.kickoff()
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    crew_span = spans["crewai.crew"]
+    task_span = spans["crewai.task"]
+    iteration_span = spans["crewai.agent.iteration"]
+    llm_span = spans["crewai.llm.call"]
+
+    assert task_span.parent.span_id == crew_span.context.span_id
+    assert iteration_span.parent.span_id == task_span.context.span_id
+    assert llm_span.parent.span_id == iteration_span.context.span_id
+    assert task_span.attributes["crewai.task.name"] == "answer"
+    assert task_span.attributes["crewai.agent.role"] == "Researcher"
+    assert llm_span.attributes["gen_ai.request.model"] == "gpt-4o-mini"
+    assert llm_span.attributes["gen_ai.usage.input_tokens"] == 20
+    assert llm_span.attributes["gen_ai.usage.output_tokens"] == 5
@@ -0,0 +1,134 @@
+import pytest
+
+from benchmarks.fakes import FINAL_ANSWER, FakeEmbeddingFunction, FakeLLM
+from benchmarks.harness import (
+    Benchmark,
+    BenchmarkRun,
+    Case,
+    Workload,
+    compare,
+    load_benchmarks,
+    registered_benchmarks,
+    run_case,
+)
+from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from crewai.utilities.token_counter_callback import TokenCalcHandler
+
+
+def test_fake_llm_answers_by_turn_and_reports_tokens():
+    llm = FakeLLM(script=["first", lambda messages: f"turn {len(messages)}"])
+    tokens = TokenProcess()
+
+    first = llm.call([{"role": "user", "content": "x" * 40}])
+    second = llm.call(
+        [
+            {"role": "user", "content": "hello"},
+            {"role": "assistant", "content": "first"},
+            {"role": "user", "content": "again"},
+        ],
+        callbacks=[TokenCalcHandler(tokens)],
+    )
+    last = llm.call(
+        [{"role": "assistant", "content": "a"}, {"role": "assistant", "content": "b"}]
+    )
+
+    assert (first, second, last) == ("first", "turn 3", "turn 2")
+    assert llm.calls == 3
+    summary = tokens.get_summary()
+    assert summary.successful_requests == 1
+    assert summary.prompt_tokens == 4
+    assert summary.completion_tokens == 2
+
+
+def test_fake_embeddings_are_deterministic_unit_vectors():
+    embed = FakeEmbeddingFunction(dimensions=40)
+
+    first, second, again = [list(vector) for vector in embed(["a", "b", "a"])]
+
+    assert len(first) == 40
+    assert first == again != second
+    assert sum(value * value for value in first) == pytest.approx(1.0)
+
+
+def test_run_case_reports_throughput():
+    calls = []
+    cleaned = []
+    case = Case(
+        Benchmark(
+            "noop",
+            lambda size: Workload(
+                lambda: calls.append(size), ops=size, cleanup=lambda: cleaned.append(1)
+            ),
+        ),
+        {"size": 10},
+    )
+
+    result = run_case(case, iterations=3, warmup=2)
+
+    assert result.name == "noop[size=10]"
+    assert result.iterations == 3
+    assert len(calls) == 5
+    assert cleaned == [1]
+    assert result.min <= result.median <= result.max
+    assert result.ops_per_second == pytest.approx(10 / result.median)
+
+
+def test_compare_lists_cases_slower_than_the_threshold():
+    def run(**medians):
+        return BenchmarkRun(
+            created_at="now",
+            environment={},
+            results=[
+                dict(
+                    name=name,
+                    benchmark=name,
+                    iterations=1,
+                    ops=1,
+                    min=median,
+                    median=median,
+                    mean=median,
+                    stdev=0.0,
+                    max=median,
+                    ops_per_second=1 / median,
+                )
+                for name, median in medians.items()
+            ],
+        )
+
+    regressions = compare(
+        run(fast=1.0, slow=1.0, removed=1.0),
+        run(fast=1.05, slow=1.5, added=9.0),
+        max_regression=0.1,
+    )
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("slow:")
+
+
+@pytest.mark.parametrize(
+    "name", ["crew.kickoff", "agent.tool_loop", "flow.fan_out", "events.emit"]
+)
+def test_quick_benchmarks_run(name):
+    load_benchmarks()
+    registered = {b.name: b for b in registered_benchmarks()}[name]
+
+    for case in registered.cases(quick=True):
+        result = run_case(case, iterations=1, warmup=0)
+        assert result.median > 0
+
+
+def test_tool_loop_calls_the_tool_every_turn():
+    from benchmarks.bench_crew import AddTool, make_crew
+
+    script = [
+        'Thought: add\nAction: add\nAction Input: {"a": 1, "b": 2}',
+        FINAL_ANSWER.format(answer="3"),
+    ]
+    llm = FakeLLM(script=script)
+    crew = make_crew(llm, tools=[AddTool()])
+
+    output = crew.kickoff(inputs={"topic": "math"})
+
+    assert output.raw == "3"
+    assert llm.calls == 2
+    assert crew.usage_metrics.successful_requests == 2
@@ -1,13 +1,16 @@
 """Test flow state persistence functionality."""
 
 import os
+import pickle
+import sqlite3
 from typing import Dict
 
 import pytest
 from pydantic import BaseModel
 
-from crewai.flow.flow import Flow, FlowState, listen, start
+from crewai.flow.flow import Flow, FlowState, listen, router, start
 from crewai.flow.persistence import persist
+from crewai.flow.persistence.json_patch import apply_patch, make_patch
 from crewai.flow.persistence.sqlite import SQLiteFlowPersistence
 
 
@@ -208,3 +211,171 @@ def test_persist_decorator_verbose_logging(tmp_path, caplog):
     flow = VerboseFlow(persistence=persistence)
     flow.kickoff()
     assert "Saving flow state" in caplog.text
+
+
+def _stored_rows(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            "SELECT method_name, kind, state_json FROM flow_states ORDER BY id"
+        ).fetchall()
+
+
+def test_json_patch_round_trip():
+    old = {"id": "1", "docs": ["a"], "meta": {"a/b": 1, "gone": True}, "n": 1}
+    new = {"id": "1", "docs": ["a", "b"], "meta": {"a/b": 2}, "n": True, "x": []}
+
+    patch = make_patch(old, new)
+
+    assert {"op": "add", "path": "/docs/1", "value": "b"} in patch
+    assert {"op": "replace", "path": "/meta/a~1b", "value": 2} in patch
+    assert apply_patch(old, patch) == new
+    assert make_patch(new, new) == []
+
+
+def test_sqlite_persistence_writes_deltas_between_snapshots(tmp_path):
+    db_path = os.path.join(tmp_path, "deltas.db")
+    persistence = SQLiteFlowPersistence(db_path, snapshot_interval=3, compact=False)
+    documents = [f"document {i} " * 50 for i in range(5)]
+
+    for step in range(5):
+        persistence.save_state(
+            "flow-1",
+            f"step_{step}",
+            {"id": "flow-1", "documents": documents[: step + 1], "step": step},
+        )
+        assert persistence.load_state("flow-1") == {
+            "id": "flow-1",
+            "documents": documents[: step + 1],
+            "step": step,
+        }
+
+    assert [kind for _, kind, _ in _stored_rows(db_path)] == [
+        "snapshot",
+        "delta",
+        "delta",
+        "snapshot",
+        "delta",
+    ]
+    # Deltas only carry the appended document, not the whole state
+    assert documents[0] not in _stored_rows(db_path)[1][2]
+
+    # A new instance restores the state from the snapshot and its deltas
+    assert SQLiteFlowPersistence(db_path).load_state("flow-1")["step"] == 4
+
+
+def test_sqlite_persistence_skips_unchanged_state(tmp_path):
+    db_path = os.path.join(tmp_path, "unchanged.db")
+    persistence = SQLiteFlowPersistence(db_path, compact=False)
+
+    persistence.save_state("flow-1", "first", {"id": "flow-1", "value": 1})
+    persistence.save_state("flow-1", "second", {"id": "flow-1", "value": 1})
+
+    assert len(_stored_rows(db_path)) == 1
+
+
+def test_sqlite_persistence_instances_sharing_a_database(tmp_path):
+    db_path = os.path.join(tmp_path, "shared.db")
+    first = SQLiteFlowPersistence(db_path, compact=False)
+    second = SQLiteFlowPersistence(db_path, compact=False)
+    items = [f"item {i} " * 20 for i in range(5)]
+
+    first.save_state("flow-1", "a", {"id": "flow-1", "items": items[:2]})
+    second.save_state("flow-1", "b", {"id": "flow-1", "items": items[:3]})
+    first.save_state("flow-1", "a", {"id": "flow-1", "items": items[:4]})
+    assert first.load_state("flow-1") == {"id": "flow-1", "items": items[:4]}
+
+    first.save_state("flow-1", "a", {"id": "flow-1", "items": items[:5]})
+    assert [kind for _, kind, _ in _stored_rows(db_path)] == [
+        "snapshot",
+        "snapshot",
+        "snapshot",
+        "delta",
+    ]
+
+    # An unchanged state is still saved when another writer came in between
+    second.save_state("flow-1", "b", {"id": "flow-1", "items": items[:3]})
+    assert second.load_state("flow-1") == {"id": "flow-1", "items": items[:3]}
+    second.save_state("flow-1", "b", {"id": "flow-1", "items": items[:3]})
+    first.save_state("flow-1", "a", {"id": "flow-1", "items": items[:5]})
+    assert second.load_state("flow-1") == {"id": "flow-1", "items": items[:5]}
+
+
+def test_method_level_persistence_instances_share_a_database(tmp_path):
+    db_path = os.path.join(tmp_path, "methods.db")
+
+    class ItemsState(FlowState):
+        items: list = []
+
+    class CyclicFlow(Flow[ItemsState]):
+        @start("loop")
+        @persist(SQLiteFlowPersistence(db_path, compact=False))
+        def collect(self):
+            self.state.items.append(f"collected {len(self.state.items)} " * 20)
+
+        @router(collect)
+        @persist(SQLiteFlowPersistence(db_path, compact=False))
+        def extend(self):
+            self.state.items.append(f"extended {len(self.state.items)} " * 20)
+            return "loop" if len(self.state.items) < 8 else "done"
+
+    flow = CyclicFlow()
+    flow.kickoff()
+
+    restored = SQLiteFlowPersistence(db_path).load_state(flow.state.id)
+    assert restored["items"] == flow.state.items
+    assert len(restored["items"]) == 8
+
+
+def test_sqlite_persistence_compacts_superseded_rows(tmp_path):
+    db_path = os.path.join(tmp_path, "compact.db")
+    persistence = SQLiteFlowPersistence(db_path, snapshot_interval=2, compact=False)
+
+    payload = "x" * 200
+
+    for step in range(4):
+        persistence.save_state(
+            "flow-1", f"step_{step}", {"id": "flow-1", "step": step, "payload": payload}
+        )
+    persistence.save_state("flow-2", "only", {"id": "flow-2", "step": 0})
+
+    assert persistence.compact_states() == 2
+    assert [row[0] for row in _stored_rows(db_path)] == ["step_2", "step_3", "only"]
+    assert persistence.load_state("flow-1") == {
+        "id": "flow-1",
+        "step": 3,
+        "payload": payload,
+    }
+
+
+def test_sqlite_persistence_reads_legacy_database(tmp_path):
+    db_path = os.path.join(tmp_path, "legacy.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE flow_states (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                flow_uuid TEXT NOT NULL,
+                method_name TEXT NOT NULL,
+                timestamp DATETIME NOT NULL,
+                state_json TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO flow_states (flow_uuid, method_name, timestamp, state_json) "
+            "VALUES ('flow-1', 'old', '2024-01-01', '{\"id\": \"flow-1\", \"v\": 1}')"
+        )
+
+    persistence = SQLiteFlowPersistence(db_path)
+
+    assert persistence.load_state("flow-1") == {"id": "flow-1", "v": 1}
+
+
+def test_sqlite_persistence_is_picklable(tmp_path):
+    db_path = os.path.join(tmp_path, "pickle.db")
+    persistence = SQLiteFlowPersistence(db_path)
+    persistence.save_state("flow-1", "step", {"id": "flow-1"})
+
+    restored = pickle.loads(pickle.dumps(persistence))
+
+    assert restored.load_state("flow-1") == {"id": "flow-1"}
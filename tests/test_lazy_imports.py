@@ -0,0 +1,84 @@
+"""Guards against heavy dependencies creeping back into `import crewai`."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = [
+    "chromadb",
+    "litellm",
+    "instructor",
+    "docling",
+    "pdfplumber",
+    "opentelemetry.exporter.otlp.proto.http.trace_exporter",
+]
+
+# Generous bound: the eager package took several seconds to import
+IMPORT_TIME_BUDGET_SECONDS = 1.0
+
+
+def run_python(code, **env):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **env},
+        check=True,
+    )
+    return result.stdout, result.stderr
+
+
+def loaded_heavy_modules(code, **env):
+    stdout, _ = run_python(
+        f"import sys\n{code}\n"
+        f"import json; print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))",
+        **env,
+    )
+    return json.loads(stdout.strip().splitlines()[-1])
+
+
+def test_import_crewai_loads_no_heavy_dependency():
+    assert loaded_heavy_modules("import crewai") == []
+
+
+def test_import_crewai_stays_within_time_budget():
+    _, importtime = run_python("import crewai")
+    # Lines look like "import time: self [us] | cumulative | name"
+    crewai_line = next(
+        line for line in importtime.splitlines() if line.split("|")[-1].strip() == "crewai"
+    )
+    cumulative_us = int(crewai_line.split("|")[1])
+    assert cumulative_us / 1e6 < IMPORT_TIME_BUDGET_SECONDS
+
+
+def test_agent_loads_storage_and_exporter_only_when_used():
+    loaded = loaded_heavy_modules(
+        "from crewai import Agent, Crew, Task, Flow", CREWAI_DISABLE_TELEMETRY="true"
+    )
+    assert "chromadb" not in loaded
+    assert "opentelemetry.exporter.otlp.proto.http.trace_exporter" not in loaded
+
+
+def test_public_names_resolve_lazily():
+    import crewai
+    from crewai.agent import Agent
+    from crewai.flow.flow import Flow
+
+    assert crewai.Agent is Agent
+    assert crewai.Flow is Flow
+    assert set(crewai.__all__) <= set(dir(crewai))
+    with pytest.raises(AttributeError):
+        crewai.NotAThing
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["crewai.llm", "crewai.task", "crewai.tools", "crewai.utilities", "crewai.flow.flow"],
+)
+def test_submodules_import_first_without_circular_imports(module):
+    # `import crewai` no longer pre-imports crewai.agent, so every entry point
+    # has to resolve its own import order
+    run_python(f"import {module}")
@@ -131,3 +131,84 @@ def test_ask_question_to_wrong_agent():
         result
         == "\nError executing tool. coworker mentioned not found, it must be one of the following options:\n- researcher\n"
     )
+
+
+def test_batch_delegation_tool_is_opt_in():
+    writer = Agent(role="writer", goal="write", backstory="You write.")
+
+    assert len(AgentTools(agents=[researcher, writer]).tools()) == 2
+    assert len(AgentTools(agents=[researcher], parallel_delegation=True).tools()) == 2
+
+    tools = AgentTools(agents=[researcher, writer], parallel_delegation=True).tools()
+    assert [tool.name for tool in tools] == [
+        "Delegate work to coworker",
+        "Ask question to coworker",
+        "Delegate work to multiple coworkers",
+    ]
+
+
+def test_batch_delegation_runs_coworkers_concurrently():
+    import threading
+    from unittest.mock import patch
+
+    writer = Agent(role="writer", goal="write", backstory="You write.")
+    batch_tool = AgentTools(
+        agents=[researcher, writer], parallel_delegation=True
+    ).tools()[2]
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def execute_task(self, task, context=None, tools=None):
+        # Both coworkers must be running at the same time to pass the barrier
+        barrier.wait()
+        return f"{self.role} did {task.description}"
+
+    with patch.object(Agent, "execute_task", execute_task):
+        result = batch_tool.run(
+            delegations=[
+                {"coworker": "researcher", "task": "research", "context": "c1"},
+                {"coworker": "writer", "task": "write", "context": "c2"},
+            ]
+        )
+
+    assert result == (
+        'Result from researcher for the task "research":\nresearcher did research'
+        "\n\n"
+        'Result from writer for the task "write":\nwriter did write'
+    )
+
+
+def test_batch_delegation_serializes_tasks_for_the_same_coworker():
+    import threading
+    import time
+    from unittest.mock import patch
+
+    writer = Agent(role="writer", goal="write", backstory="You write.")
+    batch_tool = AgentTools(
+        agents=[researcher, writer], parallel_delegation=True
+    ).tools()[2]
+
+    running = set()
+    lock = threading.Lock()
+
+    def execute_task(self, task, context=None, tools=None):
+        with lock:
+            assert self.role not in running
+            running.add(self.role)
+        time.sleep(0.05)
+        with lock:
+            running.discard(self.role)
+        return task.description
+
+    with patch.object(Agent, "execute_task", execute_task):
+        result = batch_tool.run(
+            delegations=[
+                {"coworker": "researcher", "task": "first", "context": ""},
+                {"coworker": "Researcher", "task": "second", "context": ""},
+                {"coworker": "nobody", "task": "third", "context": ""},
+            ]
+        )
+
+    assert 'for the task "first":\nfirst' in result
+    assert 'for the task "second":\nsecond' in result
+    assert "coworker mentioned not found" in result
@@ -0,0 +1,169 @@
+import dataclasses
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from crewai.utilities.events.base_events import BaseEvent, CompactEvent
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+from crewai.utilities.events.llm_events import (
+    LLMEventBase,
+    LLMStreamChunkEvent,
+    ToolCall,
+)
+from crewai.utilities.events.memory_events import MemoryQueryStartedEvent
+from crewai.utilities.events.tool_usage_events import (
+    ToolUsageEvent,
+    ToolUsageStartedEvent,
+)
+
+
+def test_compact_events_are_frozen_and_slotted():
+    event = LLMStreamChunkEvent(chunk="token")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        event.chunk = "other"
+    assert not hasattr(event, "__dict__")
+
+
+def test_timestamp_is_converted_from_the_monotonic_clock():
+    before = datetime.now(timezone.utc)
+    event = MemoryQueryStartedEvent(query="q", limit=3)
+
+    assert isinstance(event.monotonic_ns, int)
+    assert abs(event.timestamp - before) < timedelta(seconds=1)
+
+
+def test_payloads_are_referenced_not_copied():
+    args = {"query": "weather"}
+    agent = SimpleNamespace(fingerprint=None)
+
+    event = ToolUsageStartedEvent(tool_name="search", tool_args=args, agent=agent)
+
+    assert event.tool_args is args
+    assert event.agent is agent
+
+
+def test_stream_chunk_reads_task_and_agent():
+    agent = SimpleNamespace(id="agent-id", role="Researcher")
+    task = SimpleNamespace(id="task-id", name="research", agent=agent)
+
+    event = LLMStreamChunkEvent(
+        chunk="{",
+        tool_call={"function": {"arguments": "{", "name": "search"}, "index": 0},
+        from_task=task,
+    )
+
+    assert (event.task_id, event.task_name) == ("task-id", "research")
+    assert (event.agent_id, event.agent_role) == ("agent-id", "Researcher")
+    assert isinstance(event.tool_call, ToolCall)
+
+
+def test_tool_usage_started_reads_the_agent_fingerprint():
+    fingerprint = SimpleNamespace(uuid_str="fp-id", metadata={"team": "a"})
+    agent = SimpleNamespace(fingerprint=fingerprint)
+
+    event = ToolUsageStartedEvent(tool_name="search", tool_args="q", agent=agent)
+
+    assert event.source_fingerprint == "fp-id"
+    assert event.source_type == "agent"
+    assert event.fingerprint_metadata == {"team": "a"}
+
+
+def test_serialization_matches_pydantic_events():
+    event = MemoryQueryStartedEvent(
+        query="q", limit=3, score_threshold=0.35, source_type="short_term_memory"
+    )
+
+    assert dict(event) == {
+        "timestamp": event.timestamp,
+        "type": "memory_query_started",
+        "source_fingerprint": None,
+        "source_type": "short_term_memory",
+        "fingerprint_metadata": None,
+        "query": "q",
+        "limit": 3,
+        "score_threshold": 0.35,
+    }
+    assert event.to_json(exclude={"timestamp"}) == {
+        "type": "memory_query_started",
+        "source_fingerprint": None,
+        "source_type": "short_term_memory",
+        "fingerprint_metadata": None,
+        "query": "q",
+        "limit": 3,
+        "score_threshold": 0.35,
+    }
+
+
+def test_handlers_of_the_pydantic_base_classes_receive_compact_events():
+    received = []
+
+    with crewai_event_bus.scoped_handlers():
+        for event_type in (BaseEvent, LLMEventBase, ToolUsageEvent):
+            crewai_event_bus.on(event_type)(
+                lambda source, event, event_type=event_type: received.append(
+                    (event_type.__name__, event.type)
+                )
+            )
+
+        crewai_event_bus.emit(None, LLMStreamChunkEvent(chunk="token"))
+        crewai_event_bus.emit(
+            None, ToolUsageStartedEvent(tool_name="search", tool_args={})
+        )
+
+    assert received == [
+        ("BaseEvent", "llm_stream_chunk"),
+        ("LLMEventBase", "llm_stream_chunk"),
+        ("BaseEvent", "tool_usage_started"),
+        ("ToolUsageEvent", "tool_usage_started"),
+    ]
+
+
+def test_isinstance_checks_must_include_compact_events():
+    seen = []
+
+    def on_event(source, event):
+        # The check an isinstance-based consumer of BaseEvent handlers needs
+        if isinstance(event, (BaseEvent, CompactEvent)):
+            seen.append(event.to_json(exclude={"timestamp"})["type"])
+
+    with crewai_event_bus.scoped_handlers():
+        crewai_event_bus.on(BaseEvent)(on_event)
+        for event in (
+            LLMStreamChunkEvent(chunk="token"),
+            ToolUsageStartedEvent(tool_name="search", tool_args={}),
+            MemoryQueryStartedEvent(query="q", limit=3),
+        ):
+            assert not isinstance(event, BaseEvent)
+            crewai_event_bus.emit(None, event)
+
+    assert seen == ["llm_stream_chunk", "tool_usage_started", "memory_query_started"]
+
+
+def test_model_copy_and_model_dump_json_match_pydantic_events():
+    args = {"query": "weather"}
+    event = ToolUsageStartedEvent(tool_name="search", tool_args=args)
+
+    renamed = event.model_copy(update={"tool_name": "lookup"})
+    deep = event.model_copy(deep=True)
+
+    assert isinstance(renamed, ToolUsageStartedEvent)
+    assert (renamed.tool_name, renamed.tool_args) == ("lookup", args)
+    assert renamed.monotonic_ns == event.monotonic_ns
+    assert deep == event and deep.tool_args is not args
+    assert json.loads(event.model_dump_json(exclude={"timestamp"})) == {
+        "type": "tool_usage_started",
+        "source_fingerprint": None,
+        "source_type": None,
+        "fingerprint_metadata": None,
+        "agent_key": None,
+        "agent_role": None,
+        "tool_name": "search",
+        "tool_args": {"query": "weather"},
+        "tool_class": None,
+        "run_attempts": None,
+        "delegations": None,
+        "agent": None,
+    }
@@ -1,3 +1,6 @@
+import gc
+import threading
+import weakref
 from unittest.mock import Mock
 
 from crewai.utilities.events.base_events import BaseEvent
@@ -45,3 +48,56 @@ def test_event_bus_error_handling(capfd):
     out, err = capfd.readouterr()
     assert "Simulated handler failure" in out
     assert "Handler 'broken_handler' failed" in out
+
+
+def test_run_scope_handlers_only_receive_events_of_their_run():
+    global_handler = Mock()
+    run_handlers = [Mock(), Mock()]
+    barrier = threading.Barrier(2)
+
+    def run(index):
+        with crewai_event_bus.run_scope() as run_bus:
+            run_bus.register_handler(TestEvent, run_handlers[index])
+            # Both runs are subscribed before either emits
+            barrier.wait()
+            crewai_event_bus.emit(f"run_{index}", TestEvent(type="test_event"))
+            barrier.wait()
+
+    with crewai_event_bus.scoped_handlers():
+        crewai_event_bus.register_handler(TestEvent, global_handler)
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert global_handler.call_count == 2
+    for index, handler in enumerate(run_handlers):
+        handler.assert_called_once()
+        assert handler.call_args.args[0] == f"run_{index}"
+
+
+def test_nested_run_scopes_dispatch_outermost_first():
+    calls = []
+
+    with crewai_event_bus.scoped_handlers():
+        with crewai_event_bus.run_scope() as outer:
+            outer.register_handler(TestEvent, lambda s, e: calls.append("outer"))
+            with crewai_event_bus.run_scope() as inner:
+                inner.register_handler(BaseEvent, lambda s, e: calls.append("inner"))
+                assert crewai_event_bus.has_handlers(TestEvent)
+                crewai_event_bus.emit("source", TestEvent(type="test_event"))
+            crewai_event_bus.emit("source", TestEvent(type="test_event"))
+        assert not crewai_event_bus.has_handlers(TestEvent)
+
+    assert calls == ["outer", "inner", "outer"]
+
+
+def test_run_scope_bus_is_collected_after_the_run():
+    with crewai_event_bus.run_scope() as run_bus:
+        run_bus.register_handler(TestEvent, Mock())
+    run_bus_ref = weakref.ref(run_bus)
+    del run_bus
+
+    gc.collect()
+    assert run_bus_ref() is None
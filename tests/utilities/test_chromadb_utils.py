@@ -1,4 +1,5 @@
 import multiprocessing
+import os
 import tempfile
 import unittest
 
@@ -23,6 +24,13 @@ def persistent_client_worker(path, queue):
 
 
 class TestChromadbUtils(unittest.TestCase):
+    def setUp(self):
+        # create_persistent_client writes its lock file to the working directory
+        workdir = tempfile.TemporaryDirectory()
+        self.addCleanup(workdir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(workdir.name)
+
     def test_sanitize_collection_name_long_name(self):
         """Test sanitizing a very long collection name."""
         long_name = "This is an extremely long role name that will definitely exceed the ChromaDB collection name limit of 63 characters and cause an error when used as a collection name"
@@ -0,0 +1,77 @@
+from io import StringIO
+from unittest.mock import patch
+
+from rich.console import Console
+from rich.live import Live
+from rich.tree import Tree
+
+from crewai.utilities.events.utils.console_formatter import (
+    ConsoleFormatter,
+    _ThrottledLive,
+)
+
+
+def test_tree_updates_are_rendered_on_the_refresh_thread():
+    formatter = ConsoleFormatter(verbose=True, headless=False)
+    formatter.console = Console(file=StringIO(), force_terminal=True)
+    tree = Tree("crew")
+
+    with patch.object(Live, "refresh") as refresh:
+        formatter.print(tree)
+        for i in range(10):
+            tree.add(f"task {i}")
+            formatter.print(tree)
+
+        # Printing never renders on the calling thread
+        refresh.assert_not_called()
+
+        formatter._live.refresh()
+        formatter._live.refresh()
+        # The second frame had nothing new to draw
+        assert refresh.call_count == 1
+
+        formatter.print(tree)
+        formatter._live.refresh()
+        assert refresh.call_count == 2
+
+        formatter.print("done")
+        assert formatter._live is None
+
+
+def test_throttled_live_always_renders_on_stop():
+    live = _ThrottledLive(
+        Tree("crew"), console=Console(file=StringIO()), auto_refresh=False
+    )
+    live.start()
+    live.refresh()
+
+    with patch.object(Live, "refresh") as refresh:
+        live.stop()
+
+    refresh.assert_called_once()
+
+
+def test_headless_formatter_prints_panels_without_building_trees():
+    formatter = ConsoleFormatter(verbose=True, headless=True)
+    output = StringIO()
+    formatter.console = Console(file=output, width=120)
+
+    crew_tree = formatter.create_crew_tree("Research Crew", "crew-id")
+    task_branch = formatter.create_task_branch(crew_tree, "task-id")
+    formatter.update_task_status(crew_tree, "task-id", "Researcher")
+    formatter.update_crew_tree(crew_tree, "Research Crew", "crew-id", "completed")
+
+    assert crew_tree is None
+    assert task_branch is None
+    assert formatter._live is None
+    printed = output.getvalue()
+    assert "Crew Execution Started" in printed
+    assert "Task Completed" in printed
+    assert "Crew Execution Completed" in printed
+
+
+def test_headless_mode_can_be_enabled_from_the_environment(monkeypatch):
+    monkeypatch.setenv("CREWAI_HEADLESS", "true")
+
+    assert ConsoleFormatter(verbose=True).headless
+    assert not ConsoleFormatter(verbose=True, headless=False).headless
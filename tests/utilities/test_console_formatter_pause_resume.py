@@ -76,7 +76,7 @@ class TestConsoleFormatterPauseResume:
         
         tree = Tree("Test")
         
-        with patch('crewai.utilities.events.utils.console_formatter.Live') as mock_live_class:
+        with patch('crewai.utilities.events.utils.console_formatter._ThrottledLive') as mock_live_class:
             mock_live_instance = MagicMock()
             mock_live_class.return_value = mock_live_instance
             
@@ -0,0 +1,75 @@
+import json
+import time
+
+from crewai.utilities.execution_log import ExecutionLogWriter, read_execution_log
+from crewai.utilities.file_handler import FileHandler
+
+
+def test_entries_are_appended_as_json_lines(tmp_path):
+    path = tmp_path / "logs.jsonl"
+    writer = ExecutionLogWriter(str(path))
+
+    writer.write({"task": "research", "status": "started"})
+    writer.write({"task": "research", "status": "completed"})
+    writer.close()
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["status"] for line in lines] == ["started", "completed"]
+
+
+def test_entries_are_flushed_in_the_background(tmp_path):
+    path = tmp_path / "logs.jsonl"
+    writer = ExecutionLogWriter(str(path), flush_interval=0.01)
+
+    writer.write({"status": "started"})
+
+    deadline = time.monotonic() + 5
+    while not path.read_text() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert json.loads(path.read_text()) == {"status": "started"}
+    writer.close()
+
+
+def test_size_rotation_keeps_backup_count_compressed_segments(tmp_path):
+    path = tmp_path / "logs.jsonl"
+    writer = ExecutionLogWriter(
+        str(path), max_bytes=30, backup_count=2, compress=True
+    )
+
+    for i in range(10):
+        writer.write({"i": i})
+    writer.close()
+
+    assert writer.segments() == [
+        f"{path}.2.gz",
+        f"{path}.1.gz",
+        str(path),
+    ]
+    # Each segment holds three entries; the oldest segment was dropped
+    assert [entry["i"] for entry in read_execution_log(str(path))] == list(
+        range(3, 10)
+    )
+
+
+def test_age_rotation(tmp_path):
+    path = tmp_path / "logs.jsonl"
+    writer = ExecutionLogWriter(str(path), max_age=0)
+
+    writer.write({"i": 0})
+    writer.write({"i": 1})
+    writer.close()
+
+    assert writer.segments() == [f"{path}.1", str(path)]
+    assert [entry["i"] for entry in read_execution_log(str(path))] == [0, 1]
+
+
+def test_file_handler_shares_one_writer_per_jsonl_file(tmp_path):
+    path = str(tmp_path / "logs.jsonl")
+    first, second = FileHandler(path), FileHandler(path)
+
+    first.log(task="a", status="started")
+    second.log(task="b", status="started")
+    first.flush()
+
+    assert first._writer is second._writer
+    assert [entry["task"] for entry in read_execution_log(path)] == ["a", "b"]
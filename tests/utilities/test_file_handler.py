@@ -1,9 +1,10 @@
+import json
 import os
 import unittest
 
 import pytest
 
-from crewai.utilities.file_handler import PickleHandler
+from crewai.utilities.file_handler import FileHandler, PickleHandler
 
 
 class TestPickleHandler(unittest.TestCase):
@@ -43,3 +44,24 @@ class TestPickleHandler(unittest.TestCase):
 
         assert str(exc.value) == "pickle data was truncated"
         assert "<class '_pickle.UnpicklingError'>" == str(exc.type)
+
+
+def test_json_log_appends_to_the_existing_array(tmp_path):
+    path = tmp_path / "logs.json"
+    handler = FileHandler(str(path))
+
+    handler.log(task="research", status="started")
+    handler.log(task="research", status="completed", output="done")
+
+    entries = json.loads(path.read_text())
+    assert [entry["status"] for entry in entries] == ["started", "completed"]
+    assert entries[1]["output"] == "done"
+
+
+def test_json_log_starts_over_when_the_file_is_not_an_array(tmp_path):
+    path = tmp_path / "logs.json"
+    path.write_text("not json")
+
+    FileHandler(str(path)).log(status="started")
+
+    assert [entry["status"] for entry in json.loads(path.read_text())] == ["started"]
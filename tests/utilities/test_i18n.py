@@ -42,3 +42,48 @@ def test_prompt_file():
     i18n.load_prompts()
     assert isinstance(i18n.retrieve("slices", "role_playing"), str)
     assert i18n.retrieve("slices", "role_playing") == "Lorem ipsum dolor sit amet"
+
+
+def test_prompt_catalog_is_shared_and_reloaded_on_change(tmp_path):
+    import json
+    import os
+
+    path = tmp_path / "prompts.json"
+    path.write_text(json.dumps({"slices": {"role_playing": "first"}}))
+
+    first, second = I18N(prompt_file=str(path)), I18N(prompt_file=str(path))
+    assert first._prompts is second._prompts
+    assert first.slice("role_playing") == "first"
+
+    path.write_text(json.dumps({"slices": {"role_playing": "second"}}))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert I18N(prompt_file=str(path)).slice("role_playing") == "second"
+    # Existing instances keep the catalog they were built with
+    assert first.slice("role_playing") == "first"
+
+
+def test_structured_prompts_are_returned_as_copies():
+    i18n = I18N()
+    tool = i18n.tools("add_image")
+    assert isinstance(tool, dict)
+    tool["name"] = "changed"
+    assert i18n.tools("add_image")["name"] != "changed"
+
+    section = i18n.retrieve_section("tools", "add_image")
+    section["name"] = "changed"
+    assert i18n.retrieve_section("tools", "add_image")["name"] != "changed"
+    with pytest.raises(TypeError, match="use retrieve_section"):
+        i18n.retrieve("tools", "add_image")
+
+
+def test_copies_share_the_read_only_catalog():
+    import copy
+    import pickle
+
+    i18n = I18N()
+    assert copy.deepcopy(i18n)._prompts is i18n._prompts
+    assert pickle.loads(pickle.dumps(i18n._prompts)) == i18n._prompts
+    with pytest.raises(TypeError):
+        i18n._prompts["slices"]["role_playing"] = "changed"
@@ -0,0 +1,176 @@
+import threading
+import time
+from contextvars import copy_context
+from unittest.mock import patch
+
+from litellm.types.utils import ModelResponse
+
+from crewai import Agent, Crew, Task
+from crewai.utilities.profiling import (
+    PhaseStats,
+    RunProfiler,
+    current_profiler,
+    profile_phase,
+    profiled,
+)
+
+
+def llm_response(content):
+    return ModelResponse(
+        model="gpt-4o-mini",
+        choices=[{"message": {"role": "assistant", "content": content}}],
+        usage={"prompt_tokens": 20, "completion_tokens": 5, "total_tokens": 25},
+    )
+
+
+def test_phases_are_not_recorded_without_an_active_profiler():
+    profiler = RunProfiler()
+
+    with profile_phase("parsing"):
+        pass
+
+    assert current_profiler() is None
+    assert profiler.report().phases == {}
+
+
+def test_phases_are_recorded_across_threads():
+    profiler = RunProfiler()
+
+    @profiled("parsing")
+    def parse():
+        time.sleep(0.002)
+
+    token = profiler.activate()
+    try:
+        parse()
+        threads = [
+            threading.Thread(target=copy_context().run, args=(parse,))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        profiler.deactivate(token)
+    # Phases timed after the profiler was deactivated are not recorded
+    parse()
+
+    stats = profiler.report().phases["parsing"]
+    assert stats.count == 4
+    assert stats.max >= 0.002
+    assert stats.total >= 4 * 0.002
+    assert sum(stats.histogram.values()) == 4
+
+
+def test_finished_threads_do_not_keep_a_phase_stack():
+    profiler = RunProfiler()
+
+    def parse():
+        with profile_phase("parsing"):
+            with profile_phase("tokenizing"):
+                pass
+
+    token = profiler.activate()
+    try:
+        threads = [
+            threading.Thread(target=copy_context().run, args=(parse,))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        parse()
+    finally:
+        profiler.deactivate(token)
+
+    assert profiler._stacks == {}
+    assert profiler.report().phases["parsing"].count == 4
+
+
+def test_percentiles_are_read_from_the_histogram():
+    stats = PhaseStats(
+        count=10, total=0.5, max=0.3, histogram={0.001: 8, 0.002: 1, 0.5: 1}
+    )
+
+    assert stats.mean == 0.05
+    assert stats.percentile(50) == 0.001
+    assert stats.percentile(90) == 0.002
+    # Bucket bounds are capped by the longest run
+    assert stats.percentile(100) == 0.3
+
+
+def test_sampler_collapses_stacks_of_threads_inside_phases(tmp_path):
+    profiler = RunProfiler(sample_interval=0.001)
+
+    def busy_tool():
+        deadline = time.monotonic() + 0.1
+        while time.monotonic() < deadline:
+            pass
+
+    token = profiler.activate()
+    try:
+        with profile_phase("tool_execution"):
+            busy_tool()
+    finally:
+        profiler.deactivate(token)
+
+    samples = profiler.report().samples
+    assert samples
+    assert all(stack.startswith("tool_execution;") for stack in samples)
+    assert any("busy_tool" in stack.split(";")[-1] for stack in samples)
+
+    path = tmp_path / "stacks.txt"
+    profiler.report().export_collapsed_stacks(str(path))
+    assert len(path.read_text().splitlines()) == len(samples)
+
+
+def make_crew(**kwargs):
+    agent = Agent(
+        role="Researcher",
+        goal="Answer questions",
+        backstory="You answer questions.",
+        llm="gpt-4o-mini",
+    )
+    task = Task(
+        description="Say hi",
+        expected_output="A greeting",
+        agent=agent,
+    )
+    return Crew(agents=[agent], tasks=[task], **kwargs)
+
+
+def test_profiled_crew_reports_agent_loop_phases():
+    crew = make_crew(profile=True)
+
+    with patch(
+        "litellm.completion",
+        return_value=llm_response("Thought: done\nFinal Answer: hi"),
+    ):
+        crew.kickoff()
+
+    phases = crew.profile_report().phases
+    assert current_profiler() is None
+    for name in (
+        "agent_execution",
+        "prompt_formatting",
+        "llm_call",
+        "output_parsing",
+        "event_emission",
+        "output_conversion",
+    ):
+        assert phases[name].count >= 1, name
+    assert "llm_call" in crew.profile_report().summary()
+
+
+def test_unprofiled_crew_has_no_report():
+    crew = make_crew()
+
+    with patch(
+        "litellm.completion",
+        return_value=llm_response("Thought: done\nFinal Answer: hi"),
+    ):
+        crew.kickoff()
+
+    assert crew.profile_report() is None
@@ -0,0 +1,89 @@
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+from crewai.utilities.events.llm_events import LLMStreamChunkEvent
+from crewai.utilities.streaming import FinalOutputItem, TokenItem, stream_run
+
+
+def emit_chunk(chunk):
+    crewai_event_bus.emit(None, LLMStreamChunkEvent(chunk=chunk))
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+def test_stream_run_yields_tokens_then_final_output():
+    def run():
+        emit_chunk("Hel")
+        # Threads started with a copy of the run's context stream too
+        worker = threading.Thread(
+            target=contextvars.copy_context().run, args=(emit_chunk, "lo")
+        )
+        worker.start()
+        worker.join()
+        return "done"
+
+    items = asyncio.run(collect(stream_run(run)))
+
+    assert [item.chunk for item in items if isinstance(item, TokenItem)] == [
+        "Hel",
+        "lo",
+    ]
+    assert isinstance(items[-1], FinalOutputItem)
+    assert items[-1].output == "done"
+
+
+def test_stream_run_ignores_events_of_other_runs():
+    def run():
+        other = threading.Thread(target=emit_chunk, args=("elsewhere",))
+        other.start()
+        other.join()
+        emit_chunk("mine")
+
+    items = asyncio.run(collect(stream_run(run)))
+
+    assert [item.chunk for item in items if isinstance(item, TokenItem)] == ["mine"]
+
+
+def test_stream_run_raises_errors_of_the_run():
+    def run():
+        emit_chunk("partial")
+        raise ValueError("boom")
+
+    received = []
+
+    async def consume():
+        async for item in stream_run(run):
+            received.append(item)
+
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(consume())
+    assert [item.chunk for item in received] == ["partial"]
+
+
+def test_stream_run_applies_backpressure_and_releases_on_close():
+    finished = threading.Event()
+
+    def run():
+        for index in range(50):
+            emit_chunk(str(index))
+        finished.set()
+
+    async def consume_first():
+        stream = stream_run(run, max_buffered=2)
+        first = await stream.__anext__()
+        await asyncio.sleep(0.1)
+        # The run is paused until the consumer reads or stops reading
+        assert not finished.is_set()
+        await stream.aclose()
+        return first
+
+    first = asyncio.run(consume_first())
+
+    assert first.chunk == "0"
+    assert finished.wait(timeout=5)
@@ -0,0 +1,96 @@
+import threading
+from unittest.mock import patch
+
+from litellm.types.utils import ModelResponse
+from opentelemetry import baggage
+from opentelemetry.context import attach, detach
+
+from crewai.llm import LLM
+from crewai.utilities.crew.models import CrewContext
+from crewai.utilities.usage_ledger import UsageLedger
+
+
+def test_concurrent_records_are_not_lost():
+    ledger = UsageLedger("crew")
+
+    def record():
+        for _ in range(1000):
+            ledger.record_llm_call(
+                "gpt-4o", prompt_tokens=3, completion_tokens=2, task="research"
+            )
+
+    threads = [threading.Thread(target=record) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    report = ledger.report()
+    assert report.total.successful_requests == 8000
+    assert report.total.total_tokens == 40000
+    assert report.by_task["research"].prompt_tokens == 24000
+
+
+def test_report_breaks_usage_down_by_model_task_agent_and_tool():
+    ledger = UsageLedger("crew")
+    ledger.record_llm_call(
+        "gpt-4o",
+        prompt_tokens=10,
+        completion_tokens=5,
+        cached_prompt_tokens=4,
+        latency=1.5,
+        cost=0.01,
+        task="research",
+        agent="Researcher",
+    )
+    ledger.record_llm_call("gpt-4o-mini", prompt_tokens=2, task="write")
+    ledger.record_tool_call(
+        "search", latency=0.5, from_cache=True, task="research", agent="Researcher"
+    )
+
+    report = ledger.report()
+
+    assert report.total.total_tokens == 17
+    assert report.total.latency == 2.0
+    assert report.by_model["gpt-4o"].cached_prompt_tokens == 4
+    assert report.by_task["research"].tool_calls == 1
+    assert report.by_task["research"].latency == 2.0
+    assert report.by_agent["Researcher"].cost == 0.01
+    assert report.by_tool["search"].cached_tool_calls == 1
+    assert "write" not in report.by_agent
+
+
+def test_children_roll_up_into_parent():
+    ledger = UsageLedger("crew")
+    for tokens in (3, 4):
+        ledger.child("crew").record_llm_call(
+            "gpt-4o", prompt_tokens=tokens, task="research"
+        )
+
+    report = ledger.report()
+
+    assert [child.total.prompt_tokens for child in report.children] == [3, 4]
+    assert report.total.prompt_tokens == 7
+    assert report.by_task["research"].successful_requests == 2
+
+
+def test_llm_records_usage_in_the_crew_context_ledger():
+    ledger = UsageLedger("crew")
+    response = ModelResponse(
+        model="gpt-4o-mini",
+        choices=[{"message": {"role": "assistant", "content": "Hi"}}],
+        usage={"prompt_tokens": 12, "completion_tokens": 3, "total_tokens": 15},
+    )
+    token = attach(
+        baggage.set_baggage("crew_context", CrewContext(usage_ledger=ledger))
+    )
+    try:
+        with patch("litellm.completion", return_value=response):
+            assert LLM(model="gpt-4o-mini").call("Hello") == "Hi"
+    finally:
+        detach(token)
+
+    report = ledger.report()
+    assert report.by_model["gpt-4o-mini"].prompt_tokens == 12
+    assert report.by_model["gpt-4o-mini"].completion_tokens == 3
+    assert report.total.latency > 0